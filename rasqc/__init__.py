@@ -7,10 +7,28 @@ standards, particularly for FFRD (Federal Flood Risk Determination) models.
 
 # Import registry first to avoid circular imports
 from .registry import *
-from .checkers import *
-from .check import *
+from .result import RasqcResult
 
-from typing import List
+import importlib
+from typing import Any, List
+
+# Modules whose public names are exported by the package. They are imported on
+# first access, since importing the checkers is slow.
+_LAZY_MODULES = ["check", "checkers"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the `check` function and checker classes on first access."""
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    for module_name in _LAZY_MODULES:
+        module = importlib.import_module(f".{module_name}", __name__)
+        if hasattr(module, name):
+            value = getattr(module, name)
+            # e.g., the `check` function shadows the `check` module
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def check_model(ras_model: str, checksuite: str) -> List[RasqcResult]:
@@ -15,10 +15,13 @@ class RasqcChecker:
     Attributes
     ----------
         name: The name of the checker, to be overridden by subclasses.
+        cpu_bound: Whether the check is dominated by CPU-bound geometry
+            operations, in which case it may be run in a worker process.
     """
 
     name: str
     criteria: str
+    cpu_bound: bool = False
 
     def run(self, ras_model: RasModel) -> RasqcResult | List[RasqcResult]:
         """Run the checker on the HEC-RAS model.
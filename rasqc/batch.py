@@ -0,0 +1,469 @@
+"""Batch quality control of many HEC-RAS models."""
+
+from .journal import BatchJournal
+from .obstore_file import DEFAULT_REMOTE_IO, RemoteIOConfig
+from .rasmodel import DEFAULT_MAX_CONCURRENCY
+from .registry import CHECKSUITES
+from .result import RasqcResult, RasqcResultEncoder, ResultStatus
+
+import obstore
+from rich.console import Console
+from rich.table import Table
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+import glob
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import re
+import time
+import traceback
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Suffixes of manifest files listing one model per line
+MANIFEST_SUFFIXES = {".txt", ".lst", ".manifest"}
+
+# Bytes read from the start of remote '.prj' files to tell HEC-RAS projects,
+# which start with their 'Proj Title', from projection files
+PRJ_HEAD_BYTES = 4096
+
+# Columns of the flat Parquet output, one row per check result
+PARQUET_COLUMNS = [
+    "model",
+    "model_status",
+    "check",
+    "filename",
+    "element",
+    "result",
+    "message",
+]
+
+
+def _is_url(source: str) -> bool:
+    """Check whether a model source is a URL (e.g., 's3://bucket/prefix')."""
+    return re.match(r"^[a-z][a-z0-9+.-]*://", source) is not None
+
+
+def _is_ras_prj(content: str) -> bool:
+    """Check whether a '.prj' file is a HEC-RAS project rather than a projection."""
+    return re.search(r"(?m)^Proj Title\s*=", content) is not None
+
+
+def _read_text(path: str | os.PathLike) -> str:
+    """Read a local text file, returning an empty string if it cannot be read."""
+    try:
+        with open(path, "r", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+async def _discover_remote_async(url: str, max_concurrency: int) -> List[str]:
+    """List the HEC-RAS project files under a remote prefix.
+
+    Only the start of each '.prj' file is fetched, with up to
+    `max_concurrency` range requests at once.
+    """
+    store = obstore.store.from_url(url.rstrip("/"))
+    prj_files = [
+        meta
+        for batch in obstore.list(store)
+        for meta in batch
+        if meta["path"].lower().endswith(".prj") and meta["size"] > 0
+    ]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _is_ras(meta: dict) -> bool:
+        async with semaphore:
+            head = await obstore.get_range_async(
+                store, meta["path"], start=0, length=min(meta["size"], PRJ_HEAD_BYTES)
+            )
+        return _is_ras_prj(bytes(head).decode(errors="replace"))
+
+    is_ras = await asyncio.gather(*(_is_ras(meta) for meta in prj_files))
+    return sorted(
+        f"{url.rstrip('/')}/{meta['path']}"
+        for meta, ras in zip(prj_files, is_ras)
+        if ras
+    )
+
+
+def _discover_remote(
+    url: str, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> List[str]:
+    """List the HEC-RAS project files under a remote prefix."""
+    return asyncio.run(_discover_remote_async(url, max_concurrency))
+
+
+def discover_models(source: str | os.PathLike) -> List[str]:
+    """Find the HEC-RAS models to check.
+
+    Parameters
+    ----------
+        source: A directory (searched recursively), a glob pattern, a remote
+            prefix URL (e.g., 's3://bucket/models/'), a manifest file listing
+            one model path or URL per line, or a single '.prj' file. Blank
+            lines and lines starting with '#' in manifests are ignored.
+
+    Returns
+    -------
+        List[str]: Paths or URLs of the HEC-RAS '.prj' files, without duplicates.
+        Projection files sharing the '.prj' extension are excluded.
+
+    Raises
+    ------
+        FileNotFoundError: If a local source does not exist.
+    """
+    source = str(source)
+    if _is_url(source):
+        if source.lower().endswith(".prj"):
+            return [source]
+        return _discover_remote(source)
+    if glob.has_magic(source):
+        paths = sorted(glob.glob(source, recursive=True))
+    elif os.path.isdir(source):
+        paths = sorted(str(p) for p in Path(source).rglob("*") if p.is_file())
+    elif not os.path.exists(source):
+        raise FileNotFoundError(f"Model source not found: {source}")
+    elif Path(source).suffix.lower() in MANIFEST_SUFFIXES:
+        lines = [line.strip() for line in _read_text(source).splitlines()]
+        return list(dict.fromkeys(line for line in lines if line and line[0] != "#"))
+    else:
+        paths = [source]
+    return [
+        p
+        for p in paths
+        if p.lower().endswith(".prj")
+        and os.path.isfile(p)
+        and _is_ras_prj(_read_text(p))
+    ]
+
+
+@dataclass
+class ModelReport:
+    """Outcome of checking a single model in a batch.
+
+    Attributes
+    ----------
+        model: Path or URL of the model '.prj' file.
+        error: Traceback of the failure, if the model could not be checked.
+        elapsed_seconds: Wall-clock time spent on the model.
+        results: The check results, if the model was checked.
+        counts: Number of results of each status (by status value).
+    """
+
+    model: str
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+    results: List[RasqcResult] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Count the results of each status if not already counted."""
+        if not self.counts:
+            self.counts = {status.value: 0 for status in ResultStatus}
+            for result in self.results:
+                self.counts[result.result.value] += 1
+
+    @property
+    def failed(self) -> bool:
+        """Whether the model could not be checked."""
+        return self.error is not None
+
+    def to_dict(self) -> dict:
+        """Convert ModelReport object to dictionary.
+
+        Returns
+        -------
+            dict: A JSON-serializable dictionary representation of the object.
+        """
+        return {
+            "model": self.model,
+            "status": "failed" if self.failed else "checked",
+            "error": self.error,
+            "elapsed_seconds": self.elapsed_seconds,
+            "counts": self.counts,
+            "checks": [
+                json.loads(json.dumps(r.to_dict(), cls=RasqcResultEncoder))
+                for r in self.results
+            ],
+        }
+
+
+def check_model(
+    model: str,
+    checksuite: str,
+    remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+    jobs: int = 1,
+    journal: Optional[BatchJournal] = None,
+) -> ModelReport:
+    """Run a checksuite on a model, capturing any failure in the report.
+
+    Parameters
+    ----------
+        model: Path or URL of the model '.prj' file.
+        checksuite: Name of the checksuite to run.
+        remote_io: Settings for reading remote HDF files.
+        jobs: Maximum number of checks to run at once.
+        journal: Journal to record each completed check and the model in, if
+            provided. Checks already recorded for the model are not run again.
+
+    Returns
+    -------
+        ModelReport: The results of the model, or the error that prevented
+        it from being checked.
+    """
+    start = time.perf_counter()
+    try:
+        completed = journal.completed_checks(model) if journal else {}
+        results = []
+        for check_name, check_results in CHECKSUITES[checksuite].iter_check_results(
+            model, remote_io=remote_io, jobs=jobs, completed=completed
+        ):
+            check_results = [r for r in check_results if isinstance(r, RasqcResult)]
+            for result in check_results:
+                result.gdf = None  # spatial outputs are not aggregated
+            if journal and check_name not in completed:
+                journal.record_check(model, check_name, check_results)
+            results.extend(check_results)
+        report = ModelReport(model, None, time.perf_counter() - start, results)
+    except Exception:
+        report = ModelReport(model, traceback.format_exc(), time.perf_counter() - start)
+    if journal:
+        journal.record_model(model, report.error, report.elapsed_seconds, report.counts)
+    return report
+
+
+def journaled_reports(journal: BatchJournal) -> Iterator[ModelReport]:
+    """Get the reports of the models recorded as checked in a journal.
+
+    Models that failed are not included, so they are checked again when a
+    run is resumed.
+
+    Parameters
+    ----------
+        journal: The journal of a previous (possibly interrupted) run.
+
+    Yields
+    ------
+        ModelReport: The report of each checked model, rebuilt from the journal
+        without reading the model.
+    """
+    for model, record in journal.completed_models().items():
+        if record["error"] is not None:
+            continue
+        results = [r for rs in journal.completed_checks(model).values() for r in rs]
+        yield ModelReport(model, None, record["elapsed_seconds"], results)
+
+
+def run_batch(
+    models: Iterable[str],
+    checksuite: str,
+    workers: int = 1,
+    remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+    jobs: int = 1,
+    journal: Optional[BatchJournal] = None,
+) -> Iterator[ModelReport]:
+    """Check many models, yielding the report of each model as it completes.
+
+    A model that raises an error gets a failed report, and the remaining
+    models are still checked. If a worker process dies (e.g., in a native
+    library), the models it was running alongside are retried one at a time
+    in fresh workers so that only the culprit is reported as failed.
+
+    Parameters
+    ----------
+        models: Paths or URLs of the model '.prj' files.
+        checksuite: Name of the checksuite to run.
+        workers: Number of worker processes. If 0, models are checked in this
+            process.
+        remote_io: Settings for reading remote HDF files.
+        jobs: Maximum number of checks to run at once within each model.
+        journal: Journal to record each completed check and model in, if
+            provided. Checks already recorded are not run again.
+
+    Yields
+    ------
+        ModelReport: The report of each model, in completion order.
+    """
+    models = list(models)
+    if workers <= 0:
+        for model in models:
+            yield check_model(model, checksuite, remote_io, jobs, journal)
+        return
+    context = multiprocessing.get_context("spawn")
+    crashed = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {
+            pool.submit(check_model, model, checksuite, remote_io, jobs, journal): model
+            for model in models
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except BrokenProcessPool:
+                crashed.append(futures[future])
+    for model in sorted(crashed, key=models.index):
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            try:
+                yield pool.submit(
+                    check_model, model, checksuite, remote_io, jobs, journal
+                ).result()
+            except BrokenProcessPool:
+                report = ModelReport(
+                    model,
+                    "Worker process terminated abruptly while checking the model.",
+                    time.perf_counter() - start,
+                )
+                if journal:
+                    journal.record_model(
+                        model, report.error, report.elapsed_seconds, report.counts
+                    )
+                yield report
+
+
+class JsonLinesSink:
+    """Writes one JSON object per model report to a JSON-lines file."""
+
+    def __init__(self, path: str | os.PathLike):
+        """Open a JSON-lines file for writing.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path of the output file.
+        """
+        self._file = open(path, "w")
+
+    def write(self, report: ModelReport) -> None:
+        """Write a model report, flushing it to disk.
+
+        Parameters
+        ----------
+            report: The model report.
+        """
+        self._file.write(json.dumps(report.to_dict()) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the output file."""
+        self._file.close()
+
+
+class ParquetSink:
+    """Writes one row per check result (or failed model) to a Parquet file.
+
+    Each model report is written as a row group as soon as it completes.
+    Requires the optional 'pyarrow' package.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Open a Parquet file for writing.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path of the output file.
+
+        Raises
+        ------
+            ImportError: If 'pyarrow' is not installed.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet output requires the 'pyarrow' package. Install it or "
+                "write JSON-lines output ('.jsonl') instead."
+            ) from e
+        self._pa = pa
+        self._schema = pa.schema([(c, pa.string()) for c in PARQUET_COLUMNS])
+        self._writer = pq.ParquetWriter(str(path), self._schema)
+
+    def write(self, report: ModelReport) -> None:
+        """Write the rows of a model report.
+
+        Parameters
+        ----------
+            report: The model report.
+        """
+        status = "failed" if report.failed else "checked"
+        if report.failed:
+            rows = [{"result": ResultStatus.ERROR.value, "message": report.error}]
+        else:
+            rows = [
+                {
+                    "check": r.name,
+                    "filename": r.filename,
+                    "element": json.dumps(r.element)
+                    if isinstance(r.element, list)
+                    else r.element,
+                    "result": r.result.value,
+                    "message": r.message,
+                }
+                for r in report.results
+            ]
+        columns = {c: [] for c in PARQUET_COLUMNS}
+        for row in rows:
+            row.update(model=report.model, model_status=status)
+            for c in PARQUET_COLUMNS:
+                value = row.get(c)
+                columns[c].append(None if value is None else str(value))
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+
+    def close(self) -> None:
+        """Close the output file."""
+        self._writer.close()
+
+
+def open_sink(path: str | os.PathLike) -> JsonLinesSink | ParquetSink:
+    """Open an output sink for model reports based on the file extension.
+
+    Parameters
+    ----------
+        path: Path of the output file. '.parquet' files are written as
+            Parquet; anything else as JSON lines.
+
+    Returns
+    -------
+        JsonLinesSink | ParquetSink: The output sink.
+    """
+    if Path(path).suffix.lower() == ".parquet":
+        return ParquetSink(path)
+    return JsonLinesSink(path)
+
+
+def print_batch_summary(console: Console, reports: List[ModelReport]) -> None:
+    """Print a table summarizing the results of each model.
+
+    Parameters
+    ----------
+        console: The console to print to.
+        reports: The model reports.
+    """
+    table = Table(title="Batch results", title_justify="left")
+    table.add_column("Model", overflow="fold")
+    table.add_column("Status")
+    table.add_column("Errors", justify="right")
+    table.add_column("Warnings", justify="right")
+    table.add_column("OK", justify="right")
+    table.add_column("Skipped", justify="right")
+    table.add_column("Time s", justify="right")
+    for report in reports:
+        counts = report.counts
+        table.add_row(
+            report.model,
+            "[bold red]FAILED[/bold red]" if report.failed else "checked",
+            str(counts[ResultStatus.ERROR.value]),
+            str(counts[ResultStatus.WARNING.value]),
+            str(counts[ResultStatus.OK.value]),
+            str(counts[ResultStatus.SKIPPED.value]),
+            f"{report.elapsed_seconds:.1f}",
+        )
+    console.print(table)
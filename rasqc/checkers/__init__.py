@@ -1,19 +1,49 @@
-"""Checkers module for rasqc."""
+"""Checkers module for rasqc.
 
-from .naming import *
-from .projection import *
-from .hdfsync import *
-from .plan_settings import *
-from .stac_naming import *
-from .stability import *
-from .file_structure import *
-from .event_conditions import *
-from .volume_accounting import *
-from .structures import *
-from .associated_layers import *
-from .breaklines import *
-from .current_plan import *
-from .erroneous_cells import *
-from .ras_version import *
-from .refinement_regions import *
-from .short_cell_faces import *
+Checker modules are imported on first use rather than with the package, since
+several depend on slow-to-import libraries. Check suites import the modules
+registering their checks (see `registry.CHECKSUITE_MODULES`), and checker
+classes can be accessed as attributes of this package.
+"""
+
+import importlib
+from typing import Any, List
+
+CHECKER_MODULES = [
+    "naming",
+    "projection",
+    "hdfsync",
+    "plan_settings",
+    "stac_naming",
+    "stability",
+    "file_structure",
+    "event_conditions",
+    "volume_accounting",
+    "structures",
+    "associated_layers",
+    "breaklines",
+    "current_plan",
+    "erroneous_cells",
+    "ras_version",
+    "refinement_regions",
+    "short_cell_faces",
+    "mesh_quality",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import checker modules until one defines the requested name."""
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in CHECKER_MODULES:
+        return importlib.import_module(f".{name}", __name__)
+    for module_name in CHECKER_MODULES:
+        module = importlib.import_module(f".{module_name}", __name__)
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the package attributes, including the checker modules."""
+    return sorted(set(globals()) | set(CHECKER_MODULES))
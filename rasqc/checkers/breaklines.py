@@ -1,6 +1,7 @@
 """Checks related to breaklines within a HEC-RAS model."""
 
 from ..base_checker import RasqcChecker
+from ..geometry import unenforced_lines
 from ..registry import register_check
 from ..rasmodel import RasModel
 from ..result import RasqcResult, ResultStatus
@@ -18,14 +19,16 @@ class BreaklineEnforcement(RasqcChecker):
 
     Checks the breakline enforcement within the current geometry
     and returns a `GeoDataFrame` of delinquent breaklines. The
-    general process is to buffer the mesh cell faces by the
-    `ENFORCEMENT_TOLERANCE_FEET`, then get the overlayed difference
-    relative to the breakline features and return any remaining
-    polyline features with a lenth >= `MIN_FLAG_LENGTH_FEET` as
-    a `GeoDataFrame` within the `RasqcResult` object.
+    general process is to buffer the mesh cell faces near each
+    breakline by the `ENFORCEMENT_TOLERANCE_FEET`, then get the
+    difference of the breakline features and the buffered faces
+    and return any remaining polyline features with a lenth >=
+    `MIN_FLAG_LENGTH_FEET` as a `GeoDataFrame` within the
+    `RasqcResult` object.
     """
 
     name = "Breakline Enforcement"
+    cpu_bound = True
 
     def _check(self, geom_hdf: RasGeomHdf, geom_hdf_filename: str) -> RasqcResult:
         """Execute breakline enforcement check for a RAS geometry HDF file.
@@ -56,10 +59,8 @@ class BreaklineEnforcement(RasqcChecker):
                 result=ResultStatus.WARNING,
                 message="no breaklines found within the model geometry",
             )
-        flags_all = bls.overlay(
-            mesh_faces.buffer(ENFORCEMENT_TOLERANCE_FEET).to_frame(),
-            how="difference",
-            keep_geom_type=True,
+        flags_all = unenforced_lines(
+            bls, mesh_faces, ENFORCEMENT_TOLERANCE_FEET
         ).explode()
         flags_filtered = flags_all.loc[
             flags_all["geometry"].length >= MIN_FLAG_LENGTH_FEET
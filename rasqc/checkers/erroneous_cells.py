@@ -2,30 +2,80 @@
 
 from ..base_checker import RasqcChecker
 from ..registry import register_check
-from ..rasmodel import RasModel
+from ..rasmodel import GeomFile, RasModel
 from ..result import RasqcResult, ResultStatus
 
-from rashdf import RasGeomHdf
+from geopandas import GeoDataFrame
+import numpy as np
+import pandas as pd
+
 from pathlib import Path
 
+# Columns of the former result schema, a left spatial join of the mesh cell
+# polygons with the cell center points, and the values they are filled with.
+# Deprecated: kept so that consumers of the result GeoDataFrame do not break.
+LEGACY_JOIN_COLUMNS = {
+    "index_right": np.nan,
+    "mesh_name_right": None,
+    "cell_id_right": np.nan,
+}
+
 
 @register_check(["ble"], dependencies=["GeomHdfExists"])
 class ErroneousCells(RasqcChecker):
     """Checker for erroneous 2D mesh cells.
 
     Checks the current geometry within a RAS model and returns a `GeoDataFrame`
-    of erroneous 2D mesh cells (those with the center point outside the cell
-    boundary).
+    of erroneous 2D mesh cells (those with their own center point outside the
+    cell boundary). Cells are tested on the mesh arrays of the geometry (see
+    `MeshArrays`); only the erroneous cells are built as polygons.
     """
 
     name = "Erroneous Cells"
 
-    def _check(self, geom_hdf: RasGeomHdf, geom_hdf_filename: str) -> RasqcResult:
+    def _erroneous_cells(self, geom: GeomFile) -> GeoDataFrame:
+        """Get the erroneous cells of each 2D flow area of a geometry.
+
+        Parameters
+        ----------
+            geom: The HEC-RAS geometry file, with an HDF file.
+
+        Returns
+        -------
+            GeoDataFrame: The mesh name ('mesh_name_left'), cell ID
+            ('cell_id_left') and exterior of each erroneous cell, indexed by
+            position among the cells of all 2D flow areas. The deprecated
+            `LEGACY_JOIN_COLUMNS` are included, always empty.
+        """
+        crs = geom.hdf.projection()
+        frames = []
+        offset = 0
+        for mesh in geom.mesh_arrays().values():
+            erroneous = np.flatnonzero(~mesh.cell_contains_center())
+            frame = mesh.cells_to_gdf(erroneous, crs)
+            frame.index += offset
+            frames.append(frame)
+            offset += mesh.n_cells
+        if not frames:
+            return GeoDataFrame()
+        flags = pd.concat(frames).rename(
+            columns={"mesh_name": "mesh_name_left", "cell_id": "cell_id_left"}
+        )
+        for column, value in LEGACY_JOIN_COLUMNS.items():
+            flags[column] = pd.Series(
+                value,
+                index=flags.index,
+                dtype=flags["mesh_name_left"].dtype if value is None else None,
+            )
+        flags.geometry = flags.geometry.exterior
+        return flags
+
+    def _check(self, geom: GeomFile, geom_hdf_filename: str) -> RasqcResult:
         """Execute erroneous cell check for a RAS geometry HDF file.
 
         Parameters
         ----------
-            geom_hdf: The HEC-RAS geometry HDF file to check.
+            geom: The HEC-RAS geometry file to check.
 
             geom_hdf_filename: The file name of the HEC-RAS geometry HDF file to check.
 
@@ -33,18 +83,14 @@ class ErroneousCells(RasqcChecker):
         -------
             RasqcResult: The result of the check.
         """
-        if not geom_hdf:
+        if not geom.hdf:
             return RasqcResult(
                 name=self.name,
                 filename=geom_hdf_filename,
                 result=ResultStatus.WARNING,
                 message="Geometry HDF file not found.",
             )
-        cells = geom_hdf.mesh_cell_polygons()
-        pnts = geom_hdf.mesh_cell_points()
-        joined = cells.sjoin(pnts, how="left", predicate="intersects")
-        flags = joined.loc[joined["index_right"].isna()].copy()
-        flags.geometry = flags.geometry.apply(lambda g: g.exterior)
+        flags = self._erroneous_cells(geom)
         if flags.empty:
             return RasqcResult(
                 name=self.name,
@@ -72,6 +118,6 @@ class ErroneousCells(RasqcChecker):
             RasqcResult: The result of the check.
         """
         return self._check(
-            ras_model.current_geometry.hdf,
+            ras_model.current_geometry,
             Path(ras_model.current_geometry.hdf_path).name,
         )
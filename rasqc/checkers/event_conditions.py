@@ -2,9 +2,11 @@
 
 from ..base_checker import RasqcChecker
 from ..registry import register_check
-from ..rasmodel import RasModel, RasPlanHdf
+from ..rasmodel import RasModel
 from ..result import RasqcResult, ResultStatus, RasqcResultEncoder
 
+from rashdf import RasPlanHdf
+
 from json import dumps
 from typing import List
 from pathlib import Path
@@ -0,0 +1,265 @@
+"""Checks of 2D mesh cell quality metrics within a HEC-RAS model."""
+
+from ..base_checker import RasqcChecker
+from ..mesh import MeshMetrics
+from ..registry import register_check
+from ..rasmodel import GeomFile, RasModel
+from ..result import RasqcResult, ResultStatus
+
+from geopandas import GeoDataFrame
+import numpy as np
+import pandas as pd
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict
+
+# HEC-RAS 2D cells can have at most 8 faces; cells with fewer than 3 faces
+# are degenerate
+MIN_CELL_FACES = 3
+MAX_CELL_FACES = 8
+
+MAX_CELL_ASPECT_RATIO = 4
+
+MAX_ADJACENT_CELL_AREA_RATIO = 3
+
+MIN_CELL_ANGLE_DEGREES = 20
+
+# Cells must be convex; faces meeting in a straight line (180 degrees) are
+# allowed, with a margin for round-off
+MAX_CELL_ANGLE_DEGREES = 180.1
+
+
+class MeshMetricChecker(RasqcChecker, ABC):
+    """Base checker for 2D mesh cells flagged by their quality metrics.
+
+    Metrics are computed once per 2D flow area and shared through the
+    geometry's products (see `GeomFile.mesh_metrics`), so each subclass only
+    compares them against its thresholds; only the flagged cells are built as
+    polygons. Subclasses implement `_flags` and `description`.
+
+    Attributes
+    ----------
+        severity: The result status when cells are flagged. Checks of quality
+            heuristics warn; checks of limits HEC-RAS enforces are errors.
+    """
+
+    severity: ResultStatus = ResultStatus.WARNING
+
+    @property
+    @abstractmethod
+    def description(self) -> str:
+        """Description of the flagged cells, used in the result message."""
+
+    @abstractmethod
+    def _flags(self, metrics: MeshMetrics) -> np.ndarray:
+        """Get the mask of the flagged cells of a mesh.
+
+        Parameters
+        ----------
+            metrics: The metrics of the mesh.
+
+        Returns
+        -------
+            np.ndarray: Boolean mask of the flagged cells.
+        """
+
+    def _columns(self, metrics: MeshMetrics) -> Dict[str, np.ndarray]:
+        """Get the metrics of the cells reported with the flagged cells."""
+        return {}
+
+    def _flagged_cells(self, geom: GeomFile) -> GeoDataFrame:
+        """Get the flagged cells of each 2D flow area of a geometry.
+
+        Parameters
+        ----------
+            geom: The HEC-RAS geometry file, with an HDF file.
+
+        Returns
+        -------
+            GeoDataFrame: The mesh name, cell ID, reported metrics and polygon of
+            each flagged cell, indexed by position among the cells of all 2D
+            flow areas.
+        """
+        crs = geom.hdf.projection()
+        frames = []
+        offset = 0
+        meshes = geom.mesh_arrays()
+        for mesh_name, metrics in geom.mesh_metrics().items():
+            mesh = meshes[mesh_name]
+            flagged = np.flatnonzero(self._flags(metrics))
+            frame = mesh.cells_to_gdf(flagged, crs)
+            for column, values in self._columns(metrics).items():
+                frame.insert(frame.shape[1] - 1, column, values[flagged])
+            frame.index += offset
+            frames.append(frame)
+            offset += mesh.n_cells
+        return pd.concat(frames) if frames else GeoDataFrame()
+
+    def _check(self, geom: GeomFile, geom_hdf_filename: str) -> RasqcResult:
+        """Execute the mesh cell check for a RAS geometry HDF file.
+
+        Parameters
+        ----------
+            geom: The HEC-RAS geometry file to check.
+
+            geom_hdf_filename: The file name of the HEC-RAS geometry HDF file to check.
+
+        Returns
+        -------
+            RasqcResult: The result of the check.
+        """
+        if not geom.hdf:
+            return RasqcResult(
+                name=self.name,
+                filename=geom_hdf_filename,
+                result=ResultStatus.WARNING,
+                message="Geometry HDF file not found.",
+            )
+        flags = self._flagged_cells(geom)
+        if flags.empty:
+            return RasqcResult(
+                name=self.name,
+                filename=geom_hdf_filename,
+                result=ResultStatus.OK,
+                message=f"no {self.description} found",
+            )
+        return RasqcResult(
+            name=self.name,
+            filename=geom_hdf_filename,
+            result=self.severity,
+            message=f"{flags.shape[0]} {self.description} found",
+            gdf=flags,
+        )
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        """Execute the mesh cell check for a HEC-RAS model.
+
+        Parameters
+        ----------
+            ras_model: The HEC-RAS model to check.
+
+        Returns
+        -------
+            RasqcResult: The result of the check.
+        """
+        return self._check(
+            ras_model.current_geometry,
+            Path(ras_model.current_geometry.hdf_path).name,
+        )
+
+
+@register_check(["ble"], dependencies=["GeomHdfExists"])
+class CellFaceCount(MeshMetricChecker):
+    """Checker for 2D mesh cells with too many or too few faces.
+
+    HEC-RAS 2D cells can have at most `MAX_CELL_FACES` faces. Cells with more
+    faces, or degenerate cells with fewer than `MIN_CELL_FACES` faces, are
+    returned as a `GeoDataFrame` within the `RasqcResult` object.
+    """
+
+    name = "Cell Face Count"
+    severity = ResultStatus.ERROR
+
+    @property
+    def description(self) -> str:
+        """Description of the flagged cells."""
+        return (
+            f"cells with fewer than {MIN_CELL_FACES} "
+            f"or more than {MAX_CELL_FACES} faces"
+        )
+
+    def _flags(self, metrics: MeshMetrics) -> np.ndarray:
+        """Flag cells with a face count outside the allowed range."""
+        return (metrics.cell_face_count < MIN_CELL_FACES) | (
+            metrics.cell_face_count > MAX_CELL_FACES
+        )
+
+    def _columns(self, metrics: MeshMetrics) -> Dict[str, np.ndarray]:
+        """Report the face count of the cells."""
+        return {"face_count": metrics.cell_face_count}
+
+
+@register_check(["ble"], dependencies=["GeomHdfExists"])
+class HighAspectRatioCells(MeshMetricChecker):
+    """Checker for elongated 2D mesh cells.
+
+    Cells with an aspect ratio (length to width) over `MAX_CELL_ASPECT_RATIO`
+    are returned as a `GeoDataFrame` within the `RasqcResult` object.
+    """
+
+    name = "High Aspect Ratio Cells"
+
+    @property
+    def description(self) -> str:
+        """Description of the flagged cells."""
+        return f"cells with an aspect ratio over {MAX_CELL_ASPECT_RATIO}"
+
+    def _flags(self, metrics: MeshMetrics) -> np.ndarray:
+        """Flag cells with an aspect ratio over `MAX_CELL_ASPECT_RATIO`."""
+        return metrics.cell_aspect_ratio > MAX_CELL_ASPECT_RATIO
+
+    def _columns(self, metrics: MeshMetrics) -> Dict[str, np.ndarray]:
+        """Report the aspect ratio of the cells."""
+        return {"aspect_ratio": metrics.cell_aspect_ratio}
+
+
+@register_check(["ble"], dependencies=["GeomHdfExists"])
+class CellSizeTransitions(MeshMetricChecker):
+    """Checker for abrupt changes in size between adjacent 2D mesh cells.
+
+    Cells with an adjacent cell over `MAX_ADJACENT_CELL_AREA_RATIO` times
+    larger or smaller are returned as a `GeoDataFrame` within the `RasqcResult`
+    object.
+    """
+
+    name = "Cell Size Transitions"
+
+    @property
+    def description(self) -> str:
+        """Description of the flagged cells."""
+        return (
+            "cells with an adjacent cell area ratio over "
+            f"{MAX_ADJACENT_CELL_AREA_RATIO}"
+        )
+
+    def _flags(self, metrics: MeshMetrics) -> np.ndarray:
+        """Flag cells with an area ratio over `MAX_ADJACENT_CELL_AREA_RATIO`."""
+        return metrics.cell_area_ratio > MAX_ADJACENT_CELL_AREA_RATIO
+
+    def _columns(self, metrics: MeshMetrics) -> Dict[str, np.ndarray]:
+        """Report the area and adjacent cell area ratio of the cells."""
+        return {"area": metrics.cell_area, "area_ratio": metrics.cell_area_ratio}
+
+
+@register_check(["ble"], dependencies=["GeomHdfExists"])
+class SkewedCells(MeshMetricChecker):
+    """Checker for skewed or non-convex 2D mesh cells.
+
+    Cells with an angle between consecutive faces under
+    `MIN_CELL_ANGLE_DEGREES` or over `MAX_CELL_ANGLE_DEGREES` are returned as a
+    `GeoDataFrame` within the `RasqcResult` object.
+    """
+
+    name = "Skewed Cells"
+
+    @property
+    def description(self) -> str:
+        """Description of the flagged cells."""
+        return (
+            f"cells with face angles under {MIN_CELL_ANGLE_DEGREES} "
+            f"or over {MAX_CELL_ANGLE_DEGREES} degrees"
+        )
+
+    def _flags(self, metrics: MeshMetrics) -> np.ndarray:
+        """Flag cells with face angles outside the allowed range."""
+        return (metrics.cell_min_angle < MIN_CELL_ANGLE_DEGREES) | (
+            metrics.cell_max_angle > MAX_CELL_ANGLE_DEGREES
+        )
+
+    def _columns(self, metrics: MeshMetrics) -> Dict[str, np.ndarray]:
+        """Report the minimum and maximum face angles of the cells."""
+        return {
+            "min_angle": metrics.cell_min_angle,
+            "max_angle": metrics.cell_max_angle,
+        }
@@ -4,49 +4,28 @@ from ..base_checker import RasqcChecker
 from ..registry import register_check
 from ..rasmodel import RasModel, RasModelFile
 from ..result import RasqcResult, ResultStatus
-from ..constants import RAS_SCHEMA_URL, HMS_SCHEMA_URL
+from ..schemas import get_schema_property, load_ras_schema
 
 from jsonschema import validate, ValidationError
-from geopandas import GeoDataFrame
-from rashdf.utils import convert_ras_hdf_string
-from functools import lru_cache
 
 from datetime import date
-import urllib
-import json
-from typing import List
+from typing import TYPE_CHECKING, List
 
-
-def read_schema(schema_url: str) -> dict:
-    """Load external schema from given url."""
-    with urllib.request.urlopen(schema_url) as response:
-        return json.load(response)
-
-
-@lru_cache
-def load_ras_schema():
-    """Load schema for HEC-RAS."""
-    return read_schema(RAS_SCHEMA_URL)
-
-
-@lru_cache
-def load_hms_schema():
-    """Load schema for HEC-HMS."""
-    return read_schema(HMS_SCHEMA_URL)
-
-
-def get_schema_property(naming_schema: dict, property_name: str) -> dict:
-    """Get a property from the naming schema."""
-    return naming_schema["properties"][property_name]
+if TYPE_CHECKING:
+    from geopandas import GeoDataFrame
 
 
 class JsonSchemaChecker(RasqcChecker):
     """Base class for JSON schema checks."""
 
-    naming_schema = load_ras_schema()
     schema_property: str
     criteria: str
 
+    @property
+    def naming_schema(self) -> dict:
+        """Get the HEC-RAS naming schema, loaded on first use."""
+        return load_ras_schema()
+
     def _check(self, s: str, filename: str) -> RasqcResult:
         """Run the check."""
         schema = get_schema_property(self.naming_schema, self.schema_property)
@@ -76,7 +55,6 @@ class JsonSchemaChecker(RasqcChecker):
 class MultiJsonSchemaChecker(JsonSchemaChecker):
     """Base class for multiple JSON schema checks."""
 
-    naming_schema = load_ras_schema()
     schema_properties: List[str]
     criteria: str
 
@@ -394,6 +372,8 @@ class InitialConditionPointPattern(JsonSchemaChecker):
         -------
             RasqcResult: The result of the check.
         """
+        from rashdf.utils import convert_ras_hdf_string
+
         results = []
         for geom in ras_model.geometries:
             if geom.hdf:
@@ -8,8 +8,9 @@ from ..result import RasqcResult, ResultStatus
 from pyproj import CRS
 from rashdf import RasGeomHdf
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, List
 
 
 # Well-known text representation of the FFRD projection
@@ -29,8 +30,19 @@ PROJCS["USA_Contiguous_Albers_Equal_Area_Conic_USGS_version",
     PARAMETER["Latitude_Of_Origin",23.0],
     UNIT["Foot_US",0.3048006096012192]]'
 """
-# Create a CRS object from the WKT
-FFRD_CRS = CRS.from_wkt(FFRD_PROJECTION_WKT)
+
+
+@lru_cache
+def ffrd_crs() -> CRS:
+    """Get the FFRD projection, parsing its WKT on first use."""
+    return CRS.from_wkt(FFRD_PROJECTION_WKT)
+
+
+def __getattr__(name: str) -> Any:
+    """Get `FFRD_CRS`, the FFRD projection, without parsing it on import."""
+    if name == "FFRD_CRS":
+        return ffrd_crs()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @register_check(["ffrd"], dependencies=["GeomHdfExists"])
@@ -62,7 +74,7 @@ class GeomProjection(RasqcChecker):
                 result=ResultStatus.WARNING,
                 message="HEC-RAS geometry HDF file does not have a projection defined.",
             )
-        if projection != FFRD_CRS:
+        if projection != ffrd_crs():
             return RasqcResult(
                 name=self.name,
                 filename=ghdf_filename,
@@ -1,6 +1,7 @@
 """Checks related to refinement regions within a HEC-RAS model."""
 
 from ..base_checker import RasqcChecker
+from ..geometry import unenforced_lines
 from ..registry import register_check
 from ..rasmodel import RasModel
 from ..result import RasqcResult, ResultStatus
@@ -19,14 +20,15 @@ class RefRegionEnforcement(RasqcChecker):
     Checks the refinement region enforcement within the current
     geometry and returns a `GeoDataFrame` of delinquent refinement
     regions. The general process is to buffer the mesh cell faces
-    by the `ENFORCEMENT_TOLERANCE_FEET`, then get the overlayed
-    difference relative to the boundary of refinement region
-    features and return any remaining polyline features with a
+    near each region by the `ENFORCEMENT_TOLERANCE_FEET`, then get
+    the difference of the boundary of refinement region features
+    and the buffered faces and return any remaining polyline features with a
     lenth >= `MIN_FLAG_LENGTH_FEET` as a `GeoDataFrame` within
     the `RasqcResult` object.
     """
 
     name = "Refinement Region Enforcement"
+    cpu_bound = True
 
     def _check(self, geom_hdf: RasGeomHdf, geom_hdf_filename: str) -> RasqcResult:
         """Execute refinement region enforcement check for a RAS geometry HDF file.
@@ -58,10 +60,8 @@ class RefRegionEnforcement(RasqcChecker):
                 message="no refinement regions found within the model geometry",
             )
         rrs.geometry = rrs.geometry.apply(lambda g: getattr(g, "exterior", None))
-        flags_all = rrs.overlay(
-            mesh_faces.buffer(ENFORCEMENT_TOLERANCE_FEET).to_frame(),
-            how="difference",
-            keep_geom_type=True,
+        flags_all = unenforced_lines(
+            rrs, mesh_faces, ENFORCEMENT_TOLERANCE_FEET
         ).explode()
         flags_filtered = flags_all[flags_all["geometry"].length >= MIN_FLAG_LENGTH_FEET]
         if flags_filtered.empty:
@@ -2,10 +2,12 @@
 
 from ..base_checker import RasqcChecker
 from ..registry import register_check
-from ..rasmodel import RasModel
+from ..rasmodel import GeomFile, RasModel
 from ..result import RasqcResult, ResultStatus
 
-from rashdf import RasGeomHdf
+from geopandas import GeoDataFrame
+import numpy as np
+import pandas as pd
 from pathlib import Path
 
 MIN_FACE_LENGTH_FEET = 10
@@ -19,17 +21,44 @@ class ShortCellFaces(RasqcChecker):
     cell faces that can be a source of instabilities.
     Any polyline features with a lenth < `MIN_FACE_LENGTH_FEET`
     are returned as a `GeoDataFrame` within the `RasqcResult`
-    object.
+    object. Face lengths are taken from the mesh metrics shared
+    by the mesh checks (see `GeomFile.mesh_metrics`); only the
+    short faces are built as geometries.
     """
 
     name = "Short Cell Faces"
 
-    def _check(self, geom_hdf: RasGeomHdf, geom_hdf_filename: str) -> RasqcResult:
+    def _short_faces(self, geom: GeomFile) -> GeoDataFrame:
+        """Get the short faces of each 2D flow area of a geometry.
+
+        Parameters
+        ----------
+            geom: The HEC-RAS geometry file, with an HDF file.
+
+        Returns
+        -------
+            GeoDataFrame: The mesh name, face ID and geometry of each short face,
+            indexed by position among the faces of all 2D flow areas.
+        """
+        crs = geom.hdf.projection()
+        frames = []
+        offset = 0
+        meshes = geom.mesh_arrays()
+        for mesh_name, metrics in geom.mesh_metrics().items():
+            mesh = meshes[mesh_name]
+            short = np.flatnonzero(metrics.face_length < MIN_FACE_LENGTH_FEET)
+            frame = mesh.faces_to_gdf(short, crs)
+            frame.index += offset
+            frames.append(frame)
+            offset += mesh.n_faces
+        return pd.concat(frames) if frames else GeoDataFrame()
+
+    def _check(self, geom: GeomFile, geom_hdf_filename: str) -> RasqcResult:
         """Execute short 2D mesh cell faces check for a RAS geometry HDF file.
 
         Parameters
         ----------
-            geom_hdf: The HEC-RAS geometry HDF file to check.
+            geom: The HEC-RAS geometry file to check.
 
             geom_hdf_filename: The file name of the HEC-RAS geometry HDF file to check.
 
@@ -37,17 +66,14 @@ class ShortCellFaces(RasqcChecker):
         -------
             RasqcResult: The result of the check.
         """
-        if not geom_hdf:
+        if not geom.hdf:
             return RasqcResult(
                 name=self.name,
                 filename=geom_hdf_filename,
                 result=ResultStatus.WARNING,
                 message="Geometry HDF file not found.",
             )
-        mesh_faces = geom_hdf.mesh_cell_faces()
-        flags = mesh_faces.loc[
-            mesh_faces["geometry"].length < MIN_FACE_LENGTH_FEET
-        ].copy()
+        flags = self._short_faces(geom)
         if flags.empty:
             return RasqcResult(
                 name=self.name,
@@ -75,6 +101,6 @@ class ShortCellFaces(RasqcChecker):
             RasqcResult: The result of the check.
         """
         return self._check(
-            ras_model.current_geometry.hdf,
+            ras_model.current_geometry,
             Path(ras_model.current_geometry.hdf_path).name,
         )
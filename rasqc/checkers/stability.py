@@ -1,6 +1,5 @@
 """Classes for checking stability of model runs."""
 
-import hydrostab.ras
 from ..base_checker import RasqcChecker
 from ..registry import register_check
 from ..rasmodel import RasModel
@@ -42,6 +41,8 @@ class ReflineStability(RasqcChecker):
         -------
             List[RasqcResult]: Results of the stability check.
         """
+        import hydrostab.ras
+
         ds_refline_stability = hydrostab.ras.reflines_stability(
             phdf, unstable_threshold=UNSTABLE_THRESHOLD
         )
@@ -123,6 +124,8 @@ class RefpointStability(RasqcChecker):
         -------
             List[RasqcResult]: Results of the stability check.
         """
+        import hydrostab.ras
+
         ds_refpoint_stability = hydrostab.ras.refpoints_stability(
             phdf, unstable_threshold=UNSTABLE_THRESHOLD
         )
@@ -199,7 +202,10 @@ class MeshCellsStability(RasqcChecker):
     name = "Mesh Cells Stability Analysis"
 
     def _check_mesh_area(self, phdf: RasPlanHdf, mesh_name: str) -> List[RasqcResult]:
+        import hydrostab.ras
+
         results = []
+
         ds = hydrostab.ras.mesh_cells_stability(
             phdf, mesh_name=mesh_name, unstable_threshold=UNSTABLE_THRESHOLD
         )
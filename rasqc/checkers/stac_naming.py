@@ -3,7 +3,7 @@
 from ..base_checker import RasqcChecker
 from ..registry import register_check
 from ..result import RasqcResult, ResultStatus
-from .naming import load_hms_schema, load_ras_schema, get_schema_property
+from ..schemas import get_schema_property, load_hms_schema, load_ras_schema
 
 from jsonschema import validate, ValidationError
 
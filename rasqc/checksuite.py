@@ -1,17 +1,34 @@
 """Module for defining and managing check suites for HEC-RAS model quality control."""
 
 from .base_checker import RasqcChecker
-from .rasmodel import RasModel
+from .obstore_file import DEFAULT_REMOTE_IO, RemoteIOConfig
+from .rasmodel import ModelDescriptor, RasModel
 from .result import RasqcResult, ResultStatus
+from .result_cache import ResultCache
+from .timings import CheckTimer, CheckTiming
+from .tracing import get_tracer, span, start_tracing
 
-import networkx as nx
 from rich.console import Console
 from rich.markup import escape
 
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import ExitStack, contextmanager
+import importlib
 import json
+import multiprocessing
 import os
 import re
-from typing import Dict, List, Any
+import threading
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+# Guards the lazy import of checker modules by CheckSuite
+_LOAD_LOCK = threading.RLock()
 
 
 def _bold_single_quotes(text: str) -> str:
@@ -34,21 +51,160 @@ def _bold_single_quotes(text: str) -> str:
     return formatted_text
 
 
+@contextmanager
+def _open_model(
+    ras_model: str | os.PathLike | RasModel,
+    remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+) -> Iterator[RasModel]:
+    """Yield a RasModel, closing its HDF files afterward if it was opened here.
+
+    Parameters
+    ----------
+        ras_model: The HEC-RAS model, either as a path or RasModel instance.
+        remote_io: Settings for reading remote HDF files, if opened here.
+
+    Yields
+    ------
+        RasModel: The HEC-RAS model.
+    """
+    if isinstance(ras_model, RasModel):
+        yield ras_model
+        return
+    # local models are opened with the plain constructor (see `RasModel.open`)
+    with RasModel.open(ras_model, remote_io=remote_io) as model:
+        yield model
+
+
+def _as_list(result: RasqcResult | List[RasqcResult]) -> List[RasqcResult]:
+    """Return the result(s) of a check as a list."""
+    return result if isinstance(result, list) else [result]
+
+
+def _failed(results: List[RasqcResult]) -> bool:
+    """Check whether a prerequisite check failed for every file it checked."""
+    return bool(results) and all(
+        isinstance(r, RasqcResult)
+        and r.result in (ResultStatus.ERROR, ResultStatus.SKIPPED)
+        for r in results
+    )
+
+
+# Model opened once by each check worker process
+_worker_model: RasModel | None = None
+
+
+def _init_worker(descriptor: ModelDescriptor, trace: bool = False) -> None:
+    """Open the model to check in a worker process, tracing the worker if enabled."""
+    global _worker_model
+    if trace:
+        start_tracing()
+    _worker_model = descriptor.open()
+
+
+def _run_check(
+    check: RasqcChecker,
+    ras_model: RasModel,
+    timer: Optional[CheckTimer] = None,
+    result_cache: Optional[ResultCache] = None,
+) -> List[RasqcResult]:
+    """Run a check, returning its results as a list."""
+    check_name = type(check).__name__
+
+    def _run() -> List[RasqcResult]:
+        if result_cache is None:
+            return _as_list(check.run(ras_model))
+        return result_cache.run(
+            check, ras_model, lambda: _as_list(check.run(ras_model))
+        )
+
+    with span(check_name, "check", title=getattr(check, "name", check_name)):
+        if timer is None:
+            return _run()
+        with timer.measure(check_name, ras_model):
+            return _run()
+
+
+def _run_in_worker(
+    check: RasqcChecker,
+    timed: bool = False,
+    result_cache: Optional[ResultCache] = None,
+) -> Tuple[List[RasqcResult], Optional[CheckTiming], List[Dict[str, Any]], bool]:
+    """Run a check on the worker process model.
+
+    Returns the results, the timing of the check if timed, the trace events
+    recorded in the worker since the previous check if tracing is enabled, and
+    whether the results were reused from the result cache.
+    """
+    check_name = type(check).__name__
+    timer = CheckTimer() if timed else None
+    results = _run_check(check, _worker_model, timer, result_cache)
+    timing = timer.timings[check_name] if timer else None
+    tracer = get_tracer()
+    reused = result_cache is not None and check_name in result_cache.reused
+    return results, timing, tracer.drain() if tracer else [], reused
+
+
 class CheckSuite:
     """A suite of quality control checks to run on a HEC-RAS model.
 
+    Checker modules listed in `modules` register their checks when imported.
+    They are imported when the suite's checks are first needed rather than when
+    the suite is created, so that listing or running one suite does not import
+    the (often slow to import) dependencies of every other suite's checkers.
+
     Attributes
     ----------
         checks: List of RasqcChecker instances to run.
+        modules: Names of the `rasqc.checkers` modules registering the checks.
     """
 
-    checks: Dict[str, RasqcChecker]
-    dependencies: Dict[str, set]
+    def __init__(self, modules: Iterable[str] = ()):
+        """Initialize an empty check suite.
 
-    def __init__(self):
-        """Initialize an empty check suite."""
-        self.checks = {}
-        self.dependencies = {}
+        Parameters
+        ----------
+            modules: Names of the `rasqc.checkers` modules registering the
+                suite's checks, imported when the checks are first needed.
+        """
+        self._checks: Dict[str, RasqcChecker] = {}
+        self._dependencies: Dict[str, set] = {}
+        self.modules = list(modules)
+        self._loaded = not self.modules
+
+    def _load_modules(self) -> None:
+        """Import the checker modules registering the suite's checks.
+
+        Checks are ordered by module as listed in `modules`, regardless of which
+        modules were already imported (e.g., by another suite).
+        """
+        if self._loaded:
+            return
+        with _LOAD_LOCK:
+            if self._loaded:
+                return
+            names = [f"{__package__}.checkers.{m}" for m in self.modules]
+            for name in names:
+                importlib.import_module(name)
+            position = {name: i for i, name in enumerate(names)}
+            self._checks = dict(
+                sorted(
+                    self._checks.items(),
+                    key=lambda item: position.get(type(item[1]).__module__, len(names)),
+                )
+            )
+            self._loaded = True
+
+    @property
+    def checks(self) -> Dict[str, RasqcChecker]:
+        """Get the checks of the suite, keyed by class name."""
+        self._load_modules()
+        return self._checks
+
+    @property
+    def dependencies(self) -> Dict[str, set]:
+        """Get the class names of the prerequisite checks of each check."""
+        self._load_modules()
+        return self._dependencies
 
     def add_check(self, check: RasqcChecker, dependencies: List[str] = []):
         """Add a checker to the suite.
@@ -58,19 +214,198 @@ class CheckSuite:
             check: The RasqcChecker instance to add.
         """
         check_name = check.__class__.__name__
-        self.checks[check_name] = check
-        if check_name not in self.dependencies:
-            self.dependencies[check_name] = set()
-        self.dependencies[check_name].update(dependencies)
+        self._checks[check_name] = check
+        if check_name not in self._dependencies:
+            self._dependencies[check_name] = set()
+        self._dependencies[check_name].update(dependencies)
+
+    def get_execution_order(
+        self,
+        only: Optional[Iterable[str]] = None,
+        skip: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """Return checks in dependency order using topological sorting.
+
+        Parameters
+        ----------
+            only: Names of the checks to run. If None, all checks are run.
+            skip: Names of checks not to run.
+
+        Returns
+        -------
+            List[str]: The check names in execution order, limited to the selected
+            checks and their transitive prerequisites.
+
+        Raises
+        ------
+            ValueError: If a selected or skipped check is not in the suite.
+        """
+        import networkx as nx
 
-    def get_execution_order(self) -> List[str]:
-        """Return checks in dependency order using topological sorting."""
         graph = nx.DiGraph()
         for check, deps in self.dependencies.items():
             graph.add_node(check)
             for dep in deps:
                 graph.add_edge(dep, check)
-        return list(nx.topological_sort(graph))
+        if only is None and skip is None:
+            return list(nx.topological_sort(graph))
+        only = set(self.checks if only is None else only)
+        skip = set(skip or ())
+        unknown = (only | skip) - set(self.checks)
+        if unknown:
+            raise ValueError(f"Checks not found in suite: {', '.join(sorted(unknown))}")
+        selected = only - skip
+        for check in list(selected):
+            selected |= nx.ancestors(graph, check)
+        return list(nx.topological_sort(graph.subgraph(selected)))
+
+    def _skipped_result(
+        self, check_name: str, failed_deps: List[str], ras_model: RasModel
+    ) -> RasqcResult:
+        """Build the result of a check skipped because prerequisites failed."""
+        dep_names = ", ".join(
+            f"'{getattr(self.checks.get(d), 'name', d)}'" for d in failed_deps
+        )
+        return RasqcResult(
+            name=getattr(self.checks[check_name], "name", check_name),
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.SKIPPED,
+            message=f"Skipped because prerequisite check(s) failed: {dep_names}",
+        )
+
+    def _run_dag(
+        self,
+        ras_model: RasModel,
+        ordered_checks: List[str],
+        jobs: int = 1,
+        processes: int = 0,
+        timer: Optional[CheckTimer] = None,
+        result_cache: Optional[ResultCache] = None,
+        completed: Optional[Dict[str, List[RasqcResult]]] = None,
+    ) -> Iterator[Tuple[str, List[RasqcResult]]]:
+        """Run the checks, yielding the results of each check as it completes.
+
+        A check whose prerequisites failed (see `_failed`) is not run; a single
+        SKIPPED result is yielded for it instead, and its own dependents are
+        skipped in turn.
+
+        With more than one job, checks whose dependencies have completed run
+        concurrently in a thread pool. With worker processes, CPU-bound checks
+        run in a process pool instead, where each worker reopens the model from
+        its descriptor. Checks that complete together are yielded in execution
+        order.
+
+        Parameters
+        ----------
+            ras_model: The HEC-RAS model to check.
+            ordered_checks: Names of the checks to run, in execution order.
+            jobs: Maximum number of checks to run at once in threads.
+            processes: Number of worker processes for CPU-bound checks.
+            timer: Records the resources used by each check, if provided. Runs
+                are serial when the timer profiles checks or traces memory
+                (see `CheckTimer.serial`).
+            result_cache: Cache of results to reuse for checks whose input
+                files are unchanged, if provided.
+            completed: Results of checks that already ran, keyed by check name.
+                These are yielded as-is rather than running the checks again.
+
+        Yields
+        ------
+            Tuple[str, List[RasqcResult]]: The check name and its results.
+        """
+        failed = set()
+        completed = completed or {}
+
+        def _failed_deps(check_name: str) -> List[str]:
+            return sorted(self.dependencies.get(check_name, set()) & failed)
+
+        def _completed(check_name: str, results: List[RasqcResult]) -> None:
+            if _failed(results):
+                failed.add(check_name)
+
+        if timer is not None and timer.serial:
+            jobs, processes = 1, 0
+        if jobs <= 1 and processes <= 0:
+            for check_name in ordered_checks:
+                failed_deps = _failed_deps(check_name)
+                if check_name in completed:
+                    results = completed[check_name]
+                elif failed_deps:
+                    results = [self._skipped_result(check_name, failed_deps, ras_model)]
+                else:
+                    results = _run_check(
+                        self.checks[check_name], ras_model, timer, result_cache
+                    )
+                _completed(check_name, results)
+                yield check_name, results
+            return
+        position = {check_name: i for i, check_name in enumerate(ordered_checks)}
+        waiting = {
+            check_name: set(self.dependencies.get(check_name, ())) & set(position)
+            for check_name in ordered_checks
+        }
+        running: Dict[Future, str] = {}
+        in_process = set()
+        with ExitStack() as stack:
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=max(jobs, 1)))
+            process_pool = None
+            if processes > 0 and any(
+                getattr(self.checks.get(c), "cpu_bound", False) for c in ordered_checks
+            ):
+                process_pool = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker,
+                        initargs=(ras_model.descriptor(), get_tracer() is not None),
+                    )
+                )
+            while waiting or running:
+                finished = []
+                for check_name in [
+                    c for c in ordered_checks if waiting.get(c) == set()
+                ]:
+                    del waiting[check_name]
+                    failed_deps = _failed_deps(check_name)
+                    check = self.checks[check_name]
+                    if check_name in completed:
+                        finished.append((check_name, completed[check_name]))
+                        continue
+                    if failed_deps:
+                        skipped = self._skipped_result(
+                            check_name, failed_deps, ras_model
+                        )
+                        finished.append((check_name, [skipped]))
+                        continue
+                    if process_pool is not None and check.cpu_bound:
+                        future = process_pool.submit(
+                            _run_in_worker, check, timer is not None, result_cache
+                        )
+                        in_process.add(future)
+                    else:
+                        future = pool.submit(
+                            _run_check, check, ras_model, timer, result_cache
+                        )
+                    running[future] = check_name
+                if not finished:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in sorted(done, key=lambda f: position[running[f]]):
+                        check_name = running.pop(future)
+                        results = future.result()
+                        if future in in_process:
+                            results, timing, events, reused = results
+                            if reused:
+                                result_cache.reused.add(check_name)
+                            if timer is not None:
+                                timer.timings[check_name] = timing
+                            if events and get_tracer() is not None:
+                                get_tracer().add_events(events)
+                        finished.append((check_name, results))
+                for check_name, results in finished:
+                    _completed(check_name, results)
+                    for deps in waiting.values():
+                        deps.discard(check_name)
+                    yield check_name, results
 
     @staticmethod
     def _print_result(console: Console, check: RasqcChecker, result: RasqcResult):
@@ -94,6 +429,9 @@ class CheckSuite:
         elif result.result == ResultStatus.WARNING:
             console.print("WARNING", style="bold yellow")
             console.print(f"    {message}", style="gray50")
+        elif result.result == ResultStatus.SKIPPED:
+            console.print("SKIPPED", style="bold bright_black")
+            console.print(f"    {message}", style="gray50")
         else:
             console.print("OK", style="bold green")
         if not result.result == ResultStatus.OK and result.pattern:
@@ -135,101 +473,245 @@ class CheckSuite:
                     style="gray50",
                 )
 
+    def iter_check_results(
+        self,
+        ras_model: str | os.PathLike | RasModel,
+        remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+        jobs: int = 1,
+        processes: int = 0,
+        only: Optional[Iterable[str]] = None,
+        skip: Optional[Iterable[str]] = None,
+        timer: Optional[CheckTimer] = None,
+        result_cache: Optional[ResultCache] = None,
+        completed: Optional[Dict[str, List[RasqcResult]]] = None,
+    ) -> Iterator[Tuple[str, List[RasqcResult]]]:
+        """Run all checks in the suite, yielding each check's results as it completes.
+
+        Like `iter_checks`, but the results are grouped by check, e.g. to record
+        the completion of each check.
+
+        Parameters
+        ----------
+            ras_model: The HEC-RAS model to check, either as a path or RasModel instance.
+            remote_io: Settings for reading remote HDF files, if `ras_model` is a path.
+            jobs: Maximum number of checks to run at once.
+            processes: Number of worker processes for CPU-bound checks.
+            only: Names of the checks to run, along with their prerequisites.
+            skip: Names of checks not to run, unless required by another check.
+            timer: Records the resources used by each check, if provided.
+            result_cache: Cache of results to reuse for checks whose input
+                files are unchanged, if provided.
+            completed: Results of checks that already ran (e.g., before an
+                interrupted batch run), keyed by check name. These checks are
+                not run again and their results are yielded as-is.
+
+        Yields
+        ------
+            Tuple[str, List[RasqcResult]]: The check (class) name and its results.
+        """
+        ordered_checks = self.get_execution_order(only, skip)
+        with _open_model(ras_model, remote_io) as ras_model:
+            yield from self._run_dag(
+                ras_model,
+                ordered_checks,
+                jobs,
+                processes,
+                timer,
+                result_cache,
+                completed,
+            )
+
+    def iter_checks(
+        self,
+        ras_model: str | os.PathLike | RasModel,
+        remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+        jobs: int = 1,
+        processes: int = 0,
+        only: Optional[Iterable[str]] = None,
+        skip: Optional[Iterable[str]] = None,
+        timer: Optional[CheckTimer] = None,
+        result_cache: Optional[ResultCache] = None,
+    ) -> Iterator[RasqcResult]:
+        """Run all checks in the suite, yielding results as each check completes.
+
+        Unlike `run_checks`, results are not collected, so memory use is bounded
+        by the largest single result. With more than one job, results are yielded
+        in completion order rather than suite order. The model (if opened here)
+        is closed when the generator is exhausted or closed.
+
+        Parameters
+        ----------
+            ras_model: The HEC-RAS model to check, either as a path or RasModel instance.
+            remote_io: Settings for reading remote HDF files, if `ras_model` is a path.
+            jobs: Maximum number of checks to run at once.
+            processes: Number of worker processes for CPU-bound checks.
+            only: Names of the checks to run, along with their prerequisites.
+            skip: Names of checks not to run, unless required by another check.
+            timer: Records the resources used by each check, if provided.
+            result_cache: Cache of results to reuse for checks whose input
+                files are unchanged, if provided.
+
+        Yields
+        ------
+            RasqcResult: The result(s) of each check.
+        """
+        for _, check_results in self.iter_check_results(
+            ras_model, remote_io, jobs, processes, only, skip, timer, result_cache
+        ):
+            yield from check_results
+
     def run_checks_console(
-        self, ras_model: str | os.PathLike | RasModel
+        self,
+        ras_model: str | os.PathLike | RasModel,
+        remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+        jobs: int = 1,
+        processes: int = 0,
+        only: Optional[Iterable[str]] = None,
+        skip: Optional[Iterable[str]] = None,
+        timer: Optional[CheckTimer] = None,
+        result_cache: Optional[ResultCache] = None,
     ) -> List[RasqcResult]:
         """Run all checks in the suite and print results to the console.
 
+        Results are printed as soon as each check completes. The returned
+        results are in suite execution order regardless of `jobs`.
+
         Parameters
         ----------
             ras_model: The HEC-RAS model to check, either as a path or RasModel instance.
+            remote_io: Settings for reading remote HDF files, if `ras_model` is a path.
+            jobs: Maximum number of checks to run at once.
+            processes: Number of worker processes for CPU-bound checks.
+            only: Names of the checks to run, along with their prerequisites.
+            skip: Names of checks not to run, unless required by another check.
+            timer: Records the resources used by each check, if provided. A
+                summary table of the timings is printed after the results.
+            result_cache: Cache of results to reuse for checks whose input
+                files are unchanged, if provided. The reused checks are listed
+                after the results.
 
         Returns
         -------
             List[RasqcResult]: The results of all checks.
         """
-        results = []
+        results = {}
         console = Console()
-        ordered_checks = self.get_execution_order()
-        ras_model = RasModel(ras_model)
-        for check_name in ordered_checks:
-            check = self.checks[check_name]
-            result = check.run(ras_model)
-            if type(result) is RasqcResult:
-                self._print_result(console, check, result)
-                results.append(result)
-            elif type(result) is list:
-                for r in result:
-                    self._print_result(console, check, r)
-                    results.append(r)
-        return results
-
-    def run_checks(self, ras_model: str | os.PathLike | RasModel) -> List[RasqcResult]:
+        ordered_checks = self.get_execution_order(only, skip)
+        with _open_model(ras_model, remote_io) as ras_model:
+            for check_name, check_results in self._run_dag(
+                ras_model, ordered_checks, jobs, processes, timer, result_cache
+            ):
+                check_results = [r for r in check_results if isinstance(r, RasqcResult)]
+                for r in check_results:
+                    self._print_result(console, self.checks[check_name], r)
+                results[check_name] = check_results
+        if timer is not None:
+            timer.print_summary(console)
+        if result_cache is not None and result_cache.reused:
+            console.print(
+                f"Reused cached results of {len(result_cache.reused)} check(s): "
+                + ", ".join(c for c in ordered_checks if c in result_cache.reused),
+                style="gray50",
+            )
+        return [r for c in ordered_checks for r in results[c]]
+
+    def run_checks(
+        self,
+        ras_model: str | os.PathLike | RasModel,
+        remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+        jobs: int = 1,
+        processes: int = 0,
+        only: Optional[Iterable[str]] = None,
+        skip: Optional[Iterable[str]] = None,
+        timer: Optional[CheckTimer] = None,
+        result_cache: Optional[ResultCache] = None,
+    ) -> List[RasqcResult]:
         """Run all checks in the suite.
 
+        Checks whose prerequisites failed are not run and get a single SKIPPED
+        result instead.
+
         Parameters
         ----------
             ras_model: The HEC-RAS model to check, either as a path or RasModel instance.
+            remote_io: Settings for reading remote HDF files, if `ras_model` is a path.
+            jobs: Maximum number of checks to run at once. Independent checks
+                run concurrently in a thread pool while respecting dependencies.
+            processes: Number of worker processes for CPU-bound checks (those
+                with `cpu_bound` set). If 0, all checks run in this process.
+            only: Names (class names) of the checks to run. Their transitive
+                prerequisites are also run. If None, all checks are run.
+            skip: Names (class names) of checks not to run. Checks required by
+                another selected check are still run.
+            timer: Records the wall time, CPU time, peak memory and remote I/O
+                of each check, if provided.
+            result_cache: Cache of results to reuse for checks whose input
+                files (as recorded when the results were cached) are unchanged,
+                if provided. Reused checks are added to `result_cache.reused`.
 
         Returns
         -------
-            List[RasqcResult]: The results of all checks.
+            List[RasqcResult]: The results of all checks, in suite execution order.
         """
-        results = []
-        ordered_checks = self.get_execution_order()
-        ras_model = RasModel(ras_model)
-        for check_name in ordered_checks:
-            check = self.checks[check_name]
-            result = check.run(ras_model)
-            if type(result) is list:
-                results.extend(result)
-            else:
-                results.append(result)
-        return results
+        ordered_checks = self.get_execution_order(only, skip)
+        with _open_model(ras_model, remote_io) as ras_model:
+            results = dict(
+                self._run_dag(
+                    ras_model, ordered_checks, jobs, processes, timer, result_cache
+                )
+            )
+        return [r for c in ordered_checks for r in results[c]]
 
 
 class StacCheckSuite(CheckSuite):
     """CheckSuite for running checks against STAC item asset properties."""
 
-    def run_checks(self, stac_item: Dict[str, Dict[str, Any]]) -> List[RasqcResult]:
-        """Run all checks directly on STAC assets."""
-        results = []
-        ordered_checks = self.get_execution_order()
-        for check_name in ordered_checks:
-            check = self.checks[check_name]
-            result = check.run(stac_item)
-            if isinstance(result, list):
-                results.extend(result)
-            else:
-                results.append(result)
-        return results
+    def iter_checks(
+        self, stac_item: str | os.PathLike | Dict[str, Dict[str, Any]], **kwargs
+    ) -> Iterator[RasqcResult]:
+        """Run all checks directly on STAC assets, yielding results as they complete.
+
+        Parameters
+        ----------
+            stac_item: The STAC item, or the path to its JSON file.
+            kwargs: Keyword arguments accepted by `CheckSuite.iter_checks`; ignored.
+
+        Yields
+        ------
+            RasqcResult: The result(s) of each check.
+        """
+        if not isinstance(stac_item, dict):
+            with open(stac_item) as f:
+                stac_item = json.load(f)
+        for check_name in self.get_execution_order():
+            yield from _as_list(self.checks[check_name].run(stac_item))
+
+    def run_checks(
+        self, stac_item: Dict[str, Dict[str, Any]], **kwargs
+    ) -> List[RasqcResult]:
+        """Run all checks directly on STAC assets.
+
+        Keyword arguments accepted by `CheckSuite.run_checks` are ignored.
+        """
+        return list(self.iter_checks(stac_item))
 
-    def run_checks_console(self, item_path: str | os.PathLike) -> List[RasqcResult]:
+    def run_checks_console(
+        self, item_path: str | os.PathLike, **kwargs
+    ) -> List[RasqcResult]:
         """Run all checks in the suite and print results to the console.
 
         Parameters
         ----------
             item_path: Path to the HEC stac item to check.
+            kwargs: Keyword arguments accepted by `CheckSuite.run_checks_console`; ignored.
 
         Returns
         -------
             List[RasqcResult]: The results of all checks.
         """
-        if item_path.endswith(".json"):
-            with open(item_path) as f:
-                stac_item = json.load(f)
-
         results = []
         console = Console()
-        ordered_checks = self.get_execution_order()
-        for check_name in ordered_checks:
-            check = self.checks[check_name]
-            result = check.run(stac_item)
-            if isinstance(result, list):
-                for r in result:
-                    self._print_result(console, check, r)
-                    results.append(r)
-            else:
-                self._print_result(console, check, result)
-                results.append(result)
+        for result in self.iter_checks(item_path):
+            self._print_result(console, None, result)
+            results.append(result)
         return results
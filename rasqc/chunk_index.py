@@ -0,0 +1,300 @@
+"""Virtual chunk-reference index for remote HDF files.
+
+A chunk index maps each dataset in an HDF file to the byte ranges of its
+stored chunks along with the dtype, shape, and filter pipeline needed to
+decode them (similar to a kerchunk reference file). Once built, datasets can
+be read from object storage with parallel range requests, without traversing
+the HDF metadata.
+"""
+
+from .obstore_file import ObstoreFile
+
+import h5py
+import numpy as np
+from numpy.lib.format import descr_to_dtype, dtype_to_descr
+
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Any, Dict, List, Optional
+import warnings
+import zlib
+
+# HDF5 filter identifiers that can be decoded
+FILTER_DEFLATE = h5py.h5z.FILTER_DEFLATE
+FILTER_SHUFFLE = h5py.h5z.FILTER_SHUFFLE
+FILTER_FLETCHER32 = h5py.h5z.FILTER_FLETCHER32
+SUPPORTED_FILTERS = {FILTER_DEFLATE, FILTER_SHUFFLE, FILTER_FLETCHER32}
+
+CHUNK_INDEX_VERSION = 1
+
+
+class ChunkIndexError(Exception):
+    """Raised when a dataset cannot be read from a chunk index."""
+
+
+def _is_spacepad(tid: h5py.h5t.TypeID) -> bool:
+    """Check whether an HDF5 type is a space-padded fixed-length string."""
+    return (
+        isinstance(tid, h5py.h5t.TypeStringID)
+        and tid.get_strpad() == h5py.h5t.STR_SPACEPAD
+    )
+
+
+def _spacepad_fields(tid: h5py.h5t.TypeID) -> Optional[List[str]]:
+    """Get the space-padded string fields of a dataset type.
+
+    HDF5 trims the trailing spaces of space-padded strings when reading them,
+    so the same must be done to the raw chunk data. The top-level type is
+    represented by an empty field name.
+
+    Returns
+    -------
+        List[str]: The space-padded fields, or None if they cannot be handled
+        (i.e., within nested compound types).
+    """
+    if _is_spacepad(tid):
+        return [""]
+    if not isinstance(tid, h5py.h5t.TypeCompoundID):
+        return []
+    fields = []
+    for i in range(tid.get_nmembers()):
+        member = tid.get_member_type(i)
+        if isinstance(member, h5py.h5t.TypeCompoundID):
+            if _spacepad_fields(member):
+                return None
+        elif _is_spacepad(member):
+            fields.append(tid.get_member_name(i).decode())
+    return fields
+
+
+def _dataset_ref(ds: h5py.Dataset) -> Optional[Dict[str, Any]]:
+    """Build the chunk reference of a dataset, or None if it cannot be indexed."""
+    if ds.dtype.kind == "O" or ds.shape is None:
+        return None
+    spacepad = _spacepad_fields(ds.id.get_type())
+    if spacepad is None:
+        return None
+    dcpl = ds.id.get_create_plist()
+    filters = [dcpl.get_filter(i)[0] for i in range(dcpl.get_nfilters())]
+    if not set(filters) <= SUPPORTED_FILTERS:
+        return None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # h5py string dtype metadata is not needed
+        dtype = dtype_to_descr(ds.dtype)
+    ref = {
+        "shape": list(ds.shape),
+        "dtype": dtype,
+        "filters": filters,
+        "spacepad": spacepad,
+        "fillvalue": ds.fillvalue.tolist() if ds.dtype.kind in "biuf" else None,
+    }
+    layout = dcpl.get_layout()
+    if layout == h5py.h5d.CHUNKED:
+        ref["chunks"] = list(ds.chunks)
+        refs = []
+        for i in range(ds.id.get_num_chunks()):
+            info = ds.id.get_chunk_info(i)
+            refs.append(
+                [list(info.chunk_offset), info.filter_mask, info.byte_offset, info.size]
+            )
+        ref["refs"] = refs
+    elif layout == h5py.h5d.CONTIGUOUS:
+        offset = ds.id.get_offset()
+        ref["chunks"] = list(ds.shape)
+        ref["refs"] = (
+            []
+            if offset is None
+            else [[[0] * len(ds.shape), 0, offset, ds.id.get_storage_size()]]
+        )
+    else:
+        return None
+    return ref
+
+
+def build_chunk_index(hdf: h5py.File) -> Dict[str, Any]:
+    """Build a chunk index of every dataset in an HDF file.
+
+    Datasets that cannot be read from the index (compact or virtual layouts,
+    variable-length types, or unsupported filters) are omitted.
+
+    Parameters
+    ----------
+        hdf: The open HDF file.
+
+    Returns
+    -------
+        dict: The chunk index.
+    """
+    datasets = {}
+
+    def _visit(name: str, obj: Any) -> None:
+        if isinstance(obj, h5py.Dataset):
+            ref = _dataset_ref(obj)
+            if ref is not None:
+                datasets[name] = ref
+
+    hdf.visititems(_visit)
+    return {"version": CHUNK_INDEX_VERSION, "datasets": datasets}
+
+
+def _unshuffle(data: bytes, itemsize: int) -> bytes:
+    """Reverse the HDF5 shuffle filter."""
+    n = len(data) // itemsize
+    shuffled = np.frombuffer(data, dtype=np.uint8, count=n * itemsize)
+    unshuffled = shuffled.reshape(itemsize, n).T.tobytes()
+    return unshuffled + data[n * itemsize :]
+
+
+def _decode_chunk(
+    data: bytes, filters: List[int], filter_mask: int, itemsize: int
+) -> bytes:
+    """Apply the filter pipeline of a chunk in reverse to decode it."""
+    for i in reversed(range(len(filters))):
+        if filter_mask & (1 << i):
+            continue  # filter was skipped for this chunk
+        if filters[i] == FILTER_DEFLATE:
+            data = zlib.decompress(data)
+        elif filters[i] == FILTER_SHUFFLE:
+            data = _unshuffle(data, itemsize)
+        elif filters[i] == FILTER_FLETCHER32:
+            data = data[:-4]
+    return data
+
+
+class ChunkIndex:
+    """Chunk index of an HDF file, used to read datasets with range requests.
+
+    Attributes
+    ----------
+        datasets: Chunk references keyed by dataset path.
+    """
+
+    def __init__(self, index: Dict[str, Any]):
+        """Instantiate a ChunkIndex from an index dictionary.
+
+        Parameters
+        ----------
+        index : dict
+            The chunk index, as built by `build_chunk_index`.
+        """
+        if index.get("version") != CHUNK_INDEX_VERSION:
+            raise ChunkIndexError(
+                f"Unsupported chunk index version: {index.get('version')}"
+            )
+        self.datasets: Dict[str, Dict[str, Any]] = index["datasets"]
+
+    @classmethod
+    def from_hdf(cls, hdf: h5py.File) -> "ChunkIndex":
+        """Build a ChunkIndex from an open HDF file.
+
+        Parameters
+        ----------
+            hdf: The open HDF file.
+
+        Returns
+        -------
+            ChunkIndex: The chunk index.
+        """
+        return cls(build_chunk_index(hdf))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "ChunkIndex":
+        """Load a ChunkIndex from a JSON sidecar file.
+
+        Parameters
+        ----------
+            path: Path to the sidecar file.
+
+        Returns
+        -------
+            ChunkIndex: The chunk index.
+        """
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save the ChunkIndex as a JSON sidecar file.
+
+        Parameters
+        ----------
+            path: Path to the sidecar file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": CHUNK_INDEX_VERSION, "datasets": self.datasets}, f)
+        os.replace(tmp_path, path)
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a dataset can be read from the index."""
+        return name.strip("/") in self.datasets
+
+    def read(self, reader: ObstoreFile, name: str) -> np.ndarray:
+        """Read a dataset, fetching all of its chunks in parallel.
+
+        Parameters
+        ----------
+            reader: The remote HDF file the index was built from.
+            name: Path of the dataset within the HDF file.
+
+        Returns
+        -------
+            np.ndarray: The dataset values.
+
+        Raises
+        ------
+            ChunkIndexError: If the dataset is not in the index.
+        """
+        ref = self.datasets.get(name.strip("/"))
+        if ref is None:
+            raise ChunkIndexError(f"Dataset '{name}' not found in chunk index.")
+        dtype = descr_to_dtype(ref["dtype"])
+        shape = tuple(ref["shape"])
+        chunks = tuple(ref["chunks"])
+        out = np.empty(shape, dtype=dtype)
+        if ref["fillvalue"] is not None:
+            out[...] = ref["fillvalue"]
+        else:
+            out[...] = np.zeros((), dtype=dtype)
+        refs = ref["refs"]
+        if not refs or out.size == 0:
+            return out
+        buffers = reader.fetch_ranges(
+            [offset for _, _, offset, _ in refs],
+            [offset + size for _, _, offset, size in refs],
+        )
+        for (chunk_offset, filter_mask, _, _), buffer in zip(refs, buffers):
+            data = _decode_chunk(
+                bytes(buffer), ref["filters"], filter_mask, dtype.itemsize
+            )
+            chunk = np.frombuffer(data, dtype=dtype, count=int(np.prod(chunks)))
+            chunk = chunk.reshape(chunks)
+            target = tuple(
+                slice(o, min(o + c, s)) for o, c, s in zip(chunk_offset, chunks, shape)
+            )
+            out[target] = chunk[tuple(slice(0, t.stop - t.start) for t in target)]
+        for field in ref["spacepad"]:
+            values = out[field] if field else out
+            values[...] = np.char.rstrip(values, b" ")
+        return out
+
+
+def chunk_index_path(cache_dir: str | os.PathLike, url: str, version: str) -> Path:
+    """Get the path of the sidecar file for a version of a remote HDF file.
+
+    Parameters
+    ----------
+        cache_dir: The cache directory.
+        url: URL of the remote HDF file.
+        version: Version identifier (e.g., ETag) of the remote HDF file.
+
+    Returns
+    -------
+        Path: The sidecar file path.
+    """
+    key = sha256(f"{url}\0{version}".encode()).hexdigest()
+    return Path(cache_dir) / "chunk-index" / f"{key}.json"
@@ -1,22 +1,46 @@
 """Main entry point for the rasqc command-line tool."""
 
-from . import checkers  # noqa: F401
+from .batch import (
+    discover_models,
+    journaled_reports,
+    open_sink,
+    print_batch_summary,
+    run_batch,
+)
+from .checksuite import StacCheckSuite
+from .journal import BatchJournal
 from .registry import CHECKSUITES
-from .result import RasqcResultEncoder, ResultStatus
+from .result import RasqcResult, RasqcResultEncoder, ResultStatus
 from .themes import ColorTheme
 from .rasmodel import RasModel
-from .utils import to_snake_case, results_to_html
+from .obstore_file import (
+    DEFAULT_PREFETCH_BYTES,
+    DEFAULT_PREFETCH_TAIL_BYTES,
+    DEFAULT_REMOTE_IO,
+    RemoteIOConfig,
+)
+from .range_cache import CACHE_DIR_ENV
+from .result_cache import ResultCache
+from .timings import CheckTimer
+from .tracing import span, start_tracing, stop_tracing
+from .work_queue import (
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_MAX_ATTEMPTS,
+    WorkQueue,
+    run_worker,
+)
 
 from rich.console import Console
 
 import argparse
+from dataclasses import replace
 from datetime import datetime, timezone
 from importlib.metadata import version
 import json
+import os
 import sys
 from pathlib import Path
-import pandas as pd
-import geopandas as gpd
+from typing import List, Optional
 import webbrowser
 
 try:
@@ -25,13 +49,30 @@ except:
     RASQC_VERSION = None
 
 
-def run_console(ras_model: str, checksuite: str) -> None:
+def run_console(
+    ras_model: str,
+    checksuite: str,
+    remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+    jobs: int = 1,
+    processes: int = 0,
+    only: Optional[List[str]] = None,
+    skip: Optional[List[str]] = None,
+    timer: Optional[CheckTimer] = None,
+    result_cache: Optional[ResultCache] = None,
+) -> None:
     """Run checks in console mode with rich formatting.
 
     Parameters
     ----------
         ras_model: Path to the HEC-RAS model .prj file.
         checksuite: Name of the checksuite to run.
+        remote_io: Settings for reading remote HDF files.
+        jobs: Maximum number of checks to run at once.
+        processes: Number of worker processes for CPU-bound checks.
+        only: Names of the checks to run, along with their prerequisites.
+        skip: Names of checks not to run.
+        timer: Records the resources used by each check, if provided.
+        result_cache: Cache of results to reuse for unchanged checks, if provided.
 
     Returns
     -------
@@ -63,18 +104,42 @@ def run_console(ras_model: str, checksuite: str) -> None:
         highlight=False,
     )
     console.print(f"[bold]Checks[/bold]:")
-    results = CHECKSUITES[checksuite].run_checks_console(ras_model)
-    error_count = len(
-        [result for result in results if result.result == ResultStatus.ERROR]
-    )
-    warning_count = len(
-        [result for result in results if result.result == ResultStatus.WARNING]
-    )
-    ok_count = len([result for result in results if result.result == ResultStatus.OK])
+    suite = CHECKSUITES[checksuite]
+    counts = {status: 0 for status in ResultStatus}
+    for result in suite.iter_checks(
+        ras_model,
+        remote_io=remote_io,
+        jobs=jobs,
+        processes=processes,
+        only=only,
+        skip=skip,
+        timer=timer,
+        result_cache=result_cache,
+    ):
+        if not isinstance(result, RasqcResult):
+            continue
+        suite._print_result(console, None, result)
+        counts[result.result] += 1
+    if timer is not None:
+        timer.print_summary(console)
+    if result_cache is not None and result_cache.reused:
+        console.print(
+            "[bold]Cached[/bold]: reused results of "
+            + ", ".join(sorted(result_cache.reused)),
+            highlight=False,
+        )
+    error_count = counts[ResultStatus.ERROR]
+    warning_count = counts[ResultStatus.WARNING]
+    ok_count = counts[ResultStatus.OK]
+    skipped_count = counts[ResultStatus.SKIPPED]
     console.print("Results:", style="bold white")
     console.print(f"- Errors: [bold red]{error_count}[/bold red]")
     console.print(f"- Warnings: [bold yellow]{warning_count}[/bold yellow]")
     console.print(f"- OK: [bold green]{ok_count}[/bold green]")
+    if skipped_count > 0:
+        console.print(
+            f"- Skipped: [bold bright_black]{skipped_count}[/bold bright_black]"
+        )
     if error_count > 0:
         console.print(f"❌ Finished with [bold red]errors[/bold red].")
         sys.exit(1)
@@ -84,28 +149,108 @@ def run_console(ras_model: str, checksuite: str) -> None:
     console.print(f"✔ All checks passed.")
 
 
-def run_json(ras_model: str, checksuite: str) -> dict:
+def run_json(
+    ras_model: str,
+    checksuite: str,
+    remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+    jobs: int = 1,
+    processes: int = 0,
+    only: Optional[List[str]] = None,
+    skip: Optional[List[str]] = None,
+    timer: Optional[CheckTimer] = None,
+    result_cache: Optional[ResultCache] = None,
+    collect: bool = True,
+) -> dict:
     """Run checks and output results as JSON.
 
     Parameters
     ----------
         ras_model: Path to the HEC-RAS model .prj file.
         checksuite: Name of the checksuite to run.
+        remote_io: Settings for reading remote HDF files.
+        jobs: Maximum number of checks to run at once.
+        processes: Number of worker processes for CPU-bound checks.
+        only: Names of the checks to run, along with their prerequisites.
+        skip: Names of checks not to run.
+        timer: Records the resources used by each check, if provided. Timings
+            are written in a "timings" section after the results.
+        result_cache: Cache of results to reuse for unchanged checks, if provided.
+            The reused checks are listed in a "cached_checks" section.
+        collect: Whether to collect the results in the returned dictionary.
+            Results are written to stdout as each check completes either way;
+            the command line interface does not collect them, so results are
+            not held in memory.
 
     Returns
     -------
-        dict: Dictionary containing the check results.
+        dict: Dictionary containing the run metadata and, if collected, the
+        check results ("checks"), timings and cached checks.
+
+    Raises
+    ------
+        ValueError: If a selected or skipped check is not in the suite. Nothing
+            is written in this case, nor if the model cannot be opened. Errors
+            while running the checks are re-raised after the JSON document is
+            closed with an "error" member.
     """
-    results = CHECKSUITES[checksuite].run_checks(ras_model)
-    results_dicts = [result.to_dict() for result in results]
     output = {
         "version": RASQC_VERSION,
         "model": ras_model,
         "checksuite": checksuite,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "checks": results_dicts,
     }
-    print(json.dumps(output, cls=RasqcResultEncoder))
+    suite = CHECKSUITES[checksuite]
+    # validate the selected checks and open the model before anything is
+    # written, so that these errors do not leave a truncated JSON document
+    suite.get_execution_order(only, skip)
+    with RasModel.open(ras_model, remote_io=remote_io) as model:
+        # stream the "checks" array so results are not held in memory
+        sys.stdout.write(json.dumps(output)[:-1] + ', "checks": [')
+        checks = []
+        written = 0
+        error = None
+        try:
+            for result in suite.iter_checks(
+                model,
+                jobs=jobs,
+                processes=processes,
+                only=only,
+                skip=skip,
+                timer=timer,
+                result_cache=result_cache,
+            ):
+                if not isinstance(result, RasqcResult):
+                    continue
+                with span("write JSON result", "sink", check=result.name):
+                    result_dict = result.to_dict()
+                    sys.stdout.write(", " if written else "")
+                    sys.stdout.write(json.dumps(result_dict, cls=RasqcResultEncoder))
+                    sys.stdout.flush()
+                written += 1
+                if collect:
+                    checks.append(result_dict)
+        except BaseException as exc:
+            error = f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__
+            raise
+        finally:
+            # always close the document; a run that failed part way is
+            # marked by an "error" member
+            sys.stdout.write("]")
+            if error is not None:
+                sys.stdout.write(', "error": ' + json.dumps(error))
+            if timer is not None:
+                sys.stdout.write(', "timings": ' + json.dumps(timer.to_dict()))
+            if result_cache is not None:
+                cached = sorted(result_cache.reused)
+                sys.stdout.write(', "cached_checks": ' + json.dumps(cached))
+            sys.stdout.write("}\n")
+            sys.stdout.flush()
+    if collect:
+        output["checks"] = checks
+        if timer is not None:
+            output["timings"] = timer.to_dict()
+        if result_cache is not None:
+            output["cached_checks"] = cached
     return output
 
 
@@ -114,6 +259,13 @@ def run_files(
     checksuite: str,
     theme: ColorTheme = ColorTheme.ARCADE,
     show_on_complete: bool = True,
+    remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+    jobs: int = 1,
+    processes: int = 0,
+    only: Optional[List[str]] = None,
+    skip: Optional[List[str]] = None,
+    timer: Optional[CheckTimer] = None,
+    result_cache: Optional[ResultCache] = None,
 ) -> None:
     """Run checks and output results as an HTML log and ESRI Shapefiles if applicable.
 
@@ -127,31 +279,61 @@ def run_files(
             Color themes for use in writing the html qc log file.
         show_on_complete: bool
             If True, display the log file in the user's default web browser upon completion of the tool run.
+        remote_io: RemoteIOConfig
+            Settings for reading remote HDF files.
+        jobs: int
+            Maximum number of checks to run at once.
+        processes: int
+            Number of worker processes for CPU-bound checks.
+        only: List[str], optional
+            Names of the checks to run, along with their prerequisites.
+        skip: List[str], optional
+            Names of checks not to run.
+        timer: CheckTimer, optional
+            Records the resources used by each check, if provided.
+        result_cache: ResultCache, optional
+            Cache of results to reuse for unchanged checks, if provided.
     """
-    results = CHECKSUITES[checksuite].run_checks(ras_model)
+    import geopandas as gpd
+    import pandas as pd
+
+    from .utils import to_snake_case, results_to_html
+
     out_dir = Path(ras_model).parent / "rasqc"
     out_dir.mkdir(parents=True, exist_ok=True)
+    results = []
     gdfs = []
-    for res in results:
+    for res in CHECKSUITES[checksuite].iter_checks(
+        ras_model,
+        remote_io=remote_io,
+        jobs=jobs,
+        processes=processes,
+        only=only,
+        skip=skip,
+        timer=timer,
+        result_cache=result_cache,
+    ):
+        results.append(res)
         if res.gdf is not None:
             shp_dir = out_dir / "shapes"
             shp_dir.mkdir(parents=True, exist_ok=True)
-            res.gdf.to_file(
-                (
-                    shp_dir / f"{to_snake_case(res.name)}_{to_snake_case(res.filename)}"
-                ).with_suffix(".shp"),
-                SHPT="ARC",
-            )
+            shp_path = (
+                shp_dir / f"{to_snake_case(res.name)}_{to_snake_case(res.filename)}"
+            ).with_suffix(".shp")
+            with span("write shapefile", "sink", path=str(shp_path)):
+                res.gdf.to_file(shp_path, SHPT="ARC")
             res.gdf["filename"] = res.filename
             res.gdf["check"] = res.name
             gdfs.append(res.gdf)
     out_shp = (
         out_dir / f"rasqc_{to_snake_case(RasModel(ras_model).prj_file.title)}"
     ).with_suffix(".shp")
-    gpd.GeoDataFrame(pd.concat(gdfs, ignore_index=True)).to_file(
-        out_shp,
-        SHPT="ARC",
-    ) if gdfs else None
+    if gdfs:
+        with span("write shapefile", "sink", path=str(out_shp)):
+            gpd.GeoDataFrame(pd.concat(gdfs, ignore_index=True)).to_file(
+                out_shp,
+                SHPT="ARC",
+            )
     results_to_html(
         results=results,
         output_path=out_shp.with_suffix(".html"),
@@ -163,11 +345,341 @@ def run_files(
     webbrowser.open(out_shp.with_suffix(".html")) if show_on_complete else None
 
 
+def _add_remote_io_args(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments for reading remote HDF files to a parser."""
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help=(
+            "Directory of a persistent cache of remote HDF file data, reused "
+            f"across runs. Default: the '{CACHE_DIR_ENV}' environment variable, if set."
+        ),
+    )
+    parser.add_argument(
+        "--prefetch-metadata",
+        action="store_true",
+        help=(
+            "Prefetch the metadata regions of remote HDF files in a few large "
+            "requests when they are opened."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-index",
+        action="store_true",
+        help=(
+            "Build and reuse chunk-index sidecars of remote HDF files in the cache "
+            "directory to read datasets directly. Requires '--cache-dir'."
+        ),
+    )
+
+
+def _remote_io_from_args(args: argparse.Namespace) -> RemoteIOConfig:
+    """Build the remote HDF reading settings from parsed arguments."""
+    return RemoteIOConfig(
+        cache_dir=args.cache_dir,
+        prefetch_bytes=DEFAULT_PREFETCH_BYTES if args.prefetch_metadata else 0,
+        prefetch_tail_bytes=(
+            DEFAULT_PREFETCH_TAIL_BYTES if args.prefetch_metadata else 0
+        ),
+        chunk_index=args.chunk_index,
+    )
+
+
+def batch_main(argv: Optional[List[str]] = None) -> None:
+    """Launch the `rasqc batch` command to check many models.
+
+    Parameters
+    ----------
+        argv: Command-line arguments following 'batch'. Defaults to sys.argv.
+
+    Exits
+    -----
+        With code 0 if every model was checked without errors.
+        With code 1 if any model failed or had errors.
+    """
+    parser = argparse.ArgumentParser(
+        prog="rasqc batch",
+        description="rasqc: Run a checksuite across many HEC-RAS models",
+    )
+    parser.add_argument(
+        "source",
+        type=str,
+        help=(
+            "Models to check: a directory (searched recursively), a glob pattern, "
+            "a remote prefix URL (e.g., 's3://bucket/models/'), or a manifest "
+            "file (.txt) listing one model path or URL per line."
+        ),
+    )
+    parser.add_argument(
+        "--checksuite",
+        type=str,
+        default="ffrd",
+        choices=[
+            k for k, v in CHECKSUITES.items() if not isinstance(v, StacCheckSuite)
+        ],
+        help="Checksuite to run. Default: ffrd",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default="rasqc_batch.jsonl",
+        help=(
+            "Aggregated output file, written as each model completes: JSON lines "
+            "(one object per model) or, with a '.parquet' extension, Parquet (one "
+            "row per check result). Default: rasqc_batch.jsonl"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=(
+            "Number of worker processes checking models in parallel. "
+            "Default: the number of CPUs"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Maximum number of checks to run concurrently per model. Default: 1",
+    )
+    parser.add_argument(
+        "--journal",
+        type=str,
+        default=None,
+        help=(
+            "SQLite checkpoint journal recording each completed check and model. "
+            "Default: the output path with a '.journal.sqlite' extension"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Resume an interrupted run from its journal: checked models are "
+            "written to the output from the journal without being read again, "
+            "and checks that completed in partially checked models are not rerun. "
+            "The run must use the same checksuite as the interrupted run."
+        ),
+    )
+    _add_remote_io_args(parser)
+    args = parser.parse_args(argv)
+    console = Console()
+    models = discover_models(args.source)
+    journal = BatchJournal(
+        args.journal or Path(args.output).with_suffix(".journal.sqlite")
+    )
+    settings = {"checksuite": args.checksuite}
+    if args.resume:
+        # results journaled with other settings must not be replayed
+        recorded = journal.settings()
+        changed = sorted(k for k, v in settings.items() if recorded.get(k, v) != v)
+        if changed:
+            parser.error(
+                "cannot resume a run recorded with "
+                + ", ".join(f"{k} '{recorded[k]}'" for k in changed)
+                + "; rerun with the same settings, or without '--resume' to "
+                "start over"
+            )
+    else:
+        journal.clear()
+    journal.record_settings(settings)
+    reports = []
+    sink = open_sink(args.output)
+    try:
+        if args.resume:
+            for report in journaled_reports(journal):
+                if report.model in models:
+                    sink.write(report)
+                    reports.append(replace(report, results=[]))
+            console.print(
+                f"Resuming: {len(reports)} model(s) already checked", highlight=False
+            )
+        done = {report.model for report in reports}
+        models = [model for model in models if model not in done]
+        console.print(
+            f"[bold]Checking {len(models)} model(s)[/bold] with the "
+            f"[bright_blue]{args.checksuite}[/bright_blue] checksuite",
+            highlight=False,
+        )
+        for report in run_batch(
+            models,
+            args.checksuite,
+            args.workers,
+            _remote_io_from_args(args),
+            args.jobs,
+            journal,
+        ):
+            sink.write(report)
+            reports.append(replace(report, results=[]))  # keep counts only
+            if report.failed:
+                console.print(f"[bold red]FAILED[/bold red] {report.model}")
+            else:
+                console.print(f"[green]checked[/green] {report.model}")
+    finally:
+        sink.close()
+    print_batch_summary(console, reports)
+    console.print(f"Results written to [bright_blue]{args.output}[/bright_blue]")
+    if any(r.failed or r.counts[ResultStatus.ERROR.value] for r in reports):
+        sys.exit(1)
+
+
+def enqueue_main(argv: Optional[List[str]] = None) -> None:
+    """Launch the `rasqc enqueue` command to add models to a work queue.
+
+    Parameters
+    ----------
+        argv: Command-line arguments following 'enqueue'. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        prog="rasqc enqueue",
+        description="rasqc: Add HEC-RAS models to a work queue for 'rasqc worker'",
+    )
+    parser.add_argument("queue", type=str, help="Work queue file (SQLite)")
+    parser.add_argument(
+        "source",
+        type=str,
+        help="Models to enqueue, as for 'rasqc batch'.",
+    )
+    parser.add_argument(
+        "--checksuite",
+        type=str,
+        default="ffrd",
+        choices=[
+            k for k, v in CHECKSUITES.items() if not isinstance(v, StacCheckSuite)
+        ],
+        help="Checksuite to run. Default: ffrd",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=DEFAULT_MAX_ATTEMPTS,
+        help=(
+            "Number of times a model is attempted (after failures or expired "
+            f"worker leases) before it is marked as failed. Default: {DEFAULT_MAX_ATTEMPTS}"
+        ),
+    )
+    args = parser.parse_args(argv)
+    models = discover_models(args.source)
+    added = WorkQueue(args.queue).enqueue(models, args.checksuite, args.max_attempts)
+    Console().print(
+        f"Enqueued {added} of {len(models)} model(s) in "
+        f"[bright_blue]{args.queue}[/bright_blue]",
+        highlight=False,
+    )
+
+
+def worker_main(argv: Optional[List[str]] = None) -> None:
+    """Launch the `rasqc worker` command to check models from a work queue.
+
+    Parameters
+    ----------
+        argv: Command-line arguments following 'worker'. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        prog="rasqc worker",
+        description=(
+            "rasqc: Check models leased from a work queue until no work remains. "
+            "Run any number of workers, on any machine that can access the queue."
+        ),
+    )
+    parser.add_argument("queue", type=str, help="Work queue file (SQLite)")
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        help=(
+            "Seconds a model stays reserved for this worker without a renewal. "
+            "Leases are renewed while the worker is alive. "
+            f"Default: {DEFAULT_LEASE_SECONDS}"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Maximum number of checks to run concurrently per model. Default: 1",
+    )
+    _add_remote_io_args(parser)
+    args = parser.parse_args(argv)
+    checked = run_worker(
+        args.queue,
+        lease_seconds=args.lease_seconds,
+        remote_io=_remote_io_from_args(args),
+        jobs=args.jobs,
+    )
+    Console().print(f"Checked {checked} model(s); no work remaining.")
+
+
+def collect_main(argv: Optional[List[str]] = None) -> None:
+    """Launch the `rasqc collect` command to export the results of a work queue.
+
+    Parameters
+    ----------
+        argv: Command-line arguments following 'collect'. Defaults to sys.argv.
+
+    Exits
+    -----
+        With code 0 if every finished model was checked without errors.
+        With code 1 if any model failed or had errors.
+    """
+    parser = argparse.ArgumentParser(
+        prog="rasqc collect",
+        description="rasqc: Export the results of the finished models of a work queue",
+    )
+    parser.add_argument("queue", type=str, help="Work queue file (SQLite)")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default="rasqc_batch.jsonl",
+        help="Aggregated output file, as for 'rasqc batch'. Default: rasqc_batch.jsonl",
+    )
+    args = parser.parse_args(argv)
+    console = Console()
+    queue = WorkQueue(args.queue)
+    reports = []
+    sink = open_sink(args.output)
+    try:
+        for report in queue.reports():
+            sink.write(report)
+            reports.append(replace(report, results=[]))
+    finally:
+        sink.close()
+    print_batch_summary(console, reports)
+    console.print(
+        ", ".join(f"{status}: {n}" for status, n in queue.counts().items()),
+        highlight=False,
+    )
+    console.print(f"Results written to [bright_blue]{args.output}[/bright_blue]")
+    if any(r.failed or r.counts[ResultStatus.ERROR.value] for r in reports):
+        sys.exit(1)
+
+
+# Subcommands, selected by the first command-line argument
+_COMMANDS = {
+    "batch": batch_main,
+    "enqueue": enqueue_main,
+    "worker": worker_main,
+    "collect": collect_main,
+}
+
+
 def main():
     """Launch the rasqc command-line tool.
 
-    Parses command-line arguments and runs the appropriate checks.
+    Parses command-line arguments and runs the appropriate checks. If the first
+    argument is a subcommand ('batch', 'enqueue', 'worker' or 'collect'), runs
+    that command instead.
     """
+    if len(sys.argv) > 1 and sys.argv[1] in _COMMANDS:
+        return _COMMANDS[sys.argv[1]](sys.argv[2:])
     parser = argparse.ArgumentParser(
         description="rasqc: Automated HEC-RAS Model Quality Control Checks"
     )
@@ -196,17 +708,134 @@ def main():
         choices=[t.name for t in ColorTheme],
         help="Color theme of output log file. Only used if the '--files' argument is specified. Default: 'ARCADE'",
     )
+    _add_remote_io_args(parser)
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help=(
+            "Maximum number of checks to run concurrently. Checks run only after "
+            "the checks they depend on have completed. Default: 1"
+        ),
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help=(
+            "Number of worker processes for CPU-bound geometry checks (e.g., "
+            "breakline enforcement). Each worker reopens the model. Default: 0, "
+            "run all checks in the main process"
+        ),
+    )
+    parser.add_argument(
+        "--only",
+        type=lambda s: s.split(","),
+        default=None,
+        help=(
+            "Comma-separated class names of the checks to run (e.g., "
+            "'GeomHdfExists,BreaklineEnforcement'). The checks they depend on are "
+            "also run."
+        ),
+    )
+    parser.add_argument(
+        "--skip",
+        type=lambda s: s.split(","),
+        default=None,
+        help=(
+            "Comma-separated class names of checks not to run. Checks required by "
+            "another check that is run are not skipped."
+        ),
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help=(
+            "Record the wall time, CPU time, peak memory and remote I/O of each "
+            "check. Output as a summary table, or a 'timings' section with '--json'. "
+            "Checks are run serially so that peak memory is measured per check."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Write a cProfile stats file per check to DIR (implies '--timings'). "
+            "Checks are run serially when profiling."
+        ),
+    )
+    parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help=(
+            "Write a timeline of model loading, HDF opens, checks and outputs to "
+            "FILE as Chrome Trace Event JSON, viewable in Perfetto."
+        ),
+    )
+    parser.add_argument(
+        "--result-cache",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Cache check results in DIR and reuse them for checks whose checker "
+            "and input files are unchanged since the previous run."
+        ),
+    )
     args = parser.parse_args()
-    if args.json:
-        run_json(args.ras_model, args.checksuite)
-    elif args.files:
-        run_files(
-            args.ras_model,
-            args.checksuite,
-            {ct.name: ct for ct in ColorTheme}[args.theme],
-        )
-    else:
-        run_console(args.ras_model, args.checksuite)
+    remote_io = _remote_io_from_args(args)
+    timer = CheckTimer(args.profile) if args.timings or args.profile else None
+    result_cache = ResultCache(args.result_cache) if args.result_cache else None
+    if args.trace:
+        start_tracing()
+    try:
+        if args.json:
+            run_json(
+                args.ras_model,
+                args.checksuite,
+                remote_io,
+                args.jobs,
+                args.processes,
+                args.only,
+                args.skip,
+                timer,
+                result_cache,
+                collect=False,
+            )
+        elif args.files:
+            run_files(
+                args.ras_model,
+                args.checksuite,
+                {ct.name: ct for ct in ColorTheme}[args.theme],
+                remote_io=remote_io,
+                jobs=args.jobs,
+                processes=args.processes,
+                only=args.only,
+                skip=args.skip,
+                timer=timer,
+                result_cache=result_cache,
+            )
+        else:
+            run_console(
+                args.ras_model,
+                args.checksuite,
+                remote_io,
+                args.jobs,
+                args.processes,
+                args.only,
+                args.skip,
+                timer,
+                result_cache,
+            )
+    finally:
+        tracer = stop_tracing()
+        if tracer is not None:
+            tracer.save(args.trace)
 
 
 if __name__ == "__main__":
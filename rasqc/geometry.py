@@ -0,0 +1,167 @@
+"""Spatial helpers shared by the mesh checkers."""
+
+from geopandas import GeoDataFrame, GeoSeries
+import numpy as np
+import shapely
+
+from typing import Tuple
+
+
+def unenforced_lines(
+    lines: GeoDataFrame, faces: GeoDataFrame, tolerance: float
+) -> GeoDataFrame:
+    """Get the parts of lines not within a tolerance of any mesh cell face.
+
+    Equivalent to `lines.overlay(faces.buffer(tolerance).to_frame(),
+    how="difference", keep_geom_type=True)` for line features, but only the
+    faces near each line are buffered: a spatial index over the faces selects
+    those within the tolerance of each line. The cost therefore grows with the
+    length of the lines rather than with the size of the mesh.
+
+    Parameters
+    ----------
+        lines: Line features, e.g. breaklines.
+        faces: Mesh cell faces.
+        tolerance: Distance from a face within which a line is enforced.
+
+    Returns
+    -------
+        GeoDataFrame: The attributes of the lines with unenforced parts, with
+        those parts as their geometry, and a new index.
+    """
+    line_idx, face_idx = faces.sindex.query(
+        lines.geometry, predicate="dwithin", distance=tolerance, sort=True
+    )
+    near = np.unique(face_idx)
+    buffers = np.empty(len(faces), dtype=object)
+    buffers[near] = faces.geometry.iloc[near].buffer(tolerance).to_numpy()
+
+    line_geoms = lines.geometry.to_numpy()
+    touching = shapely.intersects(line_geoms[line_idx], buffers[face_idx])
+    line_idx, face_idx = line_idx[touching], face_idx[touching]
+    covers = np.full(len(lines), None, dtype=object)
+    starts = np.flatnonzero(np.diff(line_idx, prepend=-1))
+    for line, group in zip(line_idx[starts], np.split(face_idx, starts[1:])):
+        covers[line] = shapely.union_all(buffers[group])
+
+    differences = GeoSeries(
+        np.where(
+            shapely.is_missing(covers),
+            line_geoms,
+            shapely.difference(line_geoms, covers),
+        ),
+        index=lines.index,
+        crs=lines.crs,
+    )
+    keep = ~differences.is_empty
+    result = lines[keep].copy()
+    result[result.geometry.name] = differences[keep]
+    return result.reset_index(drop=True)
+
+
+def face_vertices(
+    faces: np.ndarray,
+    facepoint_indexes: np.ndarray,
+    facepoint_coords: np.ndarray,
+    perimeter_info: np.ndarray,
+    perimeter_values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Gather the vertices of mesh cell faces into one coordinate array.
+
+    Each face runs from its first face point through its intermediate
+    (perimeter) points, if any, to its second face point.
+
+    Returns
+    -------
+        Tuple[np.ndarray, np.ndarray]: The (n, 2) vertex coordinates of the
+        faces, one face after another, and the position of each face's first
+        vertex.
+    """
+    starts, counts = perimeter_info[faces, 0], perimeter_info[faces, 1]
+    n_vertices = counts + 2
+    ends = np.cumsum(n_vertices)
+    firsts = ends - n_vertices
+    vertices = np.empty((ends[-1] if len(ends) else 0, 2), dtype=np.float64)
+    vertices[firsts] = facepoint_coords[facepoint_indexes[faces, 0]]
+    vertices[ends - 1] = facepoint_coords[facepoint_indexes[faces, 1]]
+    inner = np.ones(len(vertices), dtype=bool)
+    inner[firsts] = inner[ends - 1] = False
+    rows = np.repeat(starts - firsts - 1, counts) + np.flatnonzero(inner)
+    vertices[inner] = perimeter_values[rows]
+    return vertices, firsts
+
+
+def face_lengths(
+    facepoint_indexes: np.ndarray,
+    facepoint_coords: np.ndarray,
+    perimeter_info: np.ndarray,
+    perimeter_values: np.ndarray,
+) -> np.ndarray:
+    """Compute the lengths of the cell faces of a 2D flow area mesh.
+
+    Lengths are computed from the arrays of the geometry HDF file without
+    building face geometries, including faces with intermediate points.
+
+    Parameters
+    ----------
+        facepoint_indexes: 'Faces FacePoint Indexes' of the mesh; the indexes
+            of the two face points of each face.
+        facepoint_coords: 'FacePoints Coordinate' of the mesh.
+        perimeter_info: 'Faces Perimeter Info' of the mesh; the first row and
+            number of intermediate points of each face in `perimeter_values`.
+        perimeter_values: 'Faces Perimeter Values' of the mesh; coordinates of
+            the intermediate points of the faces.
+
+    Returns
+    -------
+        np.ndarray: The length of each face.
+    """
+    start = facepoint_coords[facepoint_indexes[:, 0]]
+    end = facepoint_coords[facepoint_indexes[:, 1]]
+    lengths = np.hypot(*(end - start).T)
+    curved = np.flatnonzero(perimeter_info[:, 1] > 0)
+    if len(curved):
+        vertices, firsts = face_vertices(
+            curved,
+            facepoint_indexes,
+            facepoint_coords,
+            perimeter_info,
+            perimeter_values,
+        )
+        segments = np.hypot(*np.diff(vertices, axis=0).T)
+        # drop the segments joining the last vertex of a face to the next face
+        segments[firsts[1:] - 1] = 0
+        lengths[curved] = np.add.reduceat(segments, firsts)
+    return lengths
+
+
+def face_lines(
+    faces: np.ndarray,
+    facepoint_indexes: np.ndarray,
+    facepoint_coords: np.ndarray,
+    perimeter_info: np.ndarray,
+    perimeter_values: np.ndarray,
+) -> np.ndarray:
+    """Build LineStrings of selected cell faces of a 2D flow area mesh.
+
+    Parameters
+    ----------
+        faces: Indexes of the faces.
+        facepoint_indexes: 'Faces FacePoint Indexes' of the mesh.
+        facepoint_coords: 'FacePoints Coordinate' of the mesh.
+        perimeter_info: 'Faces Perimeter Info' of the mesh.
+        perimeter_values: 'Faces Perimeter Values' of the mesh.
+
+    Returns
+    -------
+        np.ndarray: The LineString of each selected face.
+    """
+    if not len(faces):
+        return np.array([], dtype=object)
+    vertices, firsts = face_vertices(
+        faces, facepoint_indexes, facepoint_coords, perimeter_info, perimeter_values
+    )
+    n_vertices = np.diff(np.append(firsts, len(vertices)))
+    return shapely.linestrings(
+        vertices, indices=np.repeat(np.arange(len(faces)), n_vertices)
+    )
@@ -0,0 +1,185 @@
+"""Append-only checkpoint journal of batch runs, used to resume interrupted runs."""
+
+from .result import RasqcResult, RasqcResultEncoder
+
+from contextlib import closing, contextmanager
+import json
+import os
+from pathlib import Path
+import sqlite3
+from typing import Dict, Iterator, List, Optional
+
+# Seconds to wait for other processes writing to the journal
+JOURNAL_TIMEOUT = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checks (
+    model TEXT NOT NULL,
+    check_name TEXT NOT NULL,
+    results TEXT NOT NULL,
+    PRIMARY KEY (model, check_name)
+);
+CREATE TABLE IF NOT EXISTS models (
+    model TEXT PRIMARY KEY,
+    error TEXT,
+    elapsed_seconds REAL NOT NULL,
+    counts TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class BatchJournal:
+    """SQLite journal of the checks and models completed in a batch run.
+
+    Each check is recorded as soon as it completes, and each model once all of
+    its checks have completed, so a run that dies partway through can resume
+    without rerunning completed work. The settings of the run (e.g. the
+    checksuite) are recorded too, so that a run is only resumed with the same
+    settings. Worker processes write to the journal directly; each write is a
+    separate transaction.
+
+    Attributes
+    ----------
+        path: Path of the SQLite journal file.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Open (creating if needed) a BatchJournal.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path of the SQLite journal file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success."""
+        with closing(sqlite3.connect(self.path, timeout=JOURNAL_TIMEOUT)) as conn:
+            with conn:
+                yield conn
+
+    def record_check(
+        self, model: str, check_name: str, results: List[RasqcResult]
+    ) -> None:
+        """Record the results of a completed check.
+
+        Parameters
+        ----------
+            model: Path or URL of the model.
+            check_name: Class name of the check.
+            results: The results of the check. GeoDataFrames are not recorded.
+        """
+        payload = json.dumps(
+            [{**r.to_dict(), "gdf": None} for r in results], cls=RasqcResultEncoder
+        )
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checks VALUES (?, ?, ?)",
+                (model, check_name, payload),
+            )
+
+    def record_model(
+        self,
+        model: str,
+        error: Optional[str],
+        elapsed_seconds: float,
+        counts: Dict[str, int],
+    ) -> None:
+        """Record a model whose checks have all completed (or that failed).
+
+        Parameters
+        ----------
+            model: Path or URL of the model.
+            error: Traceback of the failure, if the model could not be checked.
+            elapsed_seconds: Wall-clock time spent on the model.
+            counts: Number of results of each status.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO models VALUES (?, ?, ?, ?)",
+                (model, error, elapsed_seconds, json.dumps(counts)),
+            )
+
+    def completed_checks(self, model: str) -> Dict[str, List[RasqcResult]]:
+        """Get the recorded results of the completed checks of a model.
+
+        Parameters
+        ----------
+            model: Path or URL of the model.
+
+        Returns
+        -------
+            dict: The results of each completed check, keyed by check class name,
+            in the order the checks completed.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT check_name, results FROM checks WHERE model = ? ORDER BY rowid",
+                (model,),
+            ).fetchall()
+        return {
+            check_name: [RasqcResult.from_dict(r) for r in json.loads(results)]
+            for check_name, results in rows
+        }
+
+    def completed_models(self) -> Dict[str, dict]:
+        """Get the recorded models.
+
+        Returns
+        -------
+            dict: The error, elapsed seconds and result counts of each recorded
+            model, keyed by model.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT model, error, elapsed_seconds, counts FROM models ORDER BY rowid"
+            ).fetchall()
+        return {
+            model: {
+                "error": error,
+                "elapsed_seconds": elapsed_seconds,
+                "counts": json.loads(counts),
+            }
+            for model, error, elapsed_seconds, counts in rows
+        }
+
+    def record_settings(self, settings: Dict[str, str]) -> None:
+        """Record the settings of the run, replacing any previously recorded.
+
+        Parameters
+        ----------
+            settings: The settings that determine the results of the run
+                (e.g., the checksuite), keyed by name.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM settings")
+            conn.executemany("INSERT INTO settings VALUES (?, ?)", settings.items())
+
+    def settings(self) -> Dict[str, str]:
+        """Get the recorded settings of the run.
+
+        Returns
+        -------
+            dict: The recorded settings, keyed by name; empty if none were
+            recorded.
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT key, value FROM settings").fetchall()
+        return dict(rows)
+
+    def clear(self) -> None:
+        """Remove all records, e.g. to start a new run."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM checks")
+            conn.execute("DELETE FROM models")
+            conn.execute("DELETE FROM settings")
@@ -0,0 +1,466 @@
+"""Compact, array-backed representation of HEC-RAS 2D flow area meshes.
+
+Checks of large meshes work on the NumPy arrays stored in the geometry HDF file
+rather than on GeoDataFrames of shapely geometries, which cost hundreds of bytes
+per face or cell. Geometries are built only for the flagged subset.
+"""
+
+from .geometry import face_lengths, face_lines, face_vertices
+
+from geopandas import GeoDataFrame
+import numpy as np
+import pandas as pd
+from rashdf import RasGeomHdf
+import shapely
+
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from .rasmodel import GeomFile
+
+# Number of cells whose face segments are processed at once by
+# `MeshArrays.cell_contains_center` and `MeshArrays.metrics`, bounding their
+# memory use
+CELL_CHUNK_SIZE = 100_000
+
+
+def _reduce_cells(
+    ufunc: np.ufunc, values: np.ndarray, offsets: np.ndarray
+) -> np.ndarray:
+    """Reduce values of the faces of consecutive cells with a ufunc.
+
+    Parameters
+    ----------
+        ufunc: The reducing ufunc, e.g. `np.maximum`.
+        values: Value of each face of the cells, in cell order.
+        offsets: (n_cells + 1,) offsets of the faces of each cell, in CSR form;
+            the first is that of the first value.
+
+    Returns
+    -------
+        np.ndarray: The reduced value of each cell; NaN for cells without faces.
+    """
+    has_faces = np.diff(offsets) > 0
+    reduced = np.full(len(offsets) - 1, np.nan)
+    if has_faces.any():
+        reduced[has_faces] = ufunc.reduceat(
+            values, offsets[:-1][has_faces] - offsets[0]
+        )
+    return reduced
+
+
+@dataclass(frozen=True)
+class _ArrayRecord:
+    """Base of the read-only array records shared by the checks of a run."""
+
+    def __post_init__(self):
+        """Make the arrays read-only."""
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the arrays in bytes."""
+        return sum(
+            getattr(self, f.name).nbytes
+            for f in fields(self)
+            if isinstance(getattr(self, f.name), np.ndarray)
+        )
+
+
+@dataclass(frozen=True)
+class MeshArrays(_ArrayRecord):
+    """Arrays describing the cells and faces of a 2D flow area mesh.
+
+    Only the computational cells of the mesh are included, not the ghost
+    cells beyond its perimeter. The arrays are read-only, since they are shared
+    by the checks of a run.
+
+    Attributes
+    ----------
+        mesh_name: Name of the 2D flow area.
+        facepoint_coords: (n_facepoints, 2) coordinates of the face points.
+        face_facepoints: (n_faces, 2) indexes of the two face points of each
+            face.
+        face_perimeter_info: (n_faces, 2) first row and number of intermediate
+            points of each face in `face_perimeter_values`.
+        face_perimeter_values: (n, 2) coordinates of the intermediate points of
+            the faces.
+        face_cells: (n_faces, 2) indexes of the two cells of each face. Faces
+            on the perimeter have a ghost cell, with an index >= n_cells. A
+            face runs in the positive direction around its first cell.
+        cell_face_offsets: (n_cells + 1,) offsets of the faces of each cell in
+            `cell_faces`, in compressed sparse row (CSR) form.
+        cell_faces: Indexes of the faces of each cell, in order around the cell.
+        cell_centers: (n_cells, 2) coordinates of the cell centers.
+        perimeter: (n, 2) coordinates of the perimeter of the 2D flow area.
+    """
+
+    mesh_name: str
+    facepoint_coords: np.ndarray
+    face_facepoints: np.ndarray
+    face_perimeter_info: np.ndarray
+    face_perimeter_values: np.ndarray
+    face_cells: np.ndarray
+    cell_face_offsets: np.ndarray
+    cell_faces: np.ndarray
+    cell_centers: np.ndarray
+    perimeter: np.ndarray
+
+    @classmethod
+    def from_geom_file(
+        cls, geom: "GeomFile", mesh_name: str, mesh_index: int
+    ) -> "MeshArrays":
+        """Read the arrays of a 2D flow area from a geometry HDF file.
+
+        Parameters
+        ----------
+            geom: The HEC-RAS geometry file.
+            mesh_name: Name of the 2D flow area.
+            mesh_index: Position of the 2D flow area among those of the file.
+
+        Returns
+        -------
+            MeshArrays: The arrays of the mesh.
+        """
+        root = RasGeomHdf.FLOW_AREA_2D_PATH
+        path = f"{root}/{mesh_name}"
+        n_cells = int(geom.read_dataset(f"{root}/Cell Info")[mesh_index, 1])
+        cell_face_info = geom.read_dataset(f"{path}/Cells Face and Orientation Info")
+        starts, counts = cell_face_info[:n_cells, 0], cell_face_info[:n_cells, 1]
+        offsets = np.zeros(n_cells + 1, dtype=np.int32)
+        np.cumsum(counts, out=offsets[1:])
+        rows = np.repeat(starts - offsets[:-1], counts) + np.arange(offsets[-1])
+        cell_faces = geom.read_dataset(f"{path}/Cells Face and Orientation Values")
+
+        def read(name: str, dtype: type) -> np.ndarray:
+            return np.asarray(geom.read_dataset(f"{path}/{name}"), dtype=dtype)
+
+        return cls(
+            mesh_name=mesh_name,
+            facepoint_coords=read("FacePoints Coordinate", np.float64),
+            face_facepoints=read("Faces FacePoint Indexes", np.int32),
+            face_perimeter_info=read("Faces Perimeter Info", np.int32),
+            face_perimeter_values=read("Faces Perimeter Values", np.float64),
+            face_cells=read("Faces Cell Indexes", np.int32),
+            cell_face_offsets=offsets,
+            cell_faces=np.asarray(cell_faces[rows, 0], dtype=np.int32),
+            cell_centers=read("Cells Center Coordinate", np.float64)[:n_cells],
+            perimeter=read("Perimeter", np.float64),
+        )
+
+    @property
+    def n_faces(self) -> int:
+        """Number of faces of the mesh."""
+        return len(self.face_facepoints)
+
+    @property
+    def n_cells(self) -> int:
+        """Number of cells of the mesh."""
+        return len(self.cell_centers)
+
+    def _face_arrays(self) -> tuple:
+        """Get the arrays describing the face geometries."""
+        return (
+            self.face_facepoints,
+            self.facepoint_coords,
+            self.face_perimeter_info,
+            self.face_perimeter_values,
+        )
+
+    def face_lengths(self) -> np.ndarray:
+        """Compute the length of each face.
+
+        Returns
+        -------
+            np.ndarray: The length of each face.
+        """
+        return face_lengths(*self._face_arrays())
+
+    def cell_contains_center(self) -> np.ndarray:
+        """Check whether each cell contains its own center point.
+
+        The segments of each cell's faces are tested with a vectorized
+        ray-crossing (even-odd) test, without building cell polygons. Cells
+        failing the test are confirmed against their polygons, so a center on
+        the cell boundary counts as contained.
+
+        Returns
+        -------
+            np.ndarray: Boolean mask of the cells containing their center.
+        """
+        contains = np.ones(self.n_cells, dtype=bool)
+        for first in range(0, self.n_cells, CELL_CHUNK_SIZE):
+            last = min(first + CELL_CHUNK_SIZE, self.n_cells)
+            offsets = self.cell_face_offsets[first : last + 1]
+            faces = self.cell_faces[offsets[0] : offsets[-1]]
+            vertices, face_firsts = face_vertices(faces, *self._face_arrays())
+            n_vertices = np.diff(np.append(face_firsts, len(vertices)))
+            # each vertex starts a segment, except the last vertex of each face
+            cells = np.repeat(
+                np.repeat(np.arange(first, last), np.diff(offsets)), n_vertices
+            )
+            is_segment = np.ones(len(vertices), dtype=bool)
+            is_segment[face_firsts + n_vertices - 1] = False
+            x1, y1 = vertices[is_segment].T
+            x2, y2 = vertices[np.flatnonzero(is_segment) + 1].T
+            cells = cells[is_segment]
+            px, py = self.cell_centers[cells].T
+            straddles = (y1 > py) != (y2 > py)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+            crossings = np.bincount(
+                cells - first,
+                weights=straddles & (px < x_cross),
+                minlength=last - first,
+            )
+            contains[first:last] = crossings % 2 == 1
+        outside = np.flatnonzero(~contains)
+        if len(outside):
+            contains[outside] = shapely.intersects_xy(
+                self.cell_polygons(outside), *self.cell_centers[outside].T
+            )
+        return contains
+
+    def metrics(self) -> "MeshMetrics":
+        """Compute the quality metrics of the cells and faces of the mesh.
+
+        All metrics are computed in one vectorized pass over the face segments
+        of the cells, without building cell polygons. Coordinates are taken
+        relative to each cell's center to limit round-off.
+
+        Returns
+        -------
+            MeshMetrics: The metrics of the mesh.
+        """
+        n_cells = self.n_cells
+        area = np.empty(n_cells)
+        aspect_ratio = np.empty(n_cells)
+        min_angle = np.empty(n_cells)
+        max_angle = np.empty(n_cells)
+        for first in range(0, n_cells, CELL_CHUNK_SIZE):
+            last = min(first + CELL_CHUNK_SIZE, n_cells)
+            offsets = self.cell_face_offsets[first : last + 1]
+            faces = self.cell_faces[offsets[0] : offsets[-1]]
+            face_cell = np.repeat(np.arange(first, last), np.diff(offsets))
+            vertices, face_firsts = face_vertices(faces, *self._face_arrays())
+            n_vertices = np.diff(np.append(face_firsts, len(vertices)))
+            face_lasts = face_firsts + n_vertices - 1
+            vertices -= self.cell_centers[np.repeat(face_cell, n_vertices)]
+            # faces running in the negative direction around the cell
+            reverse = self.face_cells[faces, 0] != face_cell
+
+            # area and second moments of area, from the signed face segments
+            is_segment = np.ones(len(vertices), dtype=bool)
+            is_segment[face_lasts] = False
+            starts = np.flatnonzero(is_segment)
+            x1, y1 = vertices[starts].T
+            x2, y2 = vertices[starts + 1].T
+            cross = (x1 * y2 - x2 * y1) * np.repeat(
+                np.where(reverse, -1.0, 1.0), n_vertices - 1
+            )
+            segment_cell = np.repeat(face_cell - first, n_vertices - 1)
+
+            def cell_sum(values: np.ndarray) -> np.ndarray:
+                return np.bincount(
+                    segment_cell, weights=cross * values, minlength=last - first
+                )
+
+            signed_area = cell_sum(np.ones_like(cross)) / 2
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cx = cell_sum(x1 + x2) / (6 * signed_area)
+                cy = cell_sum(y1 + y2) / (6 * signed_area)
+            ixx = cell_sum(y1**2 + y1 * y2 + y2**2) / 12 - signed_area * cy**2
+            iyy = cell_sum(x1**2 + x1 * x2 + x2**2) / 12 - signed_area * cx**2
+            ixy = (
+                cell_sum(x1 * y2 + 2 * x1 * y1 + 2 * x2 * y2 + x2 * y1) / 24
+                - signed_area * cx * cy
+            )
+            # principal moments; the orientation of the cell cancels out
+            mean = (ixx + iyy) / 2
+            spread = np.hypot((ixx - iyy) / 2, ixy)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                aspect_ratio[first:last] = np.sqrt((mean + spread) / (mean - spread))
+            area[first:last] = np.abs(signed_area)
+
+            # interior angles between consecutive faces, at their face points
+            start_dir = np.where(
+                reverse[:, None],
+                vertices[face_lasts - 1] - vertices[face_lasts],
+                vertices[face_firsts + 1] - vertices[face_firsts],
+            )
+            end_dir = np.where(
+                reverse[:, None],
+                vertices[face_firsts] - vertices[face_firsts + 1],
+                vertices[face_lasts] - vertices[face_lasts - 1],
+            )
+            # the face after the last face of each cell is its first face
+            cell_firsts = offsets[:-1] - offsets[0]
+            has_faces = np.diff(offsets) > 0
+            next_face = np.arange(1, len(faces) + 1)
+            next_face[offsets[1:][has_faces] - offsets[0] - 1] = cell_firsts[has_faces]
+            next_dir = start_dir[next_face]
+            turn = np.arctan2(
+                end_dir[:, 0] * next_dir[:, 1] - end_dir[:, 1] * next_dir[:, 0],
+                (end_dir * next_dir).sum(axis=1),
+            )
+            angle = np.degrees(np.pi - turn * np.sign(signed_area)[face_cell - first])
+            min_angle[first:last] = _reduce_cells(np.minimum, angle, offsets)
+            max_angle[first:last] = _reduce_cells(np.maximum, angle, offsets)
+
+        # ratio of the larger to the smaller area of the cells of each face
+        internal = (self.face_cells < n_cells).all(axis=1)
+        face_areas = area[self.face_cells[internal]]
+        face_area_ratio = np.ones(self.n_faces)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            face_area_ratio[internal] = face_areas.max(axis=1) / face_areas.min(axis=1)
+        return MeshMetrics(
+            mesh_name=self.mesh_name,
+            cell_area=area,
+            cell_face_count=np.diff(self.cell_face_offsets),
+            cell_aspect_ratio=aspect_ratio,
+            cell_area_ratio=_reduce_cells(
+                np.maximum, face_area_ratio[self.cell_faces], self.cell_face_offsets
+            ),
+            cell_min_angle=min_angle,
+            cell_max_angle=max_angle,
+            face_length=self.face_lengths(),
+        )
+
+    def face_lines(self, faces: np.ndarray) -> np.ndarray:
+        """Build the LineStrings of selected faces.
+
+        Parameters
+        ----------
+            faces: Indexes of the faces.
+
+        Returns
+        -------
+            np.ndarray: The LineString of each selected face.
+        """
+        return face_lines(np.asarray(faces), *self._face_arrays())
+
+    def cell_polygons(self, cells: np.ndarray) -> np.ndarray:
+        """Build the Polygons of selected cells by polygonizing their faces.
+
+        Parameters
+        ----------
+            cells: Indexes of the cells.
+
+        Returns
+        -------
+            np.ndarray: The Polygon of each selected cell.
+        """
+        polygons = np.empty(len(cells), dtype=object)
+        for i, cell in enumerate(cells):
+            faces = self.cell_faces[
+                self.cell_face_offsets[cell] : self.cell_face_offsets[cell + 1]
+            ]
+            polys, _, _, invalid = shapely.polygonize_full(self.face_lines(faces))
+            rings = polys or invalid
+            # degenerate cells (e.g., without faces) get an empty polygon
+            polygons[i] = (
+                shapely.Polygon(rings.geoms[0])
+                if len(rings.geoms)
+                else shapely.Polygon()
+            )
+        return polygons
+
+    def faces_to_gdf(
+        self, faces: np.ndarray, crs: Optional[Any] = None
+    ) -> GeoDataFrame:
+        """Convert selected faces to a GeoDataFrame.
+
+        Parameters
+        ----------
+            faces: Indexes of the faces.
+            crs: Coordinate reference system of the mesh.
+
+        Returns
+        -------
+            GeoDataFrame: The mesh name, face ID and LineString of each face,
+            indexed by face ID.
+        """
+        faces = np.asarray(faces, dtype=np.int64)
+        return GeoDataFrame(
+            {
+                "mesh_name": pd.Series(
+                    [self.mesh_name] * len(faces), index=faces, dtype=str
+                ),
+                "face_id": faces,
+                "geometry": self.face_lines(faces),
+            },
+            index=faces,
+            geometry="geometry",
+            crs=crs,
+        )
+
+    def cells_to_gdf(
+        self, cells: np.ndarray, crs: Optional[Any] = None
+    ) -> GeoDataFrame:
+        """Convert selected cells to a GeoDataFrame.
+
+        Parameters
+        ----------
+            cells: Indexes of the cells.
+            crs: Coordinate reference system of the mesh.
+
+        Returns
+        -------
+            GeoDataFrame: The mesh name, cell ID and Polygon of each cell,
+            indexed by cell ID.
+        """
+        cells = np.asarray(cells, dtype=np.int64)
+        return GeoDataFrame(
+            {
+                "mesh_name": pd.Series(
+                    [self.mesh_name] * len(cells), index=cells, dtype=str
+                ),
+                "cell_id": cells,
+                "geometry": self.cell_polygons(cells),
+            },
+            index=cells,
+            geometry="geometry",
+            crs=crs,
+        )
+
+
+@dataclass(frozen=True)
+class MeshMetrics(_ArrayRecord):
+    """Quality metrics of the cells and faces of a 2D flow area mesh.
+
+    Computed once per mesh by `MeshArrays.metrics` and shared through the
+    geometry's products (see `GeomFile.mesh_metrics`), so checks of different
+    metrics do not read or traverse the mesh again.
+
+    Attributes
+    ----------
+        mesh_name: Name of the 2D flow area.
+        cell_area: (n_cells,) planimetric area of each cell.
+        cell_face_count: (n_cells,) number of faces of each cell.
+        cell_aspect_ratio: (n_cells,) ratio of the length to the width of each
+            cell, from the principal second moments of its area; a rectangle's
+            aspect ratio is the ratio of its sides, any regular polygon's 1.
+        cell_area_ratio: (n_cells,) largest ratio of the larger to the smaller
+            area of each cell and an adjacent cell, i.e., the size transition
+            across its faces; 1 for cells without adjacent cells, NaN for
+            cells without faces.
+        cell_min_angle: (n_cells,) smallest interior angle, in degrees, between
+            consecutive faces of each cell; NaN for cells without faces.
+        cell_max_angle: (n_cells,) largest interior angle, in degrees, between
+            consecutive faces of each cell; over 180 for non-convex cells, NaN
+            for cells without faces.
+        face_length: (n_faces,) length of each face.
+    """
+
+    mesh_name: str
+    cell_area: np.ndarray
+    cell_face_count: np.ndarray
+    cell_aspect_ratio: np.ndarray
+    cell_area_ratio: np.ndarray
+    cell_min_angle: np.ndarray
+    cell_max_angle: np.ndarray
+    face_length: np.ndarray
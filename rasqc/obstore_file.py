@@ -0,0 +1,385 @@
+"""Random-access file object for remote HDF files backed by obstore."""
+
+from .range_cache import CACHE_DIR_ENV, DEFAULT_CACHE_MAX_BYTES, RangeCache
+
+import obstore
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import io
+import os
+from pathlib import Path
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class RemoteIOConfig:
+    """Configuration for reading remote HDF files.
+
+    Attributes
+    ----------
+        block_size: Size in bytes of the blocks in which the file is fetched and cached.
+        readahead_blocks: Number of additional blocks fetched past the end of a
+            read that extends beyond the cached blocks.
+        max_range_size: Maximum size in bytes of a single range request. Larger
+            reads are split into several ranges that are fetched in parallel.
+        max_cache_bytes: Maximum size in bytes of the in-memory block cache.
+        cache_dir: Directory of the persistent on-disk caches. Blocks are cached
+            in its 'ranges' subdirectory. If None, the `RASQC_CACHE_DIR`
+            environment variable is used; if that is unset, the on-disk cache is
+            disabled.
+        cache_max_bytes: Maximum size in bytes of the on-disk block cache.
+        prefetch_bytes: Number of bytes at the start of an HDF file to prefetch
+            when it is opened, where HDF5 keeps the superblock, root group, and
+            most object headers and attribute heaps. 0 disables prefetching.
+        prefetch_tail_bytes: Number of bytes at the end of an HDF file to
+            prefetch when it is opened, where metadata of objects added after
+            the file was created ends up. 0 disables prefetching the tail.
+        chunk_index: If True, build a chunk-index sidecar for each remote HDF file
+            in the cache directory and use it to read datasets directly with
+            range requests. Requires a cache directory.
+    """
+
+    block_size: int = 256 * 1024
+    readahead_blocks: int = 4
+    max_range_size: int = 8 * 1024 * 1024
+    max_cache_bytes: int = 256 * 1024 * 1024
+    cache_dir: Optional[str | os.PathLike] = None
+    cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    prefetch_bytes: int = 0
+    prefetch_tail_bytes: int = 0
+    chunk_index: bool = False
+
+    def resolved_cache_dir(self) -> Optional[str | os.PathLike]:
+        """Get the cache directory, falling back to the `RASQC_CACHE_DIR` variable.
+
+        Returns
+        -------
+            str: The cache directory, or None if caching is disabled.
+        """
+        return self.cache_dir or os.environ.get(CACHE_DIR_ENV) or None
+
+    def range_cache(self) -> Optional[RangeCache]:
+        """Get the on-disk block cache, if enabled.
+
+        Returns
+        -------
+            RangeCache: The on-disk cache, or None if disabled.
+        """
+        cache_dir = self.resolved_cache_dir()
+        if not cache_dir:
+            return None
+        # the range cache owns (and evicts from) its directory, so it is kept
+        # apart from other files in the cache directory, e.g. chunk indexes
+        return RangeCache(Path(cache_dir) / "ranges", self.cache_max_bytes)
+
+
+DEFAULT_REMOTE_IO = RemoteIOConfig()
+
+# Default metadata prefetch sizes when prefetching is enabled
+DEFAULT_PREFETCH_BYTES = 4 * 1024 * 1024
+DEFAULT_PREFETCH_TAIL_BYTES = 1024 * 1024
+
+
+def _coalesce(block_ids: List[int], max_blocks: int) -> List[Tuple[int, int]]:
+    """Group sorted block indices into contiguous runs of at most `max_blocks`.
+
+    Parameters
+    ----------
+        block_ids: Sorted block indices.
+        max_blocks: Maximum number of blocks per run.
+
+    Returns
+    -------
+        List[Tuple[int, int]]: (first, last) block index of each run, inclusive.
+    """
+    runs = []
+    for i in block_ids:
+        if runs and runs[-1][1] == i - 1 and i - runs[-1][0] < max_blocks:
+            runs[-1] = (runs[-1][0], i)
+        else:
+            runs.append((i, i))
+    return runs
+
+
+class ObstoreFile(io.RawIOBase):
+    """Read-only, seekable file object for a remote object in an obstore store.
+
+    The file is read in fixed-size blocks held in an LRU cache. Missing blocks
+    needed by a read, plus a configurable readahead, are coalesced into
+    contiguous byte ranges and fetched in a single parallel `get_ranges` call.
+    If an on-disk cache is configured and the object version is known, blocks
+    are looked up there before being fetched and stored there afterward.
+    Instances can be passed directly to `h5py.File` (and rashdf).
+
+    Attributes
+    ----------
+        size: Size of the remote object in bytes.
+        requests: Number of range requests issued.
+        bytes_fetched: Number of bytes fetched from the store.
+        cache_hits: Number of blocks read from the on-disk cache.
+    """
+
+    def __init__(
+        self,
+        store: obstore.store.ObjectStore,
+        path: str | os.PathLike,
+        size: Optional[int] = None,
+        config: RemoteIOConfig = DEFAULT_REMOTE_IO,
+        url: Optional[str] = None,
+        version: Optional[str] = None,
+    ):
+        """Open a remote object for reading.
+
+        Parameters
+        ----------
+        store : obstore.store.ObjectStore
+            The obstore store containing the object.
+        path : str | os.PathLike
+            The path of the object within the store.
+        size : int, optional
+            The size of the object in bytes. If not provided, it is requested
+            from the store.
+        config : RemoteIOConfig, optional
+            Block size, readahead, and cache settings.
+        url : str, optional
+            URL of the object, used to key the on-disk cache.
+        version : str, optional
+            Version identifier (e.g., ETag) of the object. The on-disk cache is
+            only used when both `url` and `version` are known.
+        """
+        super().__init__()
+        self.store = store
+        self.path = str(path)
+        self.config = config
+        self.size = size if size is not None else obstore.head(store, self.path)["size"]
+        self.url = url
+        self.version = version
+        self.requests = 0
+        self.bytes_fetched = 0
+        self.cache_hits = 0
+        self._range_cache = (
+            config.range_cache() if url is not None and version is not None else None
+        )
+        self._pos = 0
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def readable(self) -> bool:
+        """Return True; the file is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return True; the file supports random access."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position in the file."""
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Change the current position in the file.
+
+        Parameters
+        ----------
+            offset: The offset relative to the position indicated by `whence`.
+            whence: io.SEEK_SET, io.SEEK_CUR, or io.SEEK_END.
+
+        Returns
+        -------
+            int: The new absolute position.
+        """
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position: {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        """Read bytes from the current position into a writable buffer.
+
+        Parameters
+        ----------
+            buffer: The writable buffer.
+
+        Returns
+        -------
+            int: The number of bytes read.
+        """
+        view = memoryview(buffer).cast("B")
+        nbytes = min(len(view), self.size - self._pos)
+        if nbytes <= 0:
+            return 0
+        view[:nbytes] = self.read_range(self._pos, self._pos + nbytes)
+        self._pos += nbytes
+        return nbytes
+
+    def read_range(self, start: int, end: int) -> bytes:
+        """Read a byte range without changing the current position.
+
+        Parameters
+        ----------
+            start: Start offset, inclusive.
+            end: End offset, exclusive.
+
+        Returns
+        -------
+            bytes: The bytes in the range.
+        """
+        end = min(end, self.size)
+        if end <= start:
+            return b""
+        block_size = self.config.block_size
+        first, last = start // block_size, (end - 1) // block_size
+        with self._lock:
+            blocks = self._get_blocks(first, last)
+        data = b"".join(blocks[i] for i in range(first, last + 1))
+        offset = start - first * block_size
+        return data[offset : offset + end - start]
+
+    def _get_blocks(self, first: int, last: int) -> Dict[int, bytes]:
+        """Get blocks `first` through `last`, fetching any that are not cached."""
+        blocks = {}
+        missing = []
+        for i in range(first, last + 1):
+            block = self._blocks.get(i)
+            if block is None:
+                missing.append(i)
+            else:
+                self._blocks.move_to_end(i)
+                blocks[i] = block
+        if missing:
+            n_blocks = -(-self.size // self.config.block_size)
+            readahead_end = min(last + self.config.readahead_blocks, n_blocks - 1)
+            missing += [
+                i for i in range(last + 1, readahead_end + 1) if i not in self._blocks
+            ]
+            fetched = self._load_blocks(missing)
+            blocks.update(
+                {i: fetched[i] for i in range(first, last + 1) if i in fetched}
+            )
+        return blocks
+
+    def _load_blocks(self, block_ids: List[int]) -> Dict[int, bytes]:
+        """Load blocks from the on-disk cache or the store into the LRU cache."""
+        loaded = self._read_cached_blocks(block_ids)
+        missing = [i for i in block_ids if i not in loaded]
+        if missing:
+            loaded.update(self._fetch_blocks(missing))
+        self._cache_blocks(loaded)
+        return loaded
+
+    def prefetch(self, ranges: List[Tuple[int, int]]) -> None:
+        """Fetch byte ranges into the block cache ahead of reads.
+
+        All missing blocks are fetched in a single `get_ranges` call, split
+        into parallel ranges of at most `max_range_size` bytes.
+
+        Parameters
+        ----------
+            ranges: (start, end) byte ranges to prefetch, end exclusive.
+        """
+        block_size = self.config.block_size
+        block_ids = set()
+        for start, end in ranges:
+            start, end = max(start, 0), min(end, self.size)
+            if end > start:
+                block_ids.update(
+                    range(start // block_size, (end - 1) // block_size + 1)
+                )
+        with self._lock:
+            missing = sorted(i for i in block_ids if i not in self._blocks)
+            if missing:
+                self._load_blocks(missing)
+
+    def prefetch_metadata(self) -> None:
+        """Prefetch the regions of an HDF file that typically hold its metadata.
+
+        Fetches the first `prefetch_bytes` and last `prefetch_tail_bytes` bytes
+        of the file, per the `RemoteIOConfig`.
+        """
+        ranges = []
+        if self.config.prefetch_bytes > 0:
+            ranges.append((0, self.config.prefetch_bytes))
+        if self.config.prefetch_tail_bytes > 0:
+            ranges.append((self.size - self.config.prefetch_tail_bytes, self.size))
+        self.prefetch(ranges)
+
+    def _block_range(self, i: int) -> Tuple[int, int]:
+        """Get the (start, end) byte range of a block."""
+        block_size = self.config.block_size
+        return i * block_size, min((i + 1) * block_size, self.size)
+
+    def _read_cached_blocks(self, block_ids: List[int]) -> Dict[int, bytes]:
+        """Read whichever of the given blocks are in the on-disk cache."""
+        if self._range_cache is None:
+            return {}
+        blocks = {}
+        for i in block_ids:
+            data = self._range_cache.get(self.url, self.version, *self._block_range(i))
+            if data is not None:
+                blocks[i] = data
+        self.cache_hits += len(blocks)
+        return blocks
+
+    def _fetch_blocks(self, block_ids: List[int]) -> Dict[int, bytes]:
+        """Fetch blocks from the store as coalesced, parallel range requests."""
+        block_size = self.config.block_size
+        max_blocks = max(1, self.config.max_range_size // block_size)
+        runs = _coalesce(block_ids, max_blocks)
+        starts = [first * block_size for first, _ in runs]
+        ends = [min((last + 1) * block_size, self.size) for _, last in runs]
+        buffers = self.fetch_ranges(starts, ends)
+        blocks = {}
+        for (first, last), data in zip(runs, buffers):
+            for i in range(first, last + 1):
+                offset = (i - first) * block_size
+                blocks[i] = bytes(data[offset : offset + block_size])
+        if self._range_cache is not None:
+            for i, block in blocks.items():
+                self._range_cache.put(
+                    self.url, self.version, *self._block_range(i), block
+                )
+        return blocks
+
+    def fetch_ranges(self, starts: List[int], ends: List[int]) -> List[memoryview]:
+        """Fetch byte ranges directly from the store in one parallel request.
+
+        The block caches are bypassed.
+
+        Parameters
+        ----------
+            starts: Start offsets, inclusive.
+            ends: End offsets, exclusive.
+
+        Returns
+        -------
+            List[memoryview]: The bytes of each range.
+        """
+        buffers = [
+            memoryview(b)
+            for b in obstore.get_ranges(self.store, self.path, starts=starts, ends=ends)
+        ]
+        self.requests += len(starts)
+        self.bytes_fetched += sum(len(b) for b in buffers)
+        return buffers
+
+    def _cache_blocks(self, blocks: Dict[int, bytes]) -> None:
+        """Add blocks to the LRU cache, evicting the least recently used."""
+        self._blocks.update(blocks)
+        max_blocks = max(1, self.config.max_cache_bytes // self.config.block_size)
+        while len(self._blocks) > max_blocks:
+            self._blocks.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the file and release the block cache."""
+        self._blocks.clear()
+        super().close()
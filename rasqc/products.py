@@ -0,0 +1,204 @@
+"""Per-run cache of data products derived from HEC-RAS HDF files."""
+
+import pandas as pd
+from rashdf import RasGeomHdf, RasPlanHdf
+import shapely
+
+from collections import OrderedDict
+from functools import wraps
+import sys
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+DEFAULT_PRODUCT_CACHE_BYTES = 2 * 1024**3
+
+# Approximate memory used by a shapely geometry, excluding its coordinates
+_GEOMETRY_OVERHEAD_BYTES = 100
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory used by a cached product in bytes."""
+    if isinstance(value, pd.DataFrame):
+        geom_cols = [c for c in value.columns if value[c].dtype == "geometry"]
+        size = int(value.drop(columns=geom_cols).memory_usage(deep=True).sum())
+        for col in geom_cols:
+            geoms = value[col].values
+            n_coords = int(shapely.get_num_coordinates(geoms).sum())
+            size += len(geoms) * _GEOMETRY_OVERHEAD_BYTES + n_coords * 16
+        return size
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items()
+        )
+    if hasattr(value, "nbytes"):  # NumPy arrays, MeshArrays, MeshMetrics
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+def _copy(value: Any) -> Any:
+    """Copy a cached product so callers can modify it freely."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, (dict, list)):
+        return type(value)(value)
+    return value
+
+
+class ProductCache:
+    """Thread-safe, size-capped LRU cache of derived data products.
+
+    Products are computed once per key and returned as copies, so checkers can
+    modify what they get without affecting each other. Concurrent requests for
+    the same key wait for a single computation.
+
+    Attributes
+    ----------
+        max_bytes: Approximate maximum memory used by cached products.
+        hits: Number of requests served from the cache.
+        misses: Number of requests that computed a product.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_PRODUCT_CACHE_BYTES):
+        """Instantiate an empty ProductCache.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Approximate maximum memory used by cached products. Products larger
+            than this are returned without being cached.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._products: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get a product, computing and caching it if needed.
+
+        Parameters
+        ----------
+            key: The product key.
+            compute: Function computing the product.
+
+        Returns
+        -------
+            A copy of the product.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                cached = self._products.get(key)
+                if cached is not None:
+                    self._products.move_to_end(key)
+                    self.hits += 1
+                    return _copy(cached[0])
+            value = compute()
+            size = _estimate_size(value)
+            with self._lock:
+                self.misses += 1
+                if size <= self.max_bytes:
+                    self._products[key] = (value, size)
+                    self._total_bytes += size
+                    while self._total_bytes > self.max_bytes:
+                        _, (_, evicted_size) = self._products.popitem(last=False)
+                        self._total_bytes -= evicted_size
+            return _copy(value)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Remove cached products.
+
+        Parameters
+        ----------
+            name: Name of the product (method) to remove. If None, all
+                products are removed.
+        """
+        with self._lock:
+            for key in list(self._products):
+                if name is None or key[0] == name:
+                    _, size = self._products.pop(key)
+                    self._total_bytes -= size
+
+    @property
+    def total_bytes(self) -> int:
+        """Approximate memory used by cached products."""
+        return self._total_bytes
+
+
+def _cached(method: Callable) -> Callable:
+    """Memoize an HDF method in the file's `product_cache`.
+
+    Products are keyed by the qualified name of the method, so an override
+    calling the method it overrides (e.g. `RasPlanHdf.mesh_cell_faces` calling
+    `RasGeomHdf.mesh_cell_faces`) gets its own entry.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            method.__name__,
+            method.__qualname__,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        return self.product_cache.get(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+class CachedRasGeomHdf(RasGeomHdf):
+    """RasGeomHdf whose expensive products are memoized for the life of a run."""
+
+    product_cache: ProductCache
+
+    def __init__(
+        self, name: Any, product_cache: Optional[ProductCache] = None, **kwargs
+    ):
+        """Open a HEC-RAS Geometry HDF file.
+
+        Parameters
+        ----------
+        name : Any
+            The path to (or file object of) the RAS Geometry HDF file.
+        product_cache : ProductCache, optional
+            The cache of derived products. A new cache is used if not provided.
+        kwargs : dict
+            Additional keyword arguments to pass to h5py.File
+        """
+        super().__init__(name, **kwargs)
+        self.product_cache = product_cache or ProductCache()
+
+    mesh_area_names = _cached(RasGeomHdf.mesh_area_names)
+    mesh_cell_faces = _cached(RasGeomHdf.mesh_cell_faces)
+    mesh_cell_points = _cached(RasGeomHdf.mesh_cell_points)
+    mesh_cell_polygons = _cached(RasGeomHdf.mesh_cell_polygons)
+    get_geom_attrs = _cached(RasGeomHdf.get_geom_attrs)
+    get_geom_2d_flow_area_attrs = _cached(RasGeomHdf.get_geom_2d_flow_area_attrs)
+    bc_lines = _cached(RasGeomHdf.bc_lines)
+    breaklines = _cached(RasGeomHdf.breaklines)
+    refinement_regions = _cached(RasGeomHdf.refinement_regions)
+    structures = _cached(RasGeomHdf.structures)
+
+
+class CachedRasPlanHdf(RasPlanHdf, CachedRasGeomHdf):
+    """RasPlanHdf whose expensive products are memoized for the life of a run.
+
+    `RasPlanHdf` overrides some geometry products to add results, and precedes
+    `CachedRasGeomHdf` in the method resolution order, so those overrides are
+    memoized here as well.
+    """
+
+    mesh_cell_faces = _cached(RasPlanHdf.mesh_cell_faces)
+    mesh_cell_points = _cached(RasPlanHdf.mesh_cell_points)
+    mesh_cell_polygons = _cached(RasPlanHdf.mesh_cell_polygons)
+    bc_lines = _cached(RasPlanHdf.bc_lines)
+    get_plan_param_attrs = _cached(RasPlanHdf.get_plan_param_attrs)
+    get_results_unsteady_summary_attrs = _cached(
+        RasPlanHdf.get_results_unsteady_summary_attrs
+    )
+    get_meteorology_precip_attrs = _cached(RasPlanHdf.get_meteorology_precip_attrs)
@@ -0,0 +1,136 @@
+"""Persistent on-disk cache of byte ranges of remote files."""
+
+from hashlib import sha256
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Optional
+
+# Environment variable used to enable the cache and set its directory
+CACHE_DIR_ENV = "RASQC_CACHE_DIR"
+
+DEFAULT_CACHE_MAX_BYTES = 10 * 1024**3
+
+
+class RangeCache:
+    """Content-addressed, size-bounded LRU cache of remote byte ranges.
+
+    Each entry is a file keyed by the object URL, its version (ETag), and the
+    byte range, so a changed object never returns stale data. When the total
+    size exceeds `max_bytes`, the least recently used entries are evicted.
+    The cache can be shared by several processes. It owns its directory: any
+    file in its subdirectories counts as an entry.
+
+    Attributes
+    ----------
+        directory: The cache directory.
+        max_bytes: Maximum total size of the cache in bytes.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike, max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    ):
+        """Open (creating if needed) a range cache directory.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike
+            The cache directory.
+        max_bytes : int, optional
+            Maximum total size of the cache in bytes.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _entry_path(self, url: str, version: str, start: int, end: int) -> Path:
+        """Get the path of the cache entry for a byte range."""
+        key = sha256(f"{url}\0{version}\0{start}\0{end}".encode()).hexdigest()
+        return self.directory / key[:2] / key
+
+    def get(self, url: str, version: str, start: int, end: int) -> Optional[bytes]:
+        """Get a cached byte range.
+
+        Parameters
+        ----------
+            url: URL of the remote object.
+            version: Version identifier (e.g., ETag) of the remote object.
+            start: Start offset, inclusive.
+            end: End offset, exclusive.
+
+        Returns
+        -------
+            bytes: The cached bytes, or None if the range is not cached.
+        """
+        path = self._entry_path(url, version, start, end)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, url: str, version: str, start: int, end: int, data: bytes) -> None:
+        """Add a byte range to the cache, evicting old entries if needed.
+
+        Parameters
+        ----------
+            url: URL of the remote object.
+            version: Version identifier (e.g., ETag) of the remote object.
+            start: Start offset, inclusive.
+            end: End offset, exclusive.
+            data: The bytes in the range.
+        """
+        path = self._entry_path(url, version, start, end)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[os.DirEntry]:
+        """List all cache entries."""
+        return [
+            entry
+            for subdir in os.scandir(self.directory)
+            if subdir.is_dir()
+            for entry in os.scandir(subdir.path)
+            if entry.is_file() and not entry.name.startswith("tmp")
+        ]
+
+    def _scan_total(self) -> int:
+        """Get the total size of all cache entries."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits `max_bytes`."""
+        entries = sorted(
+            ((entry.stat(), entry.path) for entry in self._entries()),
+            key=lambda e: e[0].st_mtime,
+        )
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= stat.st_size
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for entry in self._entries():
+            os.remove(entry.path)
+        self._total_bytes = 0
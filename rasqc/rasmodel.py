@@ -1,25 +1,139 @@
 """HEC-RAS model file and model classes."""
 
+from .obstore_file import DEFAULT_REMOTE_IO, ObstoreFile, RemoteIOConfig
+from .tracing import span, traced
+
 import obstore
-from rashdf import RasGeomHdf, RasPlanHdf
 
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
 import os
 from pathlib import Path
 import re
-from typing import List, Optional
+import threading
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    # rashdf, numpy and the HDF helpers are slow to import, so they are
+    # imported when an HDF file is first opened rather than with the module
+    from .chunk_index import ChunkIndex
+    from .mesh import MeshArrays, MeshMetrics
+    from .products import ProductCache
+
+    import numpy as np
+    from obstore import ObjectMeta
+    from rashdf import RasGeomHdf, RasPlanHdf
+    from rashdf.base import RasHdf
+
+# Maximum number of model text files fetched at once by `RasModel.open_async`
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Model files accessed in the current context, as (kind, filename) pairs where
+# kind is "content" (the text file) or "hdf" (the associated HDF file)
+_accessed_files: ContextVar[Optional[Set[Tuple[str, str]]]] = ContextVar(
+    "accessed_files", default=None
+)
+
+
+@contextmanager
+def track_file_access() -> Iterator[Set[Tuple[str, str]]]:
+    """Record the model files accessed within the context.
+
+    Accesses are recorded per thread (context), so checks running concurrently
+    record their own accesses.
+
+    Yields
+    ------
+        Set[Tuple[str, str]]: The accessed files as (kind, filename) pairs, where
+        kind is "content" for the text file or "hdf" for its HDF file.
+    """
+    accessed = set()
+    token = _accessed_files.set(accessed)
+    try:
+        yield accessed
+    finally:
+        _accessed_files.reset(token)
 
 
-def _obstore_file_exists(
+def _record_access(kind: str, filename: str) -> None:
+    """Record an access to a model file if access is being tracked."""
+    accessed = _accessed_files.get()
+    if accessed is not None:
+        accessed.add((kind, filename))
+
+
+def _obstore_head(
     store: obstore.store.ObjectStore, path: str | os.PathLike
-) -> bool:
+) -> Optional["ObjectMeta"]:
+    """Get the metadata of a remote object, or None if it does not exist."""
     if path is None:
-        return False
+        return None
     try:
-        store.head(str(path))
-        return True
+        return obstore.head(store, str(path))
     except FileNotFoundError:
-        return False
+        return None
+
+
+# Errors raised by stores that cannot list their objects (e.g. an HTTP server
+# without WebDAV rejecting PROPFIND, or a bucket policy without list access)
+_LIST_ERRORS = (
+    obstore.exceptions.GenericError,
+    obstore.exceptions.NotSupportedError,
+    obstore.exceptions.PermissionDeniedError,
+)
+
+
+def _can_list(store: obstore.store.ObjectStore) -> bool:
+    """Whether a store is expected to support listing its objects."""
+    return not isinstance(store, obstore.store.HTTPStore)
+
+
+def _list_store(
+    store: obstore.store.ObjectStore,
+) -> Optional[Dict[str, "ObjectMeta"]]:
+    """List the objects directly under the store prefix, keyed by path.
+
+    Returns None if the store cannot be listed, in which case existence and
+    metadata of the model files are looked up per file.
+    """
+    if not _can_list(store):
+        return None
+    try:
+        listing = obstore.list_with_delimiter(store)
+    except _LIST_ERRORS:
+        return None
+    return {meta["path"]: meta for meta in listing["objects"]}
+
+
+async def _list_store_async(
+    store: obstore.store.ObjectStore,
+) -> Optional[Dict[str, "ObjectMeta"]]:
+    """List the objects directly under the store prefix, keyed by path.
+
+    Returns None if the store cannot be listed (see `_list_store`).
+    """
+    if not _can_list(store):
+        return None
+    try:
+        listing = await obstore.list_with_delimiter_async(store)
+    except _LIST_ERRORS:
+        return None
+    return {meta["path"]: meta for meta in listing["objects"]}
+
+
+def _decode_content(content: bytes) -> str:
+    """Decode the raw bytes of a remote RAS text file."""
+    return content.decode("utf-8").replace("\r\n", "\n")  # normalize line endings
+
+
+async def _read_remote_async(store: obstore.store.ObjectStore, path: str) -> str:
+    """Fetch and decode a remote RAS text file."""
+    result = await obstore.get_async(store, path)
+    content = await result.bytes_async()
+    return _decode_content(content.to_bytes())
 
 
 def _get_hdf_path(path: Path) -> Optional[Path]:
@@ -38,14 +152,21 @@ class RasModelFile:
     ----------
     path: Path to the file.
     hdf_path: Path to the associated HDF file, if applicable.
+    listing: Listing of the remote model prefix, keyed by path, if available.
+    content: Text content of the file.
     """
 
     local: bool
     store: Optional[obstore.store.ObjectStore] = None
     hdf_path: Optional[Path] = None
+    listing: Optional[Dict[str, "ObjectMeta"]] = None
 
     def __init__(
-        self, path: str | os.PathLike, store: Optional[obstore.store.ObjectStore] = None
+        self,
+        path: str | os.PathLike,
+        store: Optional[obstore.store.ObjectStore] = None,
+        content: Optional[str] = None,
+        listing: Optional[Dict[str, "ObjectMeta"]] = None,
     ):
         """Instantiate a RasModelFile object by the file path.
 
@@ -55,6 +176,11 @@ class RasModelFile:
             The absolute path to the RAS file.
         store : obstore.store.ObjectStore, optional
             The obstore file system object. If not provided, it will be created based on the path.
+        content : str, optional
+            The already-fetched text content of the file. If not provided, it will be read.
+        listing : dict, optional
+            Listing of the remote model prefix, keyed by path. Used in place of
+            per-file metadata requests when provided.
         """
         # local file
         if not store and os.path.exists(path):
@@ -63,7 +189,7 @@ class RasModelFile:
             self.filename = os.path.basename(path)
             self.path = Path(path)
             self.hdf_path = _get_hdf_path(self.path)
-            self.content = open(path, "r").read()
+            self.content = content if content is not None else open(path, "r").read()
 
         # remote file
         else:
@@ -76,14 +202,78 @@ class RasModelFile:
             self.filename = os.path.basename(path)
             self.path = Path(self.filename)
             self.hdf_path = _get_hdf_path(self.path)
+            self.listing = listing
             self.content = (
-                obstore.open_reader(self.store, self.filename)
-                .readall()
-                .to_bytes()
-                .decode("utf-8")
-                .replace("\r\n", "\n")  # normalize line endings
+                content
+                if content is not None
+                else _decode_content(
+                    obstore.open_reader(self.store, self.filename).readall().to_bytes()
+                )
             )
 
+    @property
+    def content(self) -> str:
+        """Get the text content of the file."""
+        _record_access("content", self.filename)
+        return self._content
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._content = content
+
+    @property
+    def uri(self) -> str:
+        """Get the absolute path (local) or URL (remote) of the file."""
+        if self.local:
+            return os.path.abspath(self.path)
+        return _obstore_protocol_url(self.store, self.path)[1]
+
+    def _fingerprint(self, path: Optional[Path]) -> Optional[List]:
+        """Get the size and modification time (local) or ETag (remote) of a file."""
+        if path is None:
+            return None
+        if self.local:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return None
+            return [stat.st_size, stat.st_mtime_ns]
+        meta = self._remote_meta(path)
+        if meta is None:
+            return None
+        version = meta.get("e_tag") or meta.get("version")
+        return [meta["size"], version or meta["last_modified"].isoformat()]
+
+    def fingerprint(self) -> Optional[List]:
+        """Get a fingerprint of the file that changes whenever the file changes.
+
+        Returns
+        -------
+            list: The size and modification time (local) or ETag (remote) of the
+            file, or None if it does not exist.
+        """
+        return self._fingerprint(self.path)
+
+    def _remote_meta(self, path: Optional[Path]) -> Optional["ObjectMeta"]:
+        """Get the metadata of a remote model object, or None if it does not exist."""
+        if path is None:
+            return None
+        if self.listing is not None:
+            return self.listing.get(str(path))
+        return _obstore_head(self.store, path)
+
+    @property
+    def meta(self) -> Optional["ObjectMeta"]:
+        """Get the remote object metadata (size, ETag, etc.) of the file.
+
+        Returns
+        -------
+            ObjectMeta: The object metadata, or None for local files.
+        """
+        if self.local:
+            return None
+        return self._remote_meta(self.path)
+
     @property
     def title(self):
         """Extract the title from the RAS file.
@@ -133,36 +323,282 @@ def _obstore_protocol_url(
             )
 
 
-class GeomFile(RasModelFile):
-    """HEC-RAS geometry file class."""
+class _HdfModelFile(RasModelFile):
+    """HEC-RAS model file with an associated, lazily-opened HDF file.
 
-    _hdf_path: str
-    hdf: Optional[RasGeomHdf] = None
+    The HDF file is not opened (or probed for existence) until the `hdf`
+    attribute is first accessed. The opened handle is memoized until `close`
+    is called. Remote HDF files are read through an `ObstoreFile`.
+
+    Expensive products derived from the HDF file (mesh faces, structures,
+    attributes, etc.) are memoized in `products` so that checkers share them
+    for the life of the run.
+    """
+
+    _hdf: Optional["RasHdf"] = None
+    _hdf_opened: bool = False
+    _reader: Optional[ObstoreFile] = None
+    _chunk_index: Optional["ChunkIndex"] = None
+    _products: Optional["ProductCache"] = None
 
     def __init__(
-        self, path: str | os.PathLike, store: Optional[obstore.store.ObjectStore] = None
+        self,
+        path: str | os.PathLike,
+        store: Optional[obstore.store.ObjectStore] = None,
+        content: Optional[str] = None,
+        listing: Optional[Dict[str, "ObjectMeta"]] = None,
+        remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+        products: Optional["ProductCache"] = None,
     ):
-        """Instantiate a GeomFile object by the file path.
+        """Instantiate a model file by the file path.
 
         Parameters
         ----------
         path : str | os.Pathlike
-            The absolute path to the RAS geometry file.
+            The absolute path to the RAS file.
         store : obstore.store.ObjectStore, optional
             The obstore file system object. If not provided, it will be created based on the path.
+        content : str, optional
+            The already-fetched text content of the file. If not provided, it will be read.
+        listing : dict, optional
+            Listing of the remote model prefix, keyed by path. Used in place of
+            per-file metadata requests when provided.
+        remote_io : RemoteIOConfig, optional
+            Settings for reading the HDF file if it is remote.
+        products : ProductCache, optional
+            Cache of products derived from the HDF file. A new cache with the
+            default memory cap is used if not provided.
+        """
+        super().__init__(path, store, content, listing)
+        self.remote_io = remote_io
+        self._products = products
+        self._lock = threading.RLock()  # guards lazy opening across check threads
+
+    @property
+    def _hdf_class(self) -> type:
+        """Get the class used to open the associated HDF file."""
+        from rashdf.base import RasHdf
+
+        return RasHdf
+
+    @property
+    def products(self) -> "ProductCache":
+        """Get the cache of products derived from the associated HDF file."""
+        if self._products is None:
+            from .products import ProductCache
+
+            with self._lock:
+                if self._products is None:
+                    self._products = ProductCache()
+        return self._products
+
+    def _open_reader(self) -> ObstoreFile:
+        """Open (or get the already open) reader of the remote HDF file."""
+        with self._lock:
+            if self._reader is None:
+                hdf_meta = self.hdf_meta
+                _, url = _obstore_protocol_url(self.store, self.hdf_path)
+                self._reader = ObstoreFile(
+                    self.store,
+                    self.hdf_path,
+                    hdf_meta["size"],
+                    self.remote_io,
+                    url=url,
+                    version=hdf_meta.get("e_tag") or hdf_meta.get("version"),
+                )
+            return self._reader
+
+    def _open_hdf(self) -> Optional["RasHdf"]:
+        """Open the associated HDF file, if it exists.
+
+        Returns
+        -------
+            RasHdf: The opened HDF file, or None if it does not exist.
+        """
+        if not self.local:
+            if self.hdf_meta is None:
+                return None
+            reader = self._open_reader()
+            reader.prefetch_metadata()
+            hdf = self._hdf_class(reader, product_cache=self.products)
+            hdf._loc = reader.url
+            return hdf
+        if os.path.exists(self.hdf_path):
+            return self._hdf_class(self.hdf_path, product_cache=self.products)
+        return None
+
+    @property
+    def chunk_index(self) -> Optional["ChunkIndex"]:
+        """Get the chunk index of the remote HDF file, if enabled.
+
+        The index is loaded from its sidecar file in the cache directory. If
+        there is none for the current version of the HDF file, it is built
+        from the HDF file and saved there for later runs.
+
+        Returns
+        -------
+            ChunkIndex: The chunk index, or None if disabled, local, or missing.
+        """
+        if self._chunk_index is not None:
+            return self._chunk_index
+        cache_dir = self.remote_io.resolved_cache_dir()
+        if self.local or not self.remote_io.chunk_index or not cache_dir:
+            return None
+        hdf_meta = self.hdf_meta
+        version = hdf_meta and (hdf_meta.get("e_tag") or hdf_meta.get("version"))
+        if not version:
+            return None
+        from .chunk_index import ChunkIndex, chunk_index_path
+
+        _, url = _obstore_protocol_url(self.store, self.hdf_path)
+        path = chunk_index_path(cache_dir, url, version)
+        with self._lock:
+            if self._chunk_index is None:
+                if path.exists():
+                    self._chunk_index = ChunkIndex.load(path)
+                else:
+                    self._chunk_index = ChunkIndex.from_hdf(self.hdf)
+                    self._chunk_index.save(path)
+            return self._chunk_index
+
+    def read_dataset(self, name: str) -> "np.ndarray":
+        """Read a dataset from the associated HDF file.
+
+        Remote datasets are read with parallel range requests through the chunk
+        index when it is enabled, without traversing the HDF metadata.
+
+        Parameters
+        ----------
+            name: Path of the dataset within the HDF file.
+
+        Returns
+        -------
+            np.ndarray: The dataset values.
+        """
+        _record_access("hdf", self.filename)
+        chunk_index = self.chunk_index
+        if chunk_index is not None and name in chunk_index:
+            return chunk_index.read(self._open_reader(), name)
+        return self.hdf[name][()]
+
+    def hdf_fingerprint(self) -> Optional[List]:
+        """Get a fingerprint of the associated HDF file (see `fingerprint`).
+
+        Returns
+        -------
+            list: The fingerprint, or None if the HDF file does not exist.
+        """
+        return self._fingerprint(self.hdf_path)
+
+    @property
+    def hdf_meta(self) -> Optional["ObjectMeta"]:
+        """Get the remote object metadata (size, ETag, etc.) of the HDF file.
+
+        Returns
+        -------
+            ObjectMeta: The object metadata, or None for local or missing files.
+        """
+        if self.local:
+            return None
+        return self._remote_meta(self.hdf_path)
+
+    @property
+    def hdf(self) -> Optional["RasHdf"]:
+        """Get the associated HDF file, opening it on first access.
+
+        Returns
+        -------
+            RasHdf: The associated HDF file, or None if it does not exist.
+        """
+        _record_access("hdf", self.filename)
+        with self._lock:
+            if not self._hdf_opened:
+                with span(f"open {self.hdf_path}", "hdf", path=str(self.hdf_path)):
+                    self._hdf = self._open_hdf()
+                self._hdf_opened = True
+            return self._hdf
+
+    @property
+    def io_stats(self) -> Dict[str, int]:
+        """Get the I/O statistics of the remote HDF file.
+
+        Returns
+        -------
+            dict: Numbers of range requests, bytes fetched, and on-disk cache
+            hits. All are zero for local or unopened HDF files.
+        """
+        reader = self._reader
+        return {
+            "requests": reader.requests if reader else 0,
+            "bytes_fetched": reader.bytes_fetched if reader else 0,
+            "cache_hits": reader.cache_hits if reader else 0,
+        }
+
+    def close(self) -> None:
+        """Close the associated HDF file and drop its cached products."""
+        if self._products is not None:
+            self._products.invalidate()
+        if self._hdf is not None:
+            self._hdf.close()
+        if self._reader is not None:
+            self._reader.close()
+        self._hdf = None
+        self._reader = None
+        self._chunk_index = None
+        self._hdf_opened = False
+
+
+class GeomFile(_HdfModelFile):
+    """HEC-RAS geometry file class."""
+
+    _hdf: Optional["RasGeomHdf"] = None
+
+    @property
+    def _hdf_class(self) -> type:
+        """Get the class used to open the associated HDF file."""
+        from .products import CachedRasGeomHdf
+
+        return CachedRasGeomHdf
+
+    def mesh_arrays(self) -> Dict[str, "MeshArrays"]:
+        """Get the arrays of each 2D flow area mesh of the geometry.
+
+        Each mesh is read from the HDF file when first requested and kept in
+        `products`, so checks share one compact copy.
+
+        Returns
+        -------
+            dict: The arrays of each 2D flow area, keyed by name, in file order.
+        """
+        from .mesh import MeshArrays, MeshMetrics
+
+        return {
+            mesh_name: self.products.get(
+                ("mesh_arrays", mesh_name),
+                lambda mesh_name=mesh_name, i=i: MeshArrays.from_geom_file(
+                    self, mesh_name, i
+                ),
+            )
+            for i, mesh_name in enumerate(self.hdf.mesh_area_names())
+        }
+
+    def mesh_metrics(self) -> Dict[str, "MeshMetrics"]:
+        """Get the quality metrics of each 2D flow area mesh of the geometry.
+
+        Metrics are computed from `mesh_arrays` in one pass per mesh when first
+        requested and kept in `products`, so checks of different metrics share
+        one computation.
+
+        Returns
+        -------
+            dict: The metrics of each 2D flow area, keyed by name, in file order.
         """
-        super().__init__(path, store)
-        if store and _obstore_file_exists(self.store, self.hdf_path):
-            _, url = _obstore_protocol_url(self.store, self.hdf_path)
-            self.hdf = RasGeomHdf.open_uri(
-                url,
-                fsspec_kwargs={
-                    "default_cache_type": "blockcache",
-                    "default_block_size": 10**5,
-                },
+        return {
+            mesh_name: self.products.get(
+                ("mesh_metrics", mesh_name), lambda mesh=mesh: mesh.metrics()
             )
-        elif os.path.exists(self.hdf_path):
-            self.hdf = RasGeomHdf(self.hdf_path)
+            for mesh_name, mesh in self.mesh_arrays().items()
+        }
 
     def last_updated(self) -> datetime:
         """Get the last updated date of the file.
@@ -202,36 +638,17 @@ class UnsteadyFlowFile(RasModelFile):
     pass
 
 
-class PlanFile(RasModelFile):
+class PlanFile(_HdfModelFile):
     """HEC-RAS plan file class."""
 
-    _hdf_path: str = None
-    hdf: Optional[RasPlanHdf] = None
+    _hdf: Optional["RasPlanHdf"] = None
 
-    def __init__(
-        self, path: str | os.PathLike, store: Optional[obstore.store.ObjectStore] = None
-    ):
-        """Instantiate a PlanFile object by the file path.
+    @property
+    def _hdf_class(self) -> type:
+        """Get the class used to open the associated HDF file."""
+        from .products import CachedRasPlanHdf
 
-        Parameters
-        ----------
-        path : str | os.Pathlike
-            The absolute path to the RAS geometry file.
-        store : obstore.store.ObjectStore, optional
-            The obstore file system object. If not provided, it will be created based on the path.
-        """
-        super().__init__(path, store)
-        if store and _obstore_file_exists(self.store, self.hdf_path):
-            _, url = _obstore_protocol_url(self.store, self.hdf_path)
-            self.hdf = RasPlanHdf.open_uri(
-                url,
-                fsspec_kwargs={
-                    "default_cache_type": "blockcache",
-                    "default_block_size": 10**5,
-                },
-            )
-        elif os.path.exists(self.hdf_path):
-            self.hdf = RasPlanHdf(self.hdf_path)
+        return CachedRasPlanHdf
 
     @property
     def geom_file_ext(self) -> str:
@@ -269,6 +686,38 @@ class PlanFile(RasModelFile):
         return match.group(1).strip()
 
 
+@dataclass
+class ModelDescriptor:
+    """Lightweight, picklable description of an opened HEC-RAS model.
+
+    Used to reopen the same model in another process (e.g., a check worker)
+    without sending file contents or open HDF handles.
+
+    Attributes
+    ----------
+        prj_file: Absolute path of a local '.prj' file, or its filename within `store`.
+        store: The obstore store of a remote model.
+        listing: Listing of the remote model prefix, keyed by path.
+        remote_io: Settings for reading remote geometry and plan HDF files.
+    """
+
+    prj_file: str
+    store: Optional[obstore.store.ObjectStore] = None
+    listing: Optional[Dict[str, "ObjectMeta"]] = None
+    remote_io: RemoteIOConfig = field(default_factory=RemoteIOConfig)
+
+    def open(self) -> "RasModel":
+        """Open the described model.
+
+        Returns
+        -------
+            RasModel: The HEC-RAS model.
+        """
+        return RasModel(
+            self.prj_file, self.store, listing=self.listing, remote_io=self.remote_io
+        )
+
+
 class RasModel:
     """HEC-RAS model class.
 
@@ -284,41 +733,195 @@ class RasModel:
     unsteady_flow_files: dict[str, UnsteadyFlowFile]
     plan_files: dict[str, PlanFile]
     current_plan_ext: Optional[str]
+    listing: Optional[Dict[str, "ObjectMeta"]]
 
-    def __init__(self, prj_file: str | os.PathLike):
+    @traced("RasModel.__init__", "model")
+    def __init__(
+        self,
+        prj_file: str | os.PathLike,
+        store: Optional[obstore.store.ObjectStore] = None,
+        contents: Optional[Dict[str, str]] = None,
+        listing: Optional[Dict[str, "ObjectMeta"]] = None,
+        remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+    ):
         """Instantiate a RasModel object by the '.prj' file path.
 
         Parameters
         ----------
         prj_file : str | os.Pathlike
             The absolute path to the RAS '.prj' file.
+        store : obstore.store.ObjectStore, optional
+            The obstore file system object. If not provided, it will be created based on the path.
+        contents : dict, optional
+            Already-fetched text contents of the model files, keyed by filename
+            (e.g., as fetched by `open_async`). Files not included are read as needed.
+        listing : dict, optional
+            Listing of the remote model prefix, keyed by path. If not provided for
+            a remote model, the prefix is listed once and shared by all model files;
+            stores that cannot be listed fall back to a HEAD request per file.
+        remote_io : RemoteIOConfig, optional
+            Settings for reading remote geometry and plan HDF files.
         """
-        self.prj_file = RasModelFile(prj_file)
+        contents = contents or {}
+        self.prj_file = RasModelFile(
+            prj_file, store, contents.get(os.path.basename(prj_file)), listing
+        )
+        if not self.prj_file.local and listing is None:
+            listing = _list_store(self.prj_file.store)
+            self.prj_file.listing = listing
+        self.listing = listing
+        self.remote_io = remote_io
         self.title = self.prj_file.title
         self.geom_files = {}
         self.unsteady_flow_files = {}
         self.plan_files = {}
 
+        def _model_file(cls: type, suf: str, **kwargs) -> RasModelFile:
+            path = self.prj_file.path.with_suffix("." + suf)
+            store = self.prj_file.store
+            return cls(path, store, contents.get(path.name), listing, **kwargs)
+
         for suf in re.findall(r"(?m)Geom File\s*=\s*(.+)$", self.prj_file.content):
-            self.geom_files[suf] = GeomFile(
-                self.prj_file.path.with_suffix("." + suf), self.prj_file.store
-            )
+            self.geom_files[suf] = _model_file(GeomFile, suf, remote_io=remote_io)
 
         for suf in re.findall(r"(?m)Unsteady File\s*=\s*(.+)$", self.prj_file.content):
-            self.unsteady_flow_files[suf] = UnsteadyFlowFile(
-                self.prj_file.path.with_suffix("." + suf), self.prj_file.store
-            )
+            self.unsteady_flow_files[suf] = _model_file(UnsteadyFlowFile, suf)
 
         for suf in re.findall(r"(?m)Plan File\s*=\s*(.+)$", self.prj_file.content):
-            self.plan_files[suf] = PlanFile(
-                self.prj_file.path.with_suffix("." + suf), self.prj_file.store
-            )
+            self.plan_files[suf] = _model_file(PlanFile, suf, remote_io=remote_io)
 
         current_plan_ext = re.search(
             r"(?m)Current Plan\s*=\s*(.+)$", self.prj_file.content
         )
         self.current_plan_ext = current_plan_ext.group(1) if current_plan_ext else None
 
+    @classmethod
+    async def open_async(
+        cls,
+        prj_file: str | os.PathLike,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+    ) -> "RasModel":
+        """Open a RasModel, fetching remote model text files concurrently.
+
+        The '.prj' file is fetched first, then all geometry, unsteady flow, and
+        plan files it references are fetched concurrently. Local models are
+        opened as usual.
+
+        Parameters
+        ----------
+        prj_file : str | os.Pathlike
+            The absolute path or URL to the RAS '.prj' file.
+        max_concurrency : int, optional
+            The maximum number of files to fetch at once.
+        remote_io : RemoteIOConfig, optional
+            Settings for reading remote geometry and plan HDF files.
+
+        Returns
+        -------
+            RasModel: The opened HEC-RAS model.
+        """
+        if os.path.exists(prj_file):
+            return cls(prj_file, remote_io=remote_io)
+        store = obstore.store.from_url(os.path.dirname(prj_file))
+        prj_filename = os.path.basename(prj_file)
+        prj_content = await _read_remote_async(store, prj_filename)
+        stem = Path(prj_filename).stem
+        filenames = {
+            f"{stem}.{suf}"
+            for suf in re.findall(
+                r"(?m)(?:Geom|Unsteady|Plan) File\s*=\s*(.+)$", prj_content
+            )
+        }
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch(filename: str) -> tuple[str, str]:
+            async with semaphore:
+                return filename, await _read_remote_async(store, filename)
+
+        listing, *fetched = await asyncio.gather(
+            _list_store_async(store), *(_fetch(f) for f in filenames)
+        )
+        contents = dict(fetched)
+        contents[prj_filename] = prj_content
+        return cls(prj_filename, store, contents, listing, remote_io)
+
+    @classmethod
+    @traced("RasModel.open", "model")
+    def open(
+        cls,
+        prj_file: str | os.PathLike,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+    ) -> "RasModel":
+        """Open a RasModel, fetching remote model text files concurrently.
+
+        Synchronous wrapper around `open_async`. Local models, and models opened
+        from within a running event loop (e.g., in Jupyter or an async service),
+        are opened synchronously, fetching remote files one at a time.
+
+        Parameters
+        ----------
+        prj_file : str | os.Pathlike
+            The absolute path or URL to the RAS '.prj' file.
+        max_concurrency : int, optional
+            The maximum number of files to fetch at once.
+        remote_io : RemoteIOConfig, optional
+            Settings for reading remote geometry and plan HDF files.
+
+        Returns
+        -------
+            RasModel: The opened HEC-RAS model.
+        """
+        if os.path.exists(prj_file):
+            return cls(prj_file, remote_io=remote_io)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:  # no running loop
+            return asyncio.run(cls.open_async(prj_file, max_concurrency, remote_io))
+        return cls(prj_file, remote_io=remote_io)
+
+    def model_files(self) -> Dict[str, RasModelFile]:
+        """Get all files of the model, keyed by filename.
+
+        Returns
+        -------
+            dict: The project, geometry, unsteady flow, and plan files.
+        """
+        files = [
+            self.prj_file,
+            *self.geom_files.values(),
+            *self.unsteady_flow_files.values(),
+            *self.plan_files.values(),
+        ]
+        return {model_file.filename: model_file for model_file in files}
+
+    def descriptor(self) -> ModelDescriptor:
+        """Describe the model so that it can be reopened in another process.
+
+        Returns
+        -------
+            ModelDescriptor: The model descriptor.
+        """
+        if self.prj_file.local:
+            return ModelDescriptor(os.path.abspath(self.prj_file.path), None)
+        return ModelDescriptor(
+            self.prj_file.filename, self.prj_file.store, self.listing, self.remote_io
+        )
+
+    def close(self) -> None:
+        """Close any geometry and plan HDF files opened by this model."""
+        for model_file in [*self.geom_files.values(), *self.plan_files.values()]:
+            model_file.close()
+
+    def __enter__(self) -> "RasModel":
+        """Enter a context in which opened HDF files are closed on exit."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close any opened HDF files on exiting the context."""
+        self.close()
+
     @property
     def current_plan(self) -> PlanFile:
         """Get the current plan file referenced in the project file.
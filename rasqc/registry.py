@@ -4,12 +4,37 @@ from .checksuite import CheckSuite, StacCheckSuite
 
 from typing import Dict, List
 
+# Checker modules (in `rasqc.checkers`) registering the checks of each suite.
+# They are imported when a suite's checks are first needed.
+CHECKSUITE_MODULES: Dict[str, List[str]] = {
+    "ffrd": ["naming", "projection", "hdfsync", "plan_settings", "stability"],
+    "ras_stac_ffrd": ["stac_naming"],
+    "hms_stac_ffrd": ["stac_naming"],
+    "ble": [
+        "projection",
+        "hdfsync",
+        "plan_settings",
+        "file_structure",
+        "event_conditions",
+        "volume_accounting",
+        "structures",
+        "associated_layers",
+        "breaklines",
+        "current_plan",
+        "erroneous_cells",
+        "ras_version",
+        "refinement_regions",
+        "short_cell_faces",
+        "mesh_quality",
+    ],
+}
+
 # Dictionary of available check suites
 CHECKSUITES: Dict[str, "CheckSuite"] = {
-    "ffrd": CheckSuite(),
-    "ras_stac_ffrd": StacCheckSuite(),
-    "hms_stac_ffrd": StacCheckSuite(),
-    "ble": CheckSuite(),
+    "ffrd": CheckSuite(CHECKSUITE_MODULES["ffrd"]),
+    "ras_stac_ffrd": StacCheckSuite(CHECKSUITE_MODULES["ras_stac_ffrd"]),
+    "hms_stac_ffrd": StacCheckSuite(CHECKSUITE_MODULES["hms_stac_ffrd"]),
+    "ble": CheckSuite(CHECKSUITE_MODULES["ble"]),
 }
 
 
@@ -1,13 +1,27 @@
 """Module for defining the RasqcResult class and related functionality."""
 
-from geopandas import GeoDataFrame
-
 from dataclasses import dataclass, asdict
 from enum import Enum
 from json import JSONEncoder
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 from datetime import datetime
-import numpy as np
+import sys
+
+if TYPE_CHECKING:
+    from geopandas import GeoDataFrame
+
+
+def _is_instance(obj: Any, module: str, *names: str) -> bool:
+    """Check the type of an object against classes of a module, if imported.
+
+    Objects of a module's classes can only exist once the module has been
+    imported, so slow-to-import modules (geopandas, numpy) are not imported
+    just to rule them out.
+    """
+    mod = sys.modules.get(module)
+    return mod is not None and isinstance(
+        obj, tuple(getattr(mod, name) for name in names)
+    )
 
 
 class ResultStatus(Enum):
@@ -19,12 +33,14 @@ class ResultStatus(Enum):
         WARNING: Check passed with warnings.
         ERROR: Check failed.
         NOTE: Note for informational purposes.
+        SKIPPED: Check not run because a prerequisite check failed.
     """
 
     OK = "ok"
     WARNING = "warning"
     ERROR = "error"
     NOTE = "note"
+    SKIPPED = "skipped"
 
 
 class RasqcResultEncoder(JSONEncoder):
@@ -46,13 +62,13 @@ class RasqcResultEncoder(JSONEncoder):
         """
         if isinstance(obj, Enum):
             return obj.value
-        if isinstance(obj, GeoDataFrame):
+        if _is_instance(obj, "geopandas", "GeoDataFrame"):
             return obj.to_json()
         if isinstance(obj, datetime):
             return obj.isoformat()
         if isinstance(obj, bytes):
             return obj.decode()
-        if isinstance(obj, (np.ndarray, np.generic)):
+        if _is_instance(obj, "numpy", "ndarray", "generic"):
             return obj.item()
         if isinstance(obj, set):
             return list(obj)
@@ -84,7 +100,7 @@ class RasqcResult:
     pattern: Optional[str] | Optional[List[str]] = None
     pattern_description: Optional[str] | Optional[List[str]] = None
     examples: Optional[str] | Optional[List[str]] = None
-    gdf: Optional[GeoDataFrame] = None
+    gdf: Optional["GeoDataFrame"] = None
 
     def to_dict(self) -> dict:
         """Convert RasqcResult object to dictionary.
@@ -95,3 +111,22 @@ class RasqcResult:
         """
         # encode and decode to serialize message if valid JSON
         return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RasqcResult":
+        """Create a RasqcResult object from its dictionary or JSON representation.
+
+        Parameters
+        ----------
+            data: The dictionary, e.g. as produced by `to_dict` and serialized with
+                `RasqcResultEncoder`. Serialized GeoDataFrames are not restored.
+
+        Returns
+        -------
+            RasqcResult: The result.
+        """
+        data = dict(data)
+        data["result"] = ResultStatus(data["result"])
+        if not _is_instance(data.get("gdf"), "geopandas", "GeoDataFrame"):
+            data["gdf"] = None
+        return cls(**data)
@@ -0,0 +1,183 @@
+"""On-disk cache of check results for incremental re-checks of HEC-RAS models.
+
+A cached result is reused when the checker, the rasqc version and every model
+file the checker read during its previous run are unchanged. The files a
+checker reads are recorded while it runs (see `rasmodel.track_file_access`)
+and fingerprinted by size and modification time (local) or ETag (remote).
+"""
+
+from .base_checker import RasqcChecker
+from .rasmodel import RasModel, track_file_access
+from .result import RasqcResult
+
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+import inspect
+import json
+import os
+from pathlib import Path
+import pickle
+import tempfile
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+RESULT_CACHE_VERSION = 1
+
+try:
+    RASQC_VERSION = version("rasqc")
+except PackageNotFoundError:
+    RASQC_VERSION = "unknown"
+
+
+def _checker_source_hash(check: RasqcChecker) -> str:
+    """Hash the source of the module defining a checker, if available."""
+    try:
+        source = inspect.getsource(inspect.getmodule(type(check)))
+    except (OSError, TypeError):
+        return ""
+    return sha256(source.encode()).hexdigest()
+
+
+def _fingerprints(
+    ras_model: RasModel, accessed: Set[Tuple[str, str]]
+) -> List[Tuple[str, str, Optional[List]]]:
+    """Fingerprint the accessed model files, always including the project file."""
+    model_files = ras_model.model_files()
+    accessed = accessed | {("content", ras_model.prj_file.filename)}
+    fingerprints = []
+    for kind, filename in sorted(accessed):
+        model_file = model_files.get(filename)
+        if model_file is None:
+            fingerprint = None
+        elif kind == "hdf":
+            fingerprint = model_file.hdf_fingerprint()
+        else:
+            fingerprint = model_file.fingerprint()
+        fingerprints.append((kind, filename, fingerprint))
+    return fingerprints
+
+
+class ResultCache:
+    """On-disk cache of check results keyed on the model files each check read.
+
+    Attributes
+    ----------
+        directory: The cache directory.
+        reused: Class names of the checks whose cached results were reused.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        """Instantiate a ResultCache.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike
+            The cache directory. Created when the first entry is written.
+        """
+        self.directory = Path(directory)
+        self.reused: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def _entry_path(self, check: RasqcChecker, ras_model: RasModel) -> Path:
+        """Get the path of the cache entry of a check of a model."""
+        check_type = type(check)
+        settings = json.dumps(vars(check), sort_keys=True, default=repr)
+        key = "\0".join(
+            [
+                str(RESULT_CACHE_VERSION),
+                RASQC_VERSION,
+                f"{check_type.__module__}.{check_type.__qualname__}",
+                _checker_source_hash(check),
+                settings,
+                ras_model.prj_file.uri,
+            ]
+        )
+        return self.directory / f"{sha256(key.encode()).hexdigest()}.pkl"
+
+    def lookup(
+        self, check: RasqcChecker, ras_model: RasModel
+    ) -> Optional[List[RasqcResult]]:
+        """Get the cached results of a check if the files it read are unchanged.
+
+        Parameters
+        ----------
+            check: The check.
+            ras_model: The HEC-RAS model being checked.
+
+        Returns
+        -------
+            List[RasqcResult]: The cached results, or None if there are none or
+            they are stale.
+        """
+        path = self._entry_path(check, ras_model)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        accessed = {(kind, filename) for kind, filename, _ in entry["files"]}
+        if _fingerprints(ras_model, accessed) != entry["files"]:
+            return None
+        return entry["results"]
+
+    def store(
+        self,
+        check: RasqcChecker,
+        ras_model: RasModel,
+        results: List[RasqcResult],
+        accessed: Set[Tuple[str, str]],
+    ) -> None:
+        """Cache the results of a check along with the files it read.
+
+        Parameters
+        ----------
+            check: The check.
+            ras_model: The HEC-RAS model that was checked.
+            results: The results of the check.
+            accessed: The model files the check read, as recorded by
+                `track_file_access`.
+        """
+        path = self._entry_path(check, ras_model)
+        entry = {"files": _fingerprints(ras_model, accessed), "results": results}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def run(
+        self,
+        check: RasqcChecker,
+        ras_model: RasModel,
+        compute: Callable[[], List[RasqcResult]],
+    ) -> List[RasqcResult]:
+        """Get the results of a check from the cache, or compute and cache them.
+
+        Parameters
+        ----------
+            check: The check.
+            ras_model: The HEC-RAS model to check.
+            compute: Function running the check.
+
+        Returns
+        -------
+            List[RasqcResult]: The results of the check.
+        """
+        results = self.lookup(check, ras_model)
+        if results is not None:
+            with self._lock:
+                self.reused.add(type(check).__name__)
+            return results
+        with track_file_access() as accessed:
+            results = compute()
+        self.store(check, ras_model, results, accessed)
+        return results
+
+    def __getstate__(self) -> Dict:
+        """Get the state to pickle, excluding the lock."""
+        return {"directory": self.directory, "reused": set()}
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore a pickled ResultCache."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
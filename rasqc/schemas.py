@@ -0,0 +1,193 @@
+"""Loading of the FFRD naming convention JSON schemas.
+
+A schema is resolved, in order, from:
+
+1. An explicit path, set by the `RASQC_RAS_SCHEMA` or `RASQC_HMS_SCHEMA`
+   environment variable.
+2. A local cache of the published schema. The cached copy is used as-is for
+   `RASQC_SCHEMA_TTL` seconds, then revalidated with its ETag. If the published
+   schema cannot be fetched, a stale cached copy is used.
+3. The copy bundled with rasqc.
+
+Set `RASQC_OFFLINE=1` to never fetch the published schemas, e.g. on air-gapped
+machines.
+"""
+
+from .constants import HMS_SCHEMA_URL, RAS_SCHEMA_URL
+from .range_cache import CACHE_DIR_ENV
+
+from functools import lru_cache
+from hashlib import sha256
+from importlib.resources import files
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Optional
+import urllib.error
+import urllib.request
+
+# Environment variables setting the path of a schema file to use
+RAS_SCHEMA_ENV = "RASQC_RAS_SCHEMA"
+HMS_SCHEMA_ENV = "RASQC_HMS_SCHEMA"
+
+# Environment variable setting the seconds a cached schema is used without
+# revalidation
+SCHEMA_TTL_ENV = "RASQC_SCHEMA_TTL"
+
+# Environment variable disabling fetching of the published schemas
+OFFLINE_ENV = "RASQC_OFFLINE"
+
+DEFAULT_SCHEMA_TTL = 24 * 3600
+
+# Seconds to wait for the published schema before falling back
+SCHEMA_TIMEOUT = 5
+
+
+def schema_cache_dir() -> Path:
+    """Get the directory of cached schemas.
+
+    Returns
+    -------
+        Path: The 'schemas' subdirectory of `RASQC_CACHE_DIR` if set, otherwise
+        of the user cache directory. It is apart from the 'ranges' subdirectory
+        of the range cache, so cached schemas are never evicted with byte
+        ranges.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir:
+        return Path(cache_dir) / "schemas"
+    user_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(user_cache) / "rasqc" / "schemas"
+
+
+def _offline() -> bool:
+    """Check whether fetching the published schemas is disabled."""
+    return os.environ.get(OFFLINE_ENV, "").lower() not in ("", "0", "false", "no")
+
+
+def read_schema(schema_url: str, timeout: float = SCHEMA_TIMEOUT) -> dict:
+    """Load external schema from given url."""
+    with urllib.request.urlopen(schema_url, timeout=timeout) as response:
+        return json.load(response)
+
+
+def read_bundled_schema(filename: str) -> dict:
+    """Load a schema bundled in the rasqc 'data' directory."""
+    return json.loads((files("rasqc") / "data" / filename).read_text())
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so that readers never see it partially written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def read_cached_schema(
+    schema_url: str,
+    cache_dir: Optional[str | os.PathLike] = None,
+    ttl: Optional[float] = None,
+    offline: Optional[bool] = None,
+) -> Optional[dict]:
+    """Load a published schema through the local cache.
+
+    Parameters
+    ----------
+        schema_url: URL of the published schema.
+        cache_dir: Directory of cached schemas. Defaults to `schema_cache_dir()`.
+        ttl: Seconds a cached schema is used without revalidation. Defaults to
+            the `RASQC_SCHEMA_TTL` environment variable, or one day.
+        offline: Whether to only use the cache. Defaults to the `RASQC_OFFLINE`
+            environment variable.
+
+    Returns
+    -------
+        dict: The schema, or None if it is not cached and cannot be fetched.
+    """
+    cache_dir = Path(cache_dir) if cache_dir else schema_cache_dir()
+    ttl = (
+        float(os.environ.get(SCHEMA_TTL_ENV, DEFAULT_SCHEMA_TTL))
+        if ttl is None
+        else ttl
+    )
+    offline = _offline() if offline is None else offline
+
+    key = sha256(schema_url.encode()).hexdigest()[:16]
+    body_path = cache_dir / f"{key}.json"
+    meta_path = cache_dir / f"{key}.meta.json"
+    try:
+        cached = json.loads(body_path.read_bytes())
+        meta = json.loads(meta_path.read_bytes())
+    except (OSError, ValueError):
+        cached, meta = None, {}
+    if cached is not None and (offline or time.time() - meta.get("fetched", 0) < ttl):
+        return cached
+    if offline:
+        return None
+
+    headers = {"If-None-Match": meta["etag"]} if meta.get("etag") else {}
+    request = urllib.request.Request(schema_url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=SCHEMA_TIMEOUT) as response:
+            body = response.read()
+            etag = response.headers.get("ETag")
+        schema = json.loads(body)
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached is not None:
+            meta["fetched"] = time.time()
+            _write_atomic(meta_path, json.dumps(meta).encode())
+        return cached
+    except (OSError, ValueError):
+        # unreachable (e.g., air-gapped) or invalid; use the stale copy, if any
+        return cached
+    _write_atomic(body_path, body)
+    _write_atomic(
+        meta_path,
+        json.dumps({"url": schema_url, "etag": etag, "fetched": time.time()}).encode(),
+    )
+    return schema
+
+
+def load_schema(schema_url: str, bundled_filename: str, path_env: str) -> dict:
+    """Load a naming schema from an explicit path, the cache, or the bundled copy.
+
+    Parameters
+    ----------
+        schema_url: URL of the published schema.
+        bundled_filename: Name of the schema file bundled in the rasqc 'data'
+            directory.
+        path_env: Environment variable setting the path of a schema file to use.
+
+    Returns
+    -------
+        dict: The schema.
+    """
+    path = os.environ.get(path_env)
+    if path:
+        with open(path) as f:
+            return json.load(f)
+    schema = read_cached_schema(schema_url)
+    if schema is None:
+        schema = read_bundled_schema(bundled_filename)
+    return schema
+
+
+@lru_cache
+def load_ras_schema() -> dict:
+    """Load schema for HEC-RAS."""
+    return load_schema(RAS_SCHEMA_URL, "naming-schema.json", RAS_SCHEMA_ENV)
+
+
+@lru_cache
+def load_hms_schema() -> dict:
+    """Load schema for HEC-HMS."""
+    return load_schema(HMS_SCHEMA_URL, "hms-naming-schema.json", HMS_SCHEMA_ENV)
+
+
+def get_schema_property(naming_schema: dict, property_name: str) -> dict:
+    """Get a property from the naming schema."""
+    return naming_schema["properties"][property_name]
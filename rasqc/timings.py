@@ -0,0 +1,198 @@
+"""Per-check timing, memory and I/O instrumentation of check suite runs."""
+
+from .rasmodel import RasModel
+
+from rich.console import Console
+from rich.table import Table
+
+import cProfile
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+import os
+from pathlib import Path
+import threading
+import time
+import tracemalloc
+from typing import Dict, Iterator, Optional
+
+
+@dataclass
+class CheckTiming:
+    """Resources used by a single check.
+
+    Attributes
+    ----------
+        check: Class name of the check.
+        wall_seconds: Elapsed wall-clock time.
+        cpu_seconds: CPU time of the thread that ran the check.
+        peak_memory_bytes: Peak memory traced by tracemalloc while the check ran,
+            or None if memory was not traced.
+        requests: Number of remote HDF range requests issued.
+        bytes_fetched: Number of remote HDF bytes fetched.
+        cache_hits: Number of remote HDF ranges served from the on-disk cache.
+        profile_path: Path of the cProfile stats file, if profiled.
+    """
+
+    check: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_bytes: Optional[int]
+    requests: int = 0
+    bytes_fetched: int = 0
+    cache_hits: int = 0
+    profile_path: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert CheckTiming object to dictionary.
+
+        Returns
+        -------
+            dict: A dictionary representation of the object.
+        """
+        return asdict(self)
+
+
+def _io_totals(ras_model: RasModel) -> Dict[str, int]:
+    """Sum the remote I/O statistics of all HDF files of a model."""
+    totals = {"requests": 0, "bytes_fetched": 0, "cache_hits": 0}
+    for model_file in [*ras_model.geom_files.values(), *ras_model.plan_files.values()]:
+        for key, value in model_file.io_stats.items():
+            totals[key] += value
+    return totals
+
+
+class CheckTimer:
+    """Records the resources used by each check of a run.
+
+    Wall and CPU times are exact per check. Peak memory is traced process-wide
+    and its peak reset at the start of each check, so runs are serial when
+    memory is traced (see `serial`). Remote I/O is process-wide, so it includes
+    other checks running at the same time when checks run concurrently.
+
+    Attributes
+    ----------
+        timings: Timings of the measured checks, keyed by check class name.
+        profile_dir: Directory to write a cProfile stats file per check to, if set.
+        trace_memory: Whether to trace the peak memory of each check.
+    """
+
+    def __init__(
+        self,
+        profile_dir: Optional[str | os.PathLike] = None,
+        trace_memory: bool = True,
+    ):
+        """Instantiate a CheckTimer.
+
+        Parameters
+        ----------
+        profile_dir : str | os.PathLike, optional
+            Directory to write a cProfile stats file (`<check>.pstats`) per check
+            to. Profiled runs are serial since profiling is per thread.
+        trace_memory : bool, optional
+            Whether to trace the peak memory of each check with tracemalloc.
+            Runs tracing memory are serial. Disable to time concurrent runs.
+        """
+        self.timings: Dict[str, CheckTiming] = {}
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.trace_memory = trace_memory
+        self._lock = threading.Lock()
+        self._active = 0  # checks being measured
+        self._started_tracing = False
+
+    @property
+    def serial(self) -> bool:
+        """Whether checks must run one at a time to be measured.
+
+        cProfile only profiles the calling thread, and the traced memory peak
+        is reset for each check, so it would be wrong for checks already
+        running.
+        """
+        return self.profile_dir is not None or self.trace_memory
+
+    @contextmanager
+    def measure(self, check: str, ras_model: RasModel) -> Iterator[None]:
+        """Measure the resources used within the context by a check.
+
+        Parameters
+        ----------
+            check: Class name of the check.
+            ras_model: The HEC-RAS model being checked, for remote I/O statistics.
+        """
+        with self._lock:
+            if self.trace_memory:
+                if self._active == 0 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self._started_tracing = True
+                tracemalloc.reset_peak()
+            self._active += 1
+        io_before = _io_totals(ras_model)
+        profile = cProfile.Profile() if self.profile_dir else None
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            cpu_seconds = time.thread_time() - cpu_start
+            wall_seconds = time.perf_counter() - wall_start
+            with self._lock:
+                peak = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+                self._active -= 1
+                if self._active == 0 and self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+            io_after = _io_totals(ras_model)
+            profile_path = None
+            if profile:
+                self.profile_dir.mkdir(parents=True, exist_ok=True)
+                profile_path = str(self.profile_dir / f"{check}.pstats")
+                profile.dump_stats(profile_path)
+            self.timings[check] = CheckTiming(
+                check=check,
+                wall_seconds=wall_seconds,
+                cpu_seconds=cpu_seconds,
+                peak_memory_bytes=peak,
+                profile_path=profile_path,
+                **{key: io_after[key] - io_before[key] for key in io_after},
+            )
+
+    def to_dict(self) -> Dict[str, dict]:
+        """Convert the recorded timings to a dictionary keyed by check class name.
+
+        Returns
+        -------
+            dict: The recorded timings.
+        """
+        return {check: timing.to_dict() for check, timing in self.timings.items()}
+
+    def print_summary(self, console: Console) -> None:
+        """Print a table of the recorded timings, slowest check first.
+
+        Parameters
+        ----------
+            console: The console to print to.
+        """
+        table = Table(title="Check timings", title_justify="left")
+        table.add_column("Check", no_wrap=True)
+        table.add_column("Wall s", justify="right")
+        table.add_column("CPU s", justify="right")
+        table.add_column("Peak MiB", justify="right")
+        table.add_column("Requests", justify="right")
+        table.add_column("Fetched MiB", justify="right")
+        for timing in sorted(self.timings.values(), key=lambda t: -t.wall_seconds):
+            table.add_row(
+                timing.check,
+                f"{timing.wall_seconds:.3f}",
+                f"{timing.cpu_seconds:.3f}",
+                (
+                    f"{timing.peak_memory_bytes / 1024**2:.1f}"
+                    if timing.peak_memory_bytes is not None
+                    else "-"
+                ),
+                str(timing.requests),
+                f"{timing.bytes_fetched / 1024**2:.1f}",
+            )
+        console.print(table)
@@ -0,0 +1,190 @@
+"""Timeline tracing of rasqc runs in the Chrome Trace Event format.
+
+Traces can be opened in Perfetto (https://ui.perfetto.dev) or chrome://tracing
+to see model loading, HDF file opens, checks and output sinks on a timeline,
+including how checks overlap when run in parallel.
+"""
+
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+
+
+def _now_us() -> float:
+    """Get the current time of the system-wide monotonic clock in microseconds."""
+    return time.perf_counter_ns() / 1000
+
+
+class Tracer:
+    """Collects trace events of a run.
+
+    Attributes
+    ----------
+        events: The recorded Chrome Trace Event dictionaries.
+    """
+
+    def __init__(self):
+        """Instantiate a Tracer with no events."""
+        self.events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[tuple[int, int], str] = {}
+
+    @contextmanager
+    def span(self, name: str, cat: str, **args: Any) -> Iterator[None]:
+        """Record a complete event spanning the context.
+
+        Parameters
+        ----------
+            name: Name of the event.
+            cat: Category of the event (e.g., "model", "hdf", "check", "sink").
+            args: Additional JSON-serializable details of the event.
+        """
+        pid, tid = os.getpid(), threading.get_ident()
+        self._thread_names.setdefault((pid, tid), threading.current_thread().name)
+        start = _now_us()
+        try:
+            yield
+        finally:
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": cat,
+                    "ph": "X",
+                    "ts": start,
+                    "dur": _now_us() - start,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+
+    def add_events(self, events: List[Dict[str, Any]]) -> None:
+        """Add events recorded by another tracer (e.g., in a worker process).
+
+        Parameters
+        ----------
+            events: The events to add, including thread name metadata.
+        """
+        self.events.extend(events)
+
+    def export_events(self) -> List[Dict[str, Any]]:
+        """Get the recorded events along with thread name metadata events.
+
+        Returns
+        -------
+            List[dict]: The trace events.
+        """
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": thread_name},
+            }
+            for (pid, tid), thread_name in self._thread_names.items()
+        ]
+        return metadata + self.events
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Get the recorded events (see `export_events`) and clear them.
+
+        Returns
+        -------
+            List[dict]: The trace events.
+        """
+        events = self.export_events()
+        self.events = []
+        self._thread_names = {}
+        return events
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the trace as a Chrome Trace Event JSON file.
+
+        Parameters
+        ----------
+            path: Path of the trace file.
+        """
+        with open(Path(path), "w") as f:
+            json.dump({"traceEvents": self.export_events(), "displayTimeUnit": "ms"}, f)
+
+
+# Tracer of the current process, if tracing is enabled
+_tracer: Optional[Tracer] = None
+
+
+def start_tracing() -> Tracer:
+    """Enable tracing in the current process.
+
+    Returns
+    -------
+        Tracer: The tracer recording events.
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Disable tracing in the current process.
+
+    Returns
+    -------
+        Tracer: The tracer that recorded events, or None if tracing was not enabled.
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the tracer of the current process, or None if tracing is not enabled."""
+    return _tracer
+
+
+def span(name: str, cat: str, **args: Any) -> ContextManager[None]:
+    """Record an event spanning the context if tracing is enabled.
+
+    Parameters
+    ----------
+        name: Name of the event.
+        cat: Category of the event (e.g., "model", "hdf", "check", "sink").
+        args: Additional JSON-serializable details of the event.
+
+    Returns
+    -------
+        ContextManager: The span context, which does nothing if tracing is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return nullcontext()
+    return tracer.span(name, cat, **args)
+
+
+def traced(name: str, cat: str) -> Callable[[Callable], Callable]:
+    """Decorate a function to record an event for each call if tracing is enabled.
+
+    Parameters
+    ----------
+        name: Name of the event.
+        cat: Category of the event.
+
+    Returns
+    -------
+        callable: The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, cat):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -14,13 +14,19 @@ from typing import Literal, List
 from .result import RasqcResult, ResultStatus
 from .rasmodel import RasModel
 from .themes import ColorTheme
+from .tracing import traced
 
 
 def summarize_results(results: list[RasqcResult]) -> dict:
-    """Create a dict from a list of RasqcResults."""
+    """Create a dict from a list of RasqcResults.
+
+    Results are grouped as 'passed', 'failed', or 'skipped' (checks not run
+    because a prerequisite check failed).
+    """
     summary = {
         "passed": defaultdict(lambda: defaultdict(list)),
         "failed": defaultdict(lambda: defaultdict(list)),
+        "skipped": defaultdict(lambda: defaultdict(list)),
     }
 
     for result in results:
@@ -28,6 +34,8 @@ def summarize_results(results: list[RasqcResult]) -> dict:
             group = "passed"
         elif result.result == ResultStatus.NOTE:
             group = "note"
+        elif result.result == ResultStatus.SKIPPED:
+            group = "skipped"
         else:
             group = "failed"
         check_name = result.name
@@ -43,6 +51,7 @@ def summarize_results(results: list[RasqcResult]) -> dict:
     return {
         "passed": {k: dict(v) for k, v in summary["passed"].items()},
         "failed": {k: dict(v) for k, v in summary["failed"].items()},
+        "skipped": {k: dict(v) for k, v in summary["skipped"].items()},
     }
 
 
@@ -53,7 +62,7 @@ def results_to_json(results: dict, output_path: str) -> None:
 
 
 def results_to_excel(results: dict, output_path: str) -> None:
-    """Create an excel from a dict of RasqcResults. Creates 2 excel sheets for passed and failed."""
+    """Create an excel from a dict of RasqcResults. Creates excel sheets for passed, failed and skipped."""
 
     def flatten(group_name):
         rows = []
@@ -71,10 +80,12 @@ def results_to_excel(results: dict, output_path: str) -> None:
 
     passed_df = flatten("passed")
     failed_df = flatten("failed")
+    skipped_df = flatten("skipped")
 
     with pd.ExcelWriter(output_path) as writer:
         failed_df.to_excel(writer, sheet_name="failed", index=False)
         passed_df.to_excel(writer, sheet_name="passed", index=False)
+        skipped_df.to_excel(writer, sheet_name="skipped", index=False)
 
 
 def to_snake_case(text: str) -> str:
@@ -130,7 +141,8 @@ def group_results(results: List[RasqcResult]) -> dict:
     """Group RasqcResult objects by result status.
 
     Group a list of RasqcResult objects into a dict based on
-    whether the result is from a 'note' or 'check', then based
+    whether the result is from a 'note', a 'check', or a 'skipped'
+    check (not run because a prerequisite check failed), then based
     on the name of the RasqcResult object.
 
     Parameters
@@ -139,16 +151,19 @@ def group_results(results: List[RasqcResult]) -> dict:
 
     Returns
     -------
-        dict: A dict of RasqcResult objects in pattern {'note' or 'check': {result name: [results]}}.
+        dict: A dict of RasqcResult objects in pattern {'note', 'check' or 'skipped': {result name: [results]}}.
     """
     results_dict = {}
     for result in results:
-        results_dict.setdefault(
-            "note" if result.result.value == "note" else "check", {}
-        ).setdefault(result.name, []).append(result)
+        if result.result.value in ("note", "skipped"):
+            res_type = result.result.value
+        else:
+            res_type = "check"
+        results_dict.setdefault(res_type, {}).setdefault(result.name, []).append(result)
     return results_dict
 
 
+@traced("results_to_html", "sink")
 def results_to_html(
     results: list[RasqcResult],
     output_path: str,
@@ -0,0 +1,326 @@
+"""File-backed work queue for distributing batch quality control across machines.
+
+A coordinator enqueues models into an SQLite queue file on storage shared by
+the worker machines. Workers lease one model at a time, check it, and write the
+report back to the queue. A worker renews its lease while it works, so when a
+worker dies its lease expires and the model is handed to another worker, up to
+a maximum number of attempts.
+
+SQLite relies on file locks, so the shared storage must support them (e.g., a
+local disk or a properly configured NFS mount, not an object store).
+"""
+
+from .batch import ModelReport, check_model
+from .obstore_file import DEFAULT_REMOTE_IO, RemoteIOConfig
+from .result import RasqcResult
+
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import socket
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Iterator, Optional
+import uuid
+
+# Seconds a leased model is reserved for a worker without a renewal
+DEFAULT_LEASE_SECONDS = 300
+
+# Number of times a model is attempted before it is marked as failed
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Seconds to wait for other processes using the queue
+QUEUE_TIMEOUT = 60
+
+_LEASE_EXPIRED = "Worker lease expired on the last attempt to check the model."
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    model TEXT NOT NULL,
+    checksuite TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    report TEXT,
+    UNIQUE (model, checksuite)
+);
+"""
+
+
+@dataclass
+class Job:
+    """A model leased from a WorkQueue.
+
+    Attributes
+    ----------
+        id: Identifier of the job in the queue.
+        model: Path or URL of the model '.prj' file.
+        checksuite: Name of the checksuite to run.
+        attempts: Number of times the job has been leased, including this one.
+    """
+
+    id: int
+    model: str
+    checksuite: str
+    attempts: int
+
+
+class WorkQueue:
+    """SQLite-backed queue of models to check, with leases and retries.
+
+    Attributes
+    ----------
+        path: Path of the SQLite queue file.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Open (creating if needed) a WorkQueue.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path of the SQLite queue file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=QUEUE_TIMEOUT)) as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a transaction that locks the queue for writing."""
+        conn = sqlite3.connect(self.path, timeout=QUEUE_TIMEOUT, isolation_level=None)
+        with closing(conn):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def enqueue(
+        self,
+        models: Iterable[str],
+        checksuite: str,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> int:
+        """Add models to the queue. Models already queued for the suite are ignored.
+
+        Parameters
+        ----------
+            models: Paths or URLs of the model '.prj' files.
+            checksuite: Name of the checksuite to run.
+            max_attempts: Number of times each model is attempted before it is
+                marked as failed.
+
+        Returns
+        -------
+            int: The number of models added.
+        """
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (model, checksuite, status, max_attempts) "
+                "VALUES (?, ?, ?, ?)",
+                [(model, checksuite, PENDING, max_attempts) for model in models],
+            )
+            return conn.total_changes - before
+
+    def lease(
+        self, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> Optional[Job]:
+        """Lease the next pending job, or a job whose lease has expired.
+
+        Jobs whose lease expired on their last attempt are marked as failed.
+
+        Parameters
+        ----------
+            worker_id: Identifier of the worker taking the lease.
+            lease_seconds: Seconds until the lease expires unless renewed.
+
+        Returns
+        -------
+            Job: The leased job, or None if no job is available.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, lease_owner = NULL, report = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (FAILED, json.dumps({"error": _LEASE_EXPIRED}), LEASED, now),
+            )
+            row = conn.execute(
+                "SELECT id, model, checksuite, attempts FROM jobs "
+                "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                "ORDER BY id LIMIT 1",
+                (PENDING, LEASED, now),
+            ).fetchone()
+            if row is None:
+                return None
+            job = Job(row[0], row[1], row[2], row[3] + 1)
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = ?, lease_owner = ?, "
+                "lease_expires = ? WHERE id = ?",
+                (LEASED, job.attempts, worker_id, now + lease_seconds, job.id),
+            )
+        return job
+
+    def renew(
+        self, job: Job, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> bool:
+        """Extend the lease of a job.
+
+        Parameters
+        ----------
+            job: The leased job.
+            worker_id: Identifier of the worker holding the lease.
+            lease_seconds: Seconds from now until the lease expires.
+
+        Returns
+        -------
+            bool: Whether the worker still holds the lease.
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (time.time() + lease_seconds, job.id, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job: Job, worker_id: str, report: ModelReport) -> None:
+        """Record the report of a leased job.
+
+        A failed model is returned to the queue to be retried until it reaches
+        its maximum number of attempts. Reports from workers that lost their
+        lease are discarded.
+
+        Parameters
+        ----------
+            job: The leased job.
+            worker_id: Identifier of the worker holding the lease.
+            report: The report of the model.
+        """
+        with self._transaction() as conn:
+            (max_attempts,) = conn.execute(
+                "SELECT max_attempts FROM jobs WHERE id = ?", (job.id,)
+            ).fetchone()
+            if not report.failed:
+                status = DONE
+            elif job.attempts < max_attempts:
+                status = PENDING
+            else:
+                status = FAILED
+            conn.execute(
+                "UPDATE jobs SET status = ?, lease_owner = NULL, lease_expires = NULL, "
+                "report = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (status, json.dumps(report.to_dict()), job.id, LEASED, worker_id),
+            )
+
+    def counts(self) -> Dict[str, int]:
+        """Count the jobs of each status.
+
+        Returns
+        -------
+            dict: The number of pending, leased, done and failed jobs.
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        return {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0, **dict(rows)}
+
+    def reports(self) -> Iterator[ModelReport]:
+        """Get the reports of the finished (done or failed) jobs.
+
+        Yields
+        ------
+            ModelReport: The report of each finished job, in queue order.
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT model, report FROM jobs WHERE status IN (?, ?) ORDER BY id",
+                (DONE, FAILED),
+            ).fetchall()
+        for model, report in rows:
+            report = json.loads(report)
+            yield ModelReport(
+                model,
+                report.get("error"),
+                report.get("elapsed_seconds", 0.0),
+                [RasqcResult.from_dict(r) for r in report.get("checks", [])],
+            )
+
+
+def run_worker(
+    queue: WorkQueue | str | os.PathLike,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    remote_io: RemoteIOConfig = DEFAULT_REMOTE_IO,
+    jobs: int = 1,
+    poll_seconds: float = 5,
+) -> int:
+    """Check models leased from a work queue until no work remains.
+
+    The lease of the model being checked is renewed in the background every
+    third of `lease_seconds`. The worker exits once no jobs are pending or
+    leased by other workers; while other workers hold leases, it polls in
+    case a lease expires.
+
+    Parameters
+    ----------
+        queue: The work queue, or the path of its file.
+        worker_id: Identifier of the worker. Defaults to the host name, process
+            ID and a random suffix.
+        lease_seconds: Seconds a model is reserved for the worker without a
+            renewal.
+        remote_io: Settings for reading remote HDF files.
+        jobs: Maximum number of checks to run at once within each model.
+        poll_seconds: Seconds to wait between polls for expired leases.
+
+    Returns
+    -------
+        int: The number of models the worker checked.
+    """
+    if not isinstance(queue, WorkQueue):
+        queue = WorkQueue(queue)
+    worker_id = (
+        worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    )
+    checked = 0
+    while True:
+        job = queue.lease(worker_id, lease_seconds)
+        if job is None:
+            counts = queue.counts()
+            if counts[PENDING] == 0 and counts[LEASED] == 0:
+                return checked
+            time.sleep(poll_seconds)
+            continue
+        stop = threading.Event()
+
+        def _heartbeat(job: Job = job) -> None:
+            while not stop.wait(lease_seconds / 3):
+                if not queue.renew(job, worker_id, lease_seconds):
+                    return
+
+        heartbeat = threading.Thread(target=_heartbeat, daemon=True)
+        heartbeat.start()
+        try:
+            report = check_model(job.model, job.checksuite, remote_io, jobs)
+        finally:
+            stop.set()
+            heartbeat.join()
+        queue.complete(job, worker_id, report)
+        checked += 1
@@ -0,0 +1,75 @@
+from pathlib import Path
+from rasqc.base_checker import RasqcChecker
+from rasqc.batch import discover_models, open_sink, run_batch
+from rasqc.checksuite import CheckSuite
+from rasqc.rasmodel import RasModel
+from rasqc.registry import CHECKSUITES
+from rasqc.result import RasqcResult, ResultStatus
+import json
+import pandas as pd
+import shutil
+
+TEST_DATA = Path("./tests/data")
+RAS_DIR = TEST_DATA / "ras"
+
+
+class MockTitleChecker(RasqcChecker):
+    name = "Mock Title Checker"
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        return RasqcResult(
+            name=self.name,
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.OK,
+            message=ras_model.prj_file.title,
+        )
+
+
+def test_discover_models(tmp_path):
+    models = [str(RAS_DIR / "BaldEagleDamBrk.prj"), str(RAS_DIR / "Muncie.prj")]
+    assert discover_models(RAS_DIR) == models
+    assert discover_models(str(RAS_DIR / "*.prj")) == models
+    # projection files sharing the extension are excluded
+    model_dir = tmp_path / "models"
+    shutil.copytree(RAS_DIR, model_dir / "a")
+    (model_dir / "a" / "projection.prj").write_text('PROJCS["NAD_1983"]')
+    assert len(discover_models(model_dir)) == 2
+    manifest = tmp_path / "models.txt"
+    manifest.write_text(f"# models\n{models[0]}\n\ns3://bucket/model.prj\n")
+    assert discover_models(manifest) == [models[0], "s3://bucket/model.prj"]
+    (model_dir / "empty.prj").write_text("")
+    assert discover_models(model_dir.resolve().as_uri()) == [
+        f"{model_dir.resolve().as_uri()}/a/{Path(m).name}" for m in models
+    ]
+
+
+def test_run_batch(tmp_path):
+    suite = CheckSuite()
+    suite.add_check(MockTitleChecker())
+    CHECKSUITES["test_batch"] = suite
+    try:
+        models = [str(RAS_DIR / "Muncie.prj"), str(tmp_path / "missing.prj")]
+        reports = {r.model: r for r in run_batch(models, "test_batch", workers=0)}
+    finally:
+        del CHECKSUITES["test_batch"]
+    assert not reports[models[0]].failed
+    assert reports[models[0]].counts["ok"] == 1
+    assert reports[models[1]].failed
+    assert reports[models[1]].error.startswith("Traceback")
+
+    sink = open_sink(tmp_path / "out.jsonl")
+    for report in reports.values():
+        sink.write(report)
+    sink.close()
+    lines = (tmp_path / "out.jsonl").read_text().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r["status"] for r in records] == ["checked", "failed"]
+    assert records[0]["checks"][0]["result"] == "ok"
+
+    sink = open_sink(tmp_path / "out.parquet")
+    for report in reports.values():
+        sink.write(report)
+    sink.close()
+    df = pd.read_parquet(tmp_path / "out.parquet")
+    assert df["model_status"].tolist() == ["checked", "failed"]
+    assert df["check"].tolist()[0] == "Mock Title Checker"
@@ -4,7 +4,10 @@ from rasqc.base_checker import RasqcChecker
 from rasqc.rasmodel import RasModel
 from rasqc.result import RasqcResult, ResultStatus
 from pathlib import Path
+import asyncio
+import os
 import pytest
+import threading
 
 
 #
@@ -45,6 +48,19 @@ class MockWarningChecker(RasqcChecker):
         )
 
 
+class MockCpuBoundChecker(RasqcChecker):
+    name = "Mock CPU-Bound Checker"
+    cpu_bound = True
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        return RasqcResult(
+            name=self.name,
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.OK,
+            message=str(os.getpid()),
+        )
+
+
 # TODO: better Checksuite tests
 # def test_checksuite_add_check():
 #     """Test adding checks to a CheckSuite."""
@@ -70,6 +86,140 @@ def test_checksuite_run_all_silent():
     assert results[1].result == ResultStatus.ERROR
 
 
+def test_checksuite_run_in_event_loop():
+    """Test running checks from within a running event loop (e.g., Jupyter)."""
+    suite = CheckSuite()
+    suite.add_check(MockChecker())
+    BALDEAGLE_PRJ = Path("./tests/data/ras/BaldEagleDamBrk.prj")
+
+    async def _run():
+        local = suite.run_checks(BALDEAGLE_PRJ)
+        remote = suite.run_checks(BALDEAGLE_PRJ.resolve().as_uri())
+        return local + remote
+
+    results = asyncio.run(_run())
+    assert [r.result for r in results] == [ResultStatus.OK, ResultStatus.OK]
+
+
+def test_checksuite_run_parallel():
+    """Test running independent checks concurrently while respecting dependencies."""
+    barrier = threading.Barrier(2, timeout=10)
+    ran = []
+
+    class BarrierChecker(MockChecker):
+        def run(self, ras_model: RasModel) -> RasqcResult:
+            barrier.wait()  # only passes if both checks run at once
+            ran.append(self.name)
+            return super().run(ras_model)
+
+    class FirstChecker(BarrierChecker):
+        name = "First Checker"
+
+    class SecondChecker(BarrierChecker):
+        name = "Second Checker"
+
+    class DependentChecker(MockChecker):
+        name = "Dependent Checker"
+
+        def run(self, ras_model: RasModel) -> RasqcResult:
+            ran.append(self.name)
+            return super().run(ras_model)
+
+    suite = CheckSuite()
+    suite.add_check(DependentChecker(), ["FirstChecker", "SecondChecker"])
+    suite.add_check(FirstChecker())
+    suite.add_check(SecondChecker())
+
+    BALDEAGLE_PRJ = Path("./tests/data/ras/BaldEagleDamBrk.prj")
+    results = suite.run_checks(BALDEAGLE_PRJ, jobs=4)
+
+    assert ran[-1] == "Dependent Checker"
+    expected = [suite.checks[c].name for c in suite.get_execution_order()]
+    assert [r.name for r in results] == expected
+
+
+def test_checksuite_run_processes():
+    """Test running CPU-bound checks in worker processes."""
+    suite = CheckSuite()
+    suite.add_check(MockCpuBoundChecker(), ["MockChecker"])
+    suite.add_check(MockChecker())
+
+    BALDEAGLE_PRJ = Path("./tests/data/ras/BaldEagleDamBrk.prj")
+    results = suite.run_checks(BALDEAGLE_PRJ, processes=1)
+
+    assert [r.name for r in results] == ["Mock Checker", "Mock CPU-Bound Checker"]
+    assert results[1].filename == "BaldEagleDamBrk.prj"
+    assert results[1].message != str(os.getpid())
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_checksuite_skip_failed_prerequisites(jobs):
+    """Test that dependents of a failed check are skipped without running."""
+
+    class TransitiveChecker(MockWarningChecker):
+        name = "Transitive Checker"
+
+        def run(self, ras_model: RasModel) -> RasqcResult:
+            raise AssertionError("should not run")
+
+    suite = CheckSuite()
+    suite.add_check(MockErrorChecker())
+    suite.add_check(MockChecker(), ["MockErrorChecker"])
+    suite.add_check(TransitiveChecker(), ["MockChecker"])
+    suite.add_check(MockWarningChecker())
+
+    BALDEAGLE_PRJ = Path("./tests/data/ras/BaldEagleDamBrk.prj")
+    results = {r.name: r for r in suite.run_checks(BALDEAGLE_PRJ, jobs=jobs)}
+
+    assert results["Mock Error Checker"].result == ResultStatus.ERROR
+    assert results["Mock Warning Checker"].result == ResultStatus.WARNING
+    assert results["Mock Checker"].result == ResultStatus.SKIPPED
+    assert "'Mock Error Checker'" in results["Mock Checker"].message
+    assert results["Transitive Checker"].result == ResultStatus.SKIPPED
+
+
+def test_checksuite_only_skip():
+    """Test pruning the checks to run to a selection and its prerequisites."""
+    suite = CheckSuite()
+    suite.add_check(MockChecker())
+    suite.add_check(MockWarningChecker(), ["MockChecker"])
+    suite.add_check(MockErrorChecker())
+
+    assert suite.get_execution_order(only=["MockWarningChecker"]) == [
+        "MockChecker",
+        "MockWarningChecker",
+    ]
+    assert suite.get_execution_order(skip=["MockChecker", "MockErrorChecker"]) == [
+        "MockChecker",
+        "MockWarningChecker",
+    ]
+    assert suite.get_execution_order(skip=["MockWarningChecker"]) in (
+        ["MockChecker", "MockErrorChecker"],
+        ["MockErrorChecker", "MockChecker"],
+    )
+    with pytest.raises(ValueError):
+        suite.get_execution_order(only=["Nope"])
+
+    BALDEAGLE_PRJ = Path("./tests/data/ras/BaldEagleDamBrk.prj")
+    results = suite.run_checks(BALDEAGLE_PRJ, only=["MockErrorChecker"])
+    assert [r.name for r in results] == ["Mock Error Checker"]
+
+
+def test_checksuite_iter_checks():
+    """Test streaming results as each check completes."""
+    suite = CheckSuite()
+    suite.add_check(MockChecker())
+    suite.add_check(MockErrorChecker(), ["MockChecker"])
+
+    BALDEAGLE_PRJ = Path("./tests/data/ras/BaldEagleDamBrk.prj")
+    results = suite.iter_checks(BALDEAGLE_PRJ)
+
+    assert next(results).result == ResultStatus.OK
+    assert next(results).result == ResultStatus.ERROR
+    with pytest.raises(StopIteration):
+        next(results)
+
+
 # TODO: better Checksuite tests
 # def test_register_check():
 #     """Test check registration decorator."""
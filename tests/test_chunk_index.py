@@ -0,0 +1,77 @@
+from pathlib import Path
+from rasqc.chunk_index import ChunkIndex, ChunkIndexError, chunk_index_path
+from rasqc.obstore_file import ObstoreFile, RemoteIOConfig
+from rasqc.rasmodel import RasModel
+import h5py
+import numpy as np
+import obstore
+import pytest
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
+HDF_FILES = [
+    TEST_DATA / "ras/BaldEagleDamBrk.g11.hdf",
+    TEST_DATA / "ras/Muncie.g02.hdf",
+]
+
+
+@pytest.mark.parametrize("hdf_path", HDF_FILES)
+def test_ChunkIndex_read(hdf_path, tmp_path):
+    store = obstore.store.from_url(hdf_path.parent.resolve().as_uri())
+    reader = ObstoreFile(store, hdf_path.name)
+    with h5py.File(hdf_path) as hdf:
+        ChunkIndex.from_hdf(hdf).save(tmp_path / "index.json")
+        index = ChunkIndex.load(tmp_path / "index.json")
+        assert len(index.datasets) > 0
+        for name in index.datasets:
+            expected = hdf[name][()]
+            actual = index.read(reader, name)
+            assert actual.dtype == expected.dtype, name
+            if expected.dtype.names:  # NaN fields compare unequal in records
+                assert actual.tobytes() == expected.tobytes(), name
+            else:
+                np.testing.assert_array_equal(actual, expected, err_msg=name)
+
+
+def test_ChunkIndex_missing(tmp_path):
+    hdf_path = HDF_FILES[0]
+    store = obstore.store.from_url(hdf_path.parent.resolve().as_uri())
+    with h5py.File(hdf_path) as hdf:
+        index = ChunkIndex.from_hdf(hdf)
+    assert "Geometry/2D Flow Areas/Cell Info" in index
+    assert "Nope" not in index
+    with pytest.raises(ChunkIndexError):
+        index.read(ObstoreFile(store, hdf_path.name), "Nope")
+
+
+def test_chunk_index_path_range_cache(tmp_path):
+    sidecar = chunk_index_path(tmp_path, "url", "v1")
+    with h5py.File(HDF_FILES[0]) as hdf:
+        ChunkIndex.from_hdf(hdf).save(sidecar)
+    cache = RemoteIOConfig(cache_dir=tmp_path, cache_max_bytes=100).range_cache()
+    # sidecars are neither evicted nor cleared with the range cache
+    cache.put("url", "v1", 0, 200, bytes(200))
+    assert cache._scan_total() <= 100
+    cache.clear()
+    assert sidecar.exists()
+    ChunkIndex.load(sidecar)
+
+
+def test_GeomFile_read_dataset(tmp_path):
+    name = "Geometry/2D Flow Areas/BaldEagleCr/FacePoints Coordinate"
+    config = RemoteIOConfig(cache_dir=tmp_path, chunk_index=True)
+    with RasModel(BALDEAGLE_PRJ.resolve().as_uri(), remote_io=config) as rmf:
+        geom = rmf.geom_files["g11"]
+        first = geom.read_dataset(name)
+        meta = geom.hdf_meta
+        sidecar = chunk_index_path(
+            tmp_path, geom.hdf._loc, meta.get("e_tag") or meta.get("version")
+        )
+        assert sidecar.exists()
+    with RasModel(BALDEAGLE_PRJ.resolve().as_uri(), remote_io=config) as rmf:
+        geom = rmf.geom_files["g11"]
+        np.testing.assert_array_equal(geom.read_dataset(name), first)
+        assert not geom._hdf_opened  # read without opening the HDF file
+        assert geom.io_stats["requests"] == 1
+    local = RasModel(BALDEAGLE_PRJ).geom_files["g11"]
+    np.testing.assert_array_equal(local.read_dataset(name), first)
@@ -0,0 +1,49 @@
+from pathlib import Path
+from rasqc.checksuite import CheckSuite
+from rasqc.cli import run_json
+import json
+import pytest
+
+TEST_DATA = Path("./tests/data")
+MUNCIE_PRJ = TEST_DATA / "ras/Muncie.prj"
+
+
+def test_run_json(capsys):
+    output = run_json(str(MUNCIE_PRJ), "ble", only=["ShortCellFaces"])
+    printed = json.loads(capsys.readouterr().out)
+    # results are both printed and returned
+    assert [c["name"] for c in output["checks"]] == [
+        "Geometry HDF file exists",
+        "Short Cell Faces",
+    ]
+    assert [(c["name"], c["message"]) for c in printed["checks"]] == [
+        (c["name"], c["message"]) for c in output["checks"]
+    ]
+
+    output = run_json(str(MUNCIE_PRJ), "ble", only=["ShortCellFaces"], collect=False)
+    assert "checks" not in output
+    assert len(json.loads(capsys.readouterr().out)["checks"]) == 2
+
+
+def test_run_json_errors(capsys, monkeypatch):
+    # nothing is written if the checks or the model are invalid
+    with pytest.raises(ValueError, match="NoSuchCheck"):
+        run_json(str(MUNCIE_PRJ), "ble", only=["NoSuchCheck"])
+    assert capsys.readouterr().out == ""
+    with pytest.raises((FileNotFoundError, ValueError)):
+        run_json(str(TEST_DATA / "ras/Nonexistent.prj"), "ble")
+    assert capsys.readouterr().out == ""
+
+    # a failure while running the checks still closes the JSON document
+    iter_checks = CheckSuite.iter_checks
+
+    def _failing_iter_checks(*args, **kwargs):
+        yield next(iter_checks(*args, **kwargs))
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(CheckSuite, "iter_checks", _failing_iter_checks)
+    with pytest.raises(RuntimeError):
+        run_json(str(MUNCIE_PRJ), "ble", only=["ShortCellFaces"])
+    printed = json.loads(capsys.readouterr().out)
+    assert [c["name"] for c in printed["checks"]] == ["Geometry HDF file exists"]
+    assert printed["error"] == "RuntimeError: connection reset"
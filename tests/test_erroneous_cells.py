@@ -1,7 +1,8 @@
 from pathlib import Path
 from rasqc.rasmodel import RasModel
 from rasqc.result import ResultStatus
-from rasqc.checkers.erroneous_cells import ErroneousCells
+from rasqc.checkers.erroneous_cells import LEGACY_JOIN_COLUMNS, ErroneousCells
+import dataclasses
 
 TEST_DATA = Path("./tests/data")
 BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
@@ -19,3 +20,22 @@ def test_BreaklineEnforcement():
         "examples": None,
         "gdf": None,
     }
+
+
+def test_ErroneousCells_legacy_columns(monkeypatch):
+    geom = RasModel(BALDEAGLE_PRJ).current_geometry
+    mesh = geom.mesh_arrays()["BaldEagleCr"]
+    centers = mesh.cell_centers.copy()
+    centers[[10, 20]] = centers[[20, 10]]
+    mesh = dataclasses.replace(mesh, cell_centers=centers)
+    monkeypatch.setattr(geom, "mesh_arrays", lambda: {"BaldEagleCr": mesh})
+    flags = ErroneousCells()._erroneous_cells(geom)
+    assert flags["cell_id_left"].tolist() == [10, 20]
+    assert flags.columns.tolist() == [
+        "mesh_name_left",
+        "cell_id_left",
+        "geometry",
+        *LEGACY_JOIN_COLUMNS,
+    ]
+    # deprecated columns of the former spatial join are empty
+    assert flags[list(LEGACY_JOIN_COLUMNS)].isna().all().all()
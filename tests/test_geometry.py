@@ -0,0 +1,67 @@
+from pathlib import Path
+from rasqc.geometry import face_lengths, face_lines, unenforced_lines
+from rasqc.rasmodel import RasModel
+from geopandas import GeoDataFrame
+from geopandas.testing import assert_geodataframe_equal
+import numpy as np
+from shapely import LineString, Polygon
+import shapely
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
+
+
+def test_unenforced_lines():
+    geom_hdf = RasModel(BALDEAGLE_PRJ).current_geometry.hdf
+    faces = geom_hdf.mesh_cell_faces()
+    lines = geom_hdf.breaklines()
+    expected = lines.overlay(
+        faces.buffer(5).to_frame(), how="difference", keep_geom_type=True
+    )
+    assert_geodataframe_equal(
+        unenforced_lines(lines, faces, 5),
+        expected,
+        check_less_precise=True,
+        normalize=True,
+    )
+
+
+def test_unenforced_lines_rings():
+    faces = GeoDataFrame(
+        geometry=[LineString([(0, 0), (100, 0)]), LineString([(0, 0), (0, 100)])]
+    )
+    regions = GeoDataFrame(
+        {"name": ["near", "far"]},
+        geometry=[
+            Polygon([(0, 0), (100, 0), (100, 100), (0, 100)]).exterior,
+            Polygon([(500, 500), (600, 500), (600, 600)]).exterior,
+        ],
+    )
+    expected = regions.overlay(
+        faces.buffer(5).to_frame(), how="difference", keep_geom_type=True
+    )
+    result = unenforced_lines(regions, faces, 5)
+    assert_geodataframe_equal(result, expected, check_less_precise=True)
+    assert result["name"].tolist() == ["near", "far"]
+
+
+def test_face_lengths():
+    geom = RasModel(BALDEAGLE_PRJ).current_geometry
+    faces = geom.hdf.mesh_cell_faces()
+    lengths, lines = [], []
+    for mesh_name in geom.hdf.mesh_area_names():
+        path = f"Geometry/2D Flow Areas/{mesh_name}"
+        arrays = [
+            geom.read_dataset(f"{path}/{name}")
+            for name in [
+                "Faces FacePoint Indexes",
+                "FacePoints Coordinate",
+                "Faces Perimeter Info",
+                "Faces Perimeter Values",
+            ]
+        ]
+        assert (arrays[2][:, 1] > 0).any()  # some faces are curved
+        lengths.append(face_lengths(*arrays))
+        lines.append(face_lines(np.arange(len(arrays[0])), *arrays))
+    np.testing.assert_allclose(np.concatenate(lengths), faces.length)
+    assert shapely.equals_exact(np.concatenate(lines), faces.geometry.values).all()
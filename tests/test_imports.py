@@ -0,0 +1,75 @@
+from rasqc.checkers import CHECKER_MODULES
+from rasqc.registry import CHECKSUITE_MODULES, CHECKSUITES
+import importlib
+import json
+import os
+import pytest
+import subprocess
+import sys
+
+# Seconds allowed for `import rasqc.cli`. Wall-clock time depends on the
+# machine and its load, so the budget is only checked when opted into by
+# setting this environment variable (e.g., on a dedicated benchmark runner)
+IMPORT_TIME_ENV = "RASQC_TEST_IMPORT_TIME"
+IMPORT_TIME_BUDGET = 1.0
+
+# Slow-to-import dependencies that should only be imported by the checks using them
+HEAVY_MODULES = [
+    "bs4",
+    "geopandas",
+    "h5py",
+    "hydrostab",
+    "jinja2",
+    "jsonschema",
+    "networkx",
+    "pandas",
+    "pyproj",
+    "pystac",
+    "rashdf",
+    "shapely",
+    "xarray",
+]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import rasqc.cli
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_cli() -> dict:
+    """Import the CLI in a fresh interpreter, returning its time and modules."""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_import_heavy_modules():
+    modules = _import_cli()["modules"]
+    assert [m for m in HEAVY_MODULES if m in modules] == []
+
+
+@pytest.mark.skipif(
+    not os.environ.get(IMPORT_TIME_ENV), reason=f"set {IMPORT_TIME_ENV}=1 to run"
+)
+def test_import_time():
+    assert _import_cli()["elapsed"] < IMPORT_TIME_BUDGET
+
+
+def test_checksuite_modules():
+    for module in CHECKER_MODULES:
+        importlib.import_module(f"rasqc.checkers.{module}")
+    for suite_name, modules in CHECKSUITE_MODULES.items():
+        registered = [
+            type(check).__module__.rsplit(".", 1)[-1]
+            for check in CHECKSUITES[suite_name].checks.values()
+        ]
+        assert sorted(set(registered)) == sorted(modules)
+        # checks are ordered by module as listed in the manifest
+        assert sorted(registered, key=modules.index) == registered
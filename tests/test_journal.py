@@ -0,0 +1,93 @@
+from pathlib import Path
+from rasqc.base_checker import RasqcChecker
+from rasqc.batch import check_model, journaled_reports
+from rasqc.checksuite import CheckSuite
+from rasqc.cli import batch_main
+from rasqc.journal import BatchJournal
+from rasqc.rasmodel import RasModel
+from rasqc.registry import CHECKSUITES
+from rasqc.result import RasqcResult, ResultStatus
+import pytest
+
+TEST_DATA = Path("./tests/data")
+MUNCIE_PRJ = str(TEST_DATA / "ras/Muncie.prj")
+
+
+class MockCountingChecker(RasqcChecker):
+    name = "Mock Counting Checker"
+    runs = 0
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        MockCountingChecker.runs += 1
+        return RasqcResult(
+            name=self.name,
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.WARNING,
+            message="counted",
+        )
+
+
+class MockDependentChecker(RasqcChecker):
+    name = "Mock Dependent Checker"
+    runs = 0
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        MockDependentChecker.runs += 1
+        return RasqcResult(
+            name=self.name,
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.OK,
+        )
+
+
+def test_BatchJournal(tmp_path):
+    journal = BatchJournal(tmp_path / "journal.sqlite")
+    result = RasqcResult(
+        name="Check", filename="a.prj", result=ResultStatus.ERROR, element=["x"]
+    )
+    journal.record_check("a.prj", "Check", [result])
+    journal.record_model("a.prj", None, 1.5, {"error": 1})
+    assert journal.completed_checks("a.prj") == {"Check": [result]}
+    assert journal.completed_models()["a.prj"]["counts"] == {"error": 1}
+    journal.record_settings({"checksuite": "ble"})
+    assert journal.settings() == {"checksuite": "ble"}
+    journal.clear()
+    assert journal.completed_models() == {}
+    assert journal.settings() == {}
+
+
+def test_batch_resume_other_checksuite(tmp_path, capsys):
+    journal = BatchJournal(tmp_path / "out.journal.sqlite")
+    journal.record_settings({"checksuite": "ble"})
+    journal.record_model(MUNCIE_PRJ, None, 1.0, {"ok": 1})
+    argv = [MUNCIE_PRJ, "--output", str(tmp_path / "out.jsonl"), "--resume"]
+    with pytest.raises(SystemExit) as exc:
+        batch_main(argv + ["--checksuite", "ffrd"])
+    assert exc.value.code == 2
+    assert "checksuite 'ble'" in capsys.readouterr().err
+    # the journal is left as it was
+    assert journal.settings() == {"checksuite": "ble"}
+    assert MUNCIE_PRJ in journal.completed_models()
+
+
+def test_check_model_resume(tmp_path):
+    suite = CheckSuite()
+    suite.add_check(MockCountingChecker())
+    suite.add_check(MockDependentChecker(), ["MockCountingChecker"])
+    CHECKSUITES["test_journal"] = suite
+    MockCountingChecker.runs = MockDependentChecker.runs = 0
+    journal = BatchJournal(tmp_path / "journal.sqlite")
+    try:
+        # a run interrupted after the first check completed
+        first = check_model(MUNCIE_PRJ, "test_journal", journal=journal)
+        journal.clear()
+        journal.record_check(MUNCIE_PRJ, "MockCountingChecker", first.results[:1])
+        report = check_model(MUNCIE_PRJ, "test_journal", journal=journal)
+    finally:
+        del CHECKSUITES["test_journal"]
+    assert MockCountingChecker.runs == 1
+    assert MockDependentChecker.runs == 2
+    assert report.results == first.results
+    (resumed,) = journaled_reports(journal)
+    assert resumed.results == first.results
+    assert resumed.counts == first.counts
@@ -0,0 +1,137 @@
+from pathlib import Path
+from rasqc.mesh import MeshArrays, MeshMetrics
+from rasqc.rasmodel import RasModel
+from geopandas.testing import assert_geodataframe_equal
+import dataclasses
+import numpy as np
+import pytest
+import shapely
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
+
+
+def test_MeshArrays():
+    geom = RasModel(BALDEAGLE_PRJ).current_geometry
+    meshes = geom.mesh_arrays()
+    assert list(meshes) == ["BaldEagleCr", "Upper 2D Area"]
+    mesh = meshes["BaldEagleCr"]
+    assert (mesh.n_cells, mesh.n_faces) == (3359, 7295)
+    assert mesh.cell_face_offsets.dtype == mesh.cell_faces.dtype == np.int32
+    assert mesh.cell_centers.dtype == np.float64
+    with pytest.raises(ValueError):
+        mesh.cell_centers[0] = 0
+    # shared through the geometry's products
+    assert geom.mesh_arrays()["BaldEagleCr"] is mesh
+
+    faces = geom.hdf.mesh_cell_faces()
+    cells = geom.hdf.mesh_cell_polygons()
+    selected = np.array([0, 5, 3000])
+    assert_geodataframe_equal(
+        mesh.faces_to_gdf(selected, faces.crs), faces.loc[selected]
+    )
+    assert_geodataframe_equal(
+        mesh.cells_to_gdf(selected, cells.crs), cells.loc[selected]
+    )
+
+
+def test_MeshArrays_cell_contains_center():
+    geom = RasModel(BALDEAGLE_PRJ).current_geometry
+    mesh = geom.mesh_arrays()["BaldEagleCr"]
+    assert mesh.cell_contains_center().all()
+    centers = mesh.cell_centers.copy()
+    # swapped center points are not contained, though each cell contains a point
+    centers[[10, 20]] = centers[[20, 10]]
+    centers[30] = [0, 0]
+    # a center on the cell boundary is contained
+    centers[40] = mesh.facepoint_coords[
+        mesh.face_facepoints[mesh.cell_faces[mesh.cell_face_offsets[40]], 0]
+    ]
+    mesh = dataclasses.replace(mesh, cell_centers=centers)
+    assert np.flatnonzero(~mesh.cell_contains_center()).tolist() == [10, 20, 30]
+
+
+def synthetic_mesh() -> MeshArrays:
+    # 4x1 rectangle, unit square and right triangle:
+    #  6
+    #  | \
+    #  5---------4---3
+    #  |         |   |
+    #  0---------1---2
+    return MeshArrays(
+        mesh_name="Test",
+        facepoint_coords=np.array(
+            [[0, 0], [4, 0], [5, 0], [5, 1], [4, 1], [0, 1], [4, 2]], dtype=float
+        ),
+        face_facepoints=np.array(
+            [[0, 1], [1, 4], [4, 5], [5, 0], [1, 2], [2, 3], [3, 4], [3, 6], [6, 4]]
+        ),
+        # the face from 4 to 5 has an intermediate point
+        face_perimeter_info=np.array([[0, 0]] * 2 + [[0, 1]] + [[0, 0]] * 6),
+        face_perimeter_values=np.array([[2.0, 1.0]]),
+        face_cells=np.array(
+            [[0, 3], [0, 1], [0, 3], [0, 3], [1, 3], [1, 3], [1, 2], [2, 3], [2, 3]]
+        ),
+        cell_face_offsets=np.array([0, 4, 8, 11], dtype=np.int32),
+        cell_faces=np.array([0, 1, 2, 3, 4, 5, 6, 1, 6, 7, 8], dtype=np.int32),
+        cell_centers=np.array([[2, 0.5], [4.5, 0.5], [4.25, 1.25]]),
+        perimeter=np.empty((0, 2)),
+    )
+
+
+def test_MeshArrays_metrics():
+    mesh = synthetic_mesh()
+    metrics = mesh.metrics()
+    np.testing.assert_allclose(metrics.cell_area, [4, 1, 0.5])
+    assert metrics.cell_face_count.tolist() == [4, 4, 3]
+    np.testing.assert_allclose(metrics.cell_aspect_ratio, [4, 1, np.sqrt(3)])
+    np.testing.assert_allclose(metrics.cell_area_ratio, [4, 4, 2])
+    np.testing.assert_allclose(metrics.cell_min_angle, [90, 90, 45])
+    np.testing.assert_allclose(metrics.cell_max_angle, [90, 90, 90])
+    np.testing.assert_allclose(metrics.face_length, mesh.face_lengths())
+
+
+def test_MeshArrays_metrics_cells_without_faces():
+    mesh = synthetic_mesh()
+    # insert cells without faces first, between and after the others
+    cell_ids = np.array([1, 3, 4, 6])  # new IDs of cells 0-2 and the ghost cell
+    mesh = dataclasses.replace(
+        mesh,
+        face_cells=cell_ids[mesh.face_cells],
+        cell_face_offsets=np.array([0, 0, 4, 4, 8, 11, 11], dtype=np.int32),
+        cell_centers=np.insert(mesh.cell_centers, [0, 1, 3], [0, 0], axis=0),
+    )
+    metrics = mesh.metrics()
+    assert metrics.cell_face_count.tolist() == [0, 4, 0, 4, 3, 0]
+    np.testing.assert_allclose(metrics.cell_area, [0, 4, 0, 1, 0.5, 0])
+    np.testing.assert_allclose(
+        metrics.cell_area_ratio, [np.nan, 4, np.nan, 4, 2, np.nan]
+    )
+    np.testing.assert_allclose(
+        metrics.cell_min_angle, [np.nan, 90, np.nan, 90, 45, np.nan]
+    )
+    np.testing.assert_allclose(
+        metrics.cell_max_angle, [np.nan, 90, np.nan, 90, 90, np.nan]
+    )
+    assert np.isnan(metrics.cell_aspect_ratio[[0, 2, 5]]).all()
+    assert mesh.cells_to_gdf([0, 1]).is_empty.tolist() == [True, False]
+
+
+def test_MeshMetrics():
+    geom = RasModel(BALDEAGLE_PRJ).current_geometry
+    all_metrics = geom.mesh_metrics()
+    assert list(all_metrics) == ["BaldEagleCr", "Upper 2D Area"]
+    metrics = all_metrics["BaldEagleCr"]
+    assert isinstance(metrics, MeshMetrics)
+    # shared through the geometry's products
+    assert geom.mesh_metrics()["BaldEagleCr"] is metrics
+
+    mesh = geom.mesh_arrays()["BaldEagleCr"]
+    polygons = mesh.cell_polygons(np.arange(mesh.n_cells))
+    np.testing.assert_allclose(metrics.cell_area, shapely.area(polygons))
+    assert metrics.cell_face_count.sum() == len(mesh.cell_faces)
+    assert (metrics.cell_aspect_ratio >= 1).all()
+    assert (metrics.cell_area_ratio >= 1).all()
+    # interior angles of convex cells
+    assert (metrics.cell_min_angle > 0).all()
+    assert (metrics.cell_max_angle < 180 + 1e-6).all()
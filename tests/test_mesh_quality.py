@@ -0,0 +1,67 @@
+from pathlib import Path
+from rasqc.rasmodel import RasModel
+from rasqc.result import ResultStatus
+from rasqc.checkers import mesh_quality
+from rasqc.checkers.mesh_quality import (
+    CellFaceCount,
+    CellSizeTransitions,
+    HighAspectRatioCells,
+    MeshMetricChecker,
+    SkewedCells,
+)
+import pytest
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
+
+
+def test_MeshMetricChecker_abstract():
+    with pytest.raises(TypeError):
+        MeshMetricChecker()
+
+
+def test_CellFaceCount(monkeypatch):
+    ras_model = RasModel(BALDEAGLE_PRJ)
+    result = CellFaceCount().run(ras_model)
+    assert result.result == ResultStatus.OK
+    assert result.message == "no cells with fewer than 3 or more than 8 faces found"
+    # exceeding the face limit is an error, unlike the heuristic checks
+    monkeypatch.setattr(mesh_quality, "MAX_CELL_FACES", 5)
+    result = CellFaceCount().run(ras_model)
+    assert result.result == ResultStatus.ERROR
+    assert (result.gdf["face_count"] > 5).all()
+
+
+def test_HighAspectRatioCells(monkeypatch):
+    ras_model = RasModel(BALDEAGLE_PRJ)
+    assert (
+        HighAspectRatioCells().run(ras_model).message
+        == "no cells with an aspect ratio over 4 found"
+    )
+    monkeypatch.setattr(mesh_quality, "MAX_CELL_ASPECT_RATIO", 2.5)
+    result = HighAspectRatioCells().run(ras_model)
+    assert result.result == ResultStatus.WARNING
+    assert result.message == "4 cells with an aspect ratio over 2.5 found"
+    assert (result.gdf["aspect_ratio"] > 2.5).all()
+
+
+def test_CellSizeTransitions():
+    result = CellSizeTransitions().run(RasModel(BALDEAGLE_PRJ))
+    assert result.result == ResultStatus.WARNING
+    assert result.message == "6 cells with an adjacent cell area ratio over 3 found"
+    assert result.gdf.columns.tolist() == [
+        "mesh_name",
+        "cell_id",
+        "area",
+        "area_ratio",
+        "geometry",
+    ]
+    assert (result.gdf["area_ratio"] > 3).all()
+    assert (result.gdf["mesh_name"] == "BaldEagleCr").all()
+
+
+def test_SkewedCells():
+    assert (
+        SkewedCells().run(RasModel(BALDEAGLE_PRJ)).message
+        == "no cells with face angles under 20 or over 180.1 degrees found"
+    )
@@ -0,0 +1,99 @@
+from pathlib import Path
+from rasqc.obstore_file import ObstoreFile, RemoteIOConfig, _coalesce
+from rasqc.rasmodel import RasModel
+from rashdf import RasGeomHdf
+import io
+import obstore
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
+BALDEAGLE_GEOM_HDF = TEST_DATA / "ras/BaldEagleDamBrk.g11.hdf"
+
+
+def _open(config: RemoteIOConfig = RemoteIOConfig()) -> ObstoreFile:
+    store = obstore.store.from_url(BALDEAGLE_GEOM_HDF.parent.resolve().as_uri())
+    return ObstoreFile(store, BALDEAGLE_GEOM_HDF.name, config=config)
+
+
+def test_coalesce():
+    assert _coalesce([0, 1, 2, 5, 6, 9], 8) == [(0, 2), (5, 6), (9, 9)]
+    assert _coalesce([0, 1, 2, 3, 4], 2) == [(0, 1), (2, 3), (4, 4)]
+
+
+def test_ObstoreFile_read():
+    expected = BALDEAGLE_GEOM_HDF.read_bytes()
+    f = _open(RemoteIOConfig(block_size=1000, readahead_blocks=2))
+    assert f.size == len(expected)
+    assert f.read(10) == expected[:10]
+    assert f.tell() == 10
+    f.seek(12345)
+    assert f.read(5000) == expected[12345:17345]
+    f.seek(-100, io.SEEK_END)
+    assert f.read() == expected[-100:]
+    assert f.read(10) == b""
+    assert f.read_range(1500, 2500) == expected[1500:2500]
+
+
+def test_ObstoreFile_cache():
+    f = _open(RemoteIOConfig(block_size=1000, readahead_blocks=3))
+    f.read(10)
+    assert f.requests == 1
+    assert f.bytes_fetched == 4000
+    f.seek(3000)
+    f.read(1000)  # satisfied by readahead
+    assert f.requests == 1
+    f.seek(10000)
+    f.read(20000)  # one coalesced range for all missing blocks
+    assert f.requests == 2
+
+
+def test_ObstoreFile_max_range_size():
+    f = _open(RemoteIOConfig(block_size=1000, readahead_blocks=0, max_range_size=4000))
+    f.read(10000)
+    assert f.requests == 3
+    assert f.bytes_fetched == 10000
+
+
+def test_ObstoreFile_hdf():
+    f = _open()
+    ghdf = RasGeomHdf(f)
+    assert ghdf.get_geom_attrs() == RasGeomHdf(BALDEAGLE_GEOM_HDF).get_geom_attrs()
+    ghdf.close()
+
+
+def test_RasModel_remote_hdf():
+    with RasModel(BALDEAGLE_PRJ.resolve().as_uri()) as rmf:
+        geom = rmf.geom_files["g11"]
+        assert geom.hdf.mesh_area_names() == ["BaldEagleCr", "Upper 2D Area"]
+        assert isinstance(geom._reader, ObstoreFile)
+        assert geom.hdf._loc.endswith("BaldEagleDamBrk.g11.hdf")
+    assert geom._reader is None
+
+
+def test_ObstoreFile_prefetch():
+    expected = BALDEAGLE_GEOM_HDF.read_bytes()
+    f = _open(RemoteIOConfig(block_size=1000, readahead_blocks=0))
+    f.prefetch([(0, 2500), (len(expected) - 10, len(expected) + 100)])
+    assert f.requests == 2
+    assert f.read_range(0, 3000) == expected[:3000]
+    assert f.requests == 2
+    f.prefetch([(0, 1000)])
+    assert f.requests == 2
+
+
+def test_RasModel_prefetch_metadata():
+    def _attr_requests(config: RemoteIOConfig) -> int:
+        with RasModel(BALDEAGLE_PRJ.resolve().as_uri(), remote_io=config) as rmf:
+            geom = rmf.geom_files["g11"]
+            geom.hdf.get_geom_attrs()
+            geom.hdf.mesh_area_names()
+            return geom.io_stats["requests"]
+
+    base = RemoteIOConfig(block_size=4096, readahead_blocks=0)
+    prefetch = RemoteIOConfig(
+        block_size=4096,
+        readahead_blocks=0,
+        prefetch_bytes=1024 * 1024,
+        prefetch_tail_bytes=64 * 1024,
+    )
+    assert _attr_requests(prefetch) < _attr_requests(base)
@@ -0,0 +1,76 @@
+from pathlib import Path
+from rasqc.products import CachedRasGeomHdf, CachedRasPlanHdf, ProductCache
+from rasqc.rasmodel import RasModel
+import pandas as pd
+from rashdf import RasPlanHdf
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
+MUNCIE_G02 = TEST_DATA / "ras/Muncie.g02.hdf"
+
+
+def test_ProductCache():
+    cache = ProductCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return pd.DataFrame({"a": [1, 2, 3]})
+
+    first = cache.get(("df",), compute)
+    first.loc[0, "a"] = 99  # callers get copies
+    second = cache.get(("df",), compute)
+    assert second["a"].tolist() == [1, 2, 3]
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.invalidate("df")
+    cache.get(("df",), compute)
+    assert len(calls) == 2
+
+
+def test_ProductCache_max_bytes():
+    cache = ProductCache(max_bytes=1000)
+    cache.get(("a",), lambda: b"x" * 400)
+    cache.get(("b",), lambda: b"x" * 400)
+    cache.get(("a",), lambda: b"y")  # mark "a" as recently used
+    cache.get(("c",), lambda: b"x" * 400)
+    assert cache.total_bytes <= 1000
+    assert cache.get(("a",), lambda: b"y") == b"x" * 400
+    assert cache.get(("b",), lambda: b"y") == b"y"  # evicted
+    cache.get(("big",), lambda: b"x" * 2000)
+    assert cache.get(("big",), lambda: b"y") == b"y"  # too large to cache
+
+
+def test_CachedRasGeomHdf():
+    with CachedRasGeomHdf(MUNCIE_G02) as ghdf:
+        faces = ghdf.mesh_cell_faces()
+        ghdf.mesh_cell_polygons()  # built from the cached faces
+        pd.testing.assert_frame_equal(ghdf.mesh_cell_faces(), faces)
+        assert ghdf.product_cache.hits >= 2
+        assert ghdf.refinement_regions().empty
+
+
+def test_CachedRasPlanHdf():
+    # the test data has no plan HDF file; the plan products without results
+    # are read from the geometry (mesh_cell_polygons always reads results)
+    assert CachedRasPlanHdf.mesh_cell_polygons.__wrapped__ is (
+        RasPlanHdf.mesh_cell_polygons
+    )
+    with CachedRasPlanHdf(MUNCIE_G02) as phdf:
+        for name in ["mesh_cell_faces", "mesh_cell_points", "bc_lines"]:
+            method = getattr(phdf, name)
+            first = method(include_output=False)
+            misses, hits = phdf.product_cache.misses, phdf.product_cache.hits
+            pd.testing.assert_frame_equal(method(include_output=False), first)
+            assert phdf.product_cache.misses == misses
+            assert phdf.product_cache.hits == hits + 1
+
+
+def test_GeomFile_products():
+    rmf = RasModel(BALDEAGLE_PRJ)
+    geom = rmf.geom_files["g11"]
+    attrs = geom.hdf.get_geom_attrs()
+    assert geom.hdf.get_geom_attrs() == attrs
+    assert geom.products.hits == 1
+    rmf.close()
+    assert geom.products.total_bytes == 0
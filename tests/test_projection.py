@@ -41,3 +41,10 @@ def test_GeomProjectionNote():
             "gdf": None,
         },
     }
+
+
+def test_FFRD_CRS():
+    from rasqc.checkers.projection import FFRD_CRS, ffrd_crs
+
+    assert FFRD_CRS == ffrd_crs()
+    assert "Albers" in FFRD_CRS.to_wkt()
@@ -0,0 +1,52 @@
+from pathlib import Path
+from rasqc.obstore_file import ObstoreFile, RemoteIOConfig
+from rasqc.range_cache import RangeCache
+import obstore
+import os
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_GEOM_HDF = TEST_DATA / "ras/BaldEagleDamBrk.g11.hdf"
+
+
+def test_RangeCache(tmp_path):
+    cache = RangeCache(tmp_path)
+    assert cache.get("s3://bucket/a.hdf", "etag1", 0, 4) is None
+    cache.put("s3://bucket/a.hdf", "etag1", 0, 4, b"abcd")
+    assert cache.get("s3://bucket/a.hdf", "etag1", 0, 4) == b"abcd"
+    assert cache.get("s3://bucket/a.hdf", "etag2", 0, 4) is None
+    assert cache.get("s3://bucket/a.hdf", "etag1", 0, 5) is None
+    cache.clear()
+    assert cache.get("s3://bucket/a.hdf", "etag1", 0, 4) is None
+
+
+def test_RangeCache_eviction(tmp_path):
+    cache = RangeCache(tmp_path, max_bytes=250)
+    for i in range(2):
+        cache.put("url", "v", i * 100, (i + 1) * 100, bytes(100))
+        entry = cache._entry_path("url", "v", i * 100, (i + 1) * 100)
+        os.utime(entry, (i, i))
+    assert cache.get("url", "v", 0, 100) is not None  # now most recently used
+    cache.put("url", "v", 200, 300, bytes(100))
+    assert cache.get("url", "v", 0, 100) is not None
+    assert cache.get("url", "v", 100, 200) is None
+    assert cache.get("url", "v", 200, 300) is not None
+    assert cache._scan_total() <= 250
+
+
+def test_ObstoreFile_range_cache(tmp_path):
+    expected = BALDEAGLE_GEOM_HDF.read_bytes()
+    store = obstore.store.from_url(BALDEAGLE_GEOM_HDF.parent.resolve().as_uri())
+    config = RemoteIOConfig(block_size=1000, cache_dir=tmp_path)
+
+    def _open():
+        return ObstoreFile(
+            store, BALDEAGLE_GEOM_HDF.name, config=config, url="url", version="v1"
+        )
+
+    f = _open()
+    assert f.read_range(5000, 9000) == expected[5000:9000]
+    assert f.requests == 1
+    g = _open()
+    assert g.read_range(5000, 9000) == expected[5000:9000]
+    assert g.requests == 0
+    assert g.cache_hits > 0
@@ -1,5 +1,7 @@
 from pathlib import Path
 from rasqc.rasmodel import RasModel, RasModelFile
+import asyncio
+import obstore
 import re
 
 TEST_DATA = Path("./tests/data")
@@ -56,3 +58,81 @@ def test_RasModel():
     ]
     assert rmf.current_geometry.path.name == "BaldEagleDamBrk.g11"
     assert rmf.current_unsteady.path.name == "BaldEagleDamBrk.u10"
+
+
+def test_RasModel_lazy_hdf():
+    rmf = RasModel(BALDEAGLE_PRJ)
+    geom = rmf.geom_files["g11"]
+    assert all(not x._hdf_opened for x in [*rmf.geometries, *rmf.plans])
+    hdf = geom.hdf
+    assert hdf is not None
+    assert geom.hdf is hdf
+    assert not rmf.geom_files["g06"]._hdf_opened
+    assert rmf.geom_files["g06"].hdf is None
+    rmf.close()
+    assert not geom._hdf_opened
+    assert not hdf
+
+
+def test_RasModel_context_manager():
+    with RasModel(BALDEAGLE_PRJ) as rmf:
+        hdf = rmf.current_geometry.hdf
+        assert hdf
+    assert not hdf
+
+
+def test_RasModel_open_async():
+    url = BALDEAGLE_PRJ.resolve().as_uri()
+    rmf = asyncio.run(RasModel.open_async(url, max_concurrency=2))
+    local = RasModel(BALDEAGLE_PRJ)
+    assert not rmf.prj_file.local
+    assert rmf.title == local.title
+    assert rmf.plan_titles == local.plan_titles
+    assert rmf.unsteady_titles == local.unsteady_titles
+    assert rmf.geometry_titles == local.geometry_titles
+    assert rmf.current_geometry.content == local.current_geometry.content
+
+
+def test_RasModel_open_local():
+    rmf = RasModel.open(BALDEAGLE_PRJ)
+    assert rmf.prj_file.local
+    assert rmf.current_plan.path.suffix == ".p18"
+
+
+def test_RasModel_remote_listing(monkeypatch):
+    def _no_head(*args, **kwargs):
+        raise AssertionError("unexpected HEAD request")
+
+    monkeypatch.setattr(obstore, "head", _no_head)
+    rmf = RasModel(BALDEAGLE_PRJ.resolve().as_uri())
+    assert rmf.listing is not None
+    assert rmf.geom_files["g11"].listing is rmf.listing
+    assert rmf.geom_files["g11"].hdf_meta["size"] == (
+        BALDEAGLE_PRJ.with_suffix(".g11.hdf").stat().st_size
+    )
+    assert rmf.geom_files["g11"].meta["path"] == "BaldEagleDamBrk.g11"
+    assert rmf.geom_files["g06"].hdf_meta is None
+    assert rmf.geom_files["g06"].hdf is None
+    assert rmf.geom_files["g11"].hdf is not None
+    rmf.close()
+
+
+def test_RasModel_unlistable_store(monkeypatch):
+    # e.g. an HTTP server without WebDAV rejects the PROPFIND used for listing
+    def _no_list(*args, **kwargs):
+        raise obstore.exceptions.GenericError("PROPFIND not allowed")
+
+    async def _no_list_async(*args, **kwargs):
+        _no_list()
+
+    monkeypatch.setattr(obstore, "list_with_delimiter", _no_list)
+    monkeypatch.setattr(obstore, "list_with_delimiter_async", _no_list_async)
+    url = BALDEAGLE_PRJ.resolve().as_uri()
+    for rmf in (RasModel(url), asyncio.run(RasModel.open_async(url))):
+        assert rmf.listing is None
+        assert rmf.geom_files["g11"].hdf_meta["size"] == (
+            BALDEAGLE_PRJ.with_suffix(".g11.hdf").stat().st_size
+        )
+        assert rmf.geom_files["g06"].hdf_meta is None
+        assert rmf.geom_files["g11"].hdf is not None
+        rmf.close()
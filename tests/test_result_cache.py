@@ -0,0 +1,80 @@
+from pathlib import Path
+from rasqc.checksuite import CheckSuite
+from rasqc.rasmodel import RasModel, track_file_access
+from rasqc.result import RasqcResult, ResultStatus
+from rasqc.result_cache import ResultCache
+from rasqc.base_checker import RasqcChecker
+import os
+import shutil
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
+
+
+class MockGeomTitleChecker(RasqcChecker):
+    name = "Mock Geometry Title Checker"
+    runs = 0
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        MockGeomTitleChecker.runs += 1
+        return RasqcResult(
+            name=self.name,
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.OK,
+            message=ras_model.geom_files["g11"].title,
+        )
+
+
+class MockPlanTitleChecker(RasqcChecker):
+    name = "Mock Plan Title Checker"
+    runs = 0
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        MockPlanTitleChecker.runs += 1
+        return RasqcResult(
+            name=self.name,
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.OK,
+            message=ras_model.current_plan.title,
+        )
+
+
+def test_track_file_access():
+    rmf = RasModel(BALDEAGLE_PRJ)
+    geom = rmf.geom_files["g11"]
+    with track_file_access() as accessed:
+        geom.title
+        geom.hdf.get_geom_attrs()
+    assert accessed == {("content", geom.filename), ("hdf", geom.filename)}
+    rmf.close()
+
+
+def test_ResultCache(tmp_path):
+    model_dir = tmp_path / "model"
+    shutil.copytree(BALDEAGLE_PRJ.parent, model_dir)
+    prj = model_dir / BALDEAGLE_PRJ.name
+    suite = CheckSuite()
+    suite.add_check(MockGeomTitleChecker())
+    suite.add_check(MockPlanTitleChecker())
+    MockGeomTitleChecker.runs = MockPlanTitleChecker.runs = 0
+
+    cache = ResultCache(tmp_path / "cache")
+    first = suite.run_checks(prj, result_cache=cache)
+    assert cache.reused == set()
+
+    cache = ResultCache(tmp_path / "cache")
+    second = suite.run_checks(prj, result_cache=cache)
+    assert cache.reused == {"MockGeomTitleChecker", "MockPlanTitleChecker"}
+    assert [r.message for r in second] == [r.message for r in first]
+    assert MockGeomTitleChecker.runs == MockPlanTitleChecker.runs == 1
+
+    # only the check that read the modified file is re-run
+    geom_path = model_dir / "BaldEagleDamBrk.g11"
+    geom_path.write_text(geom_path.read_text() + "\n")
+    stat = geom_path.stat()
+    os.utime(geom_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache = ResultCache(tmp_path / "cache")
+    suite.run_checks(prj, result_cache=cache)
+    assert cache.reused == {"MockPlanTitleChecker"}
+    assert MockGeomTitleChecker.runs == 2
+    assert MockPlanTitleChecker.runs == 1
@@ -0,0 +1,109 @@
+from rasqc import schemas
+from rasqc.constants import RAS_SCHEMA_URL
+from rasqc.obstore_file import RemoteIOConfig
+from rasqc.schemas import (
+    RAS_SCHEMA_ENV,
+    load_schema,
+    read_bundled_schema,
+    read_cached_schema,
+    schema_cache_dir,
+)
+import io
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+SCHEMA_URL = "https://example.com/schema.json"
+
+
+class MockResponse(io.BytesIO):
+    def __init__(self, body: bytes, etag: str):
+        super().__init__(body)
+        self.headers = {"ETag": etag}
+
+
+class MockServer:
+    def __init__(self, schema: dict, etag: str = '"v1"'):
+        self.schema = schema
+        self.etag = etag
+        self.requests = []
+        self.online = True
+
+    def urlopen(self, request, timeout=None):
+        self.requests.append(request.get_header("If-none-match"))
+        if not self.online:
+            raise urllib.error.URLError("unreachable")
+        if request.get_header("If-none-match") == self.etag:
+            raise urllib.error.HTTPError(request.full_url, 304, "", {}, None)
+        return MockResponse(json.dumps(self.schema).encode(), self.etag)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = MockServer({"version": 1})
+    monkeypatch.setattr(urllib.request, "urlopen", server.urlopen)
+    return server
+
+
+def test_read_cached_schema(tmp_path, server):
+    assert read_cached_schema(SCHEMA_URL, tmp_path, ttl=60) == {"version": 1}
+    # fresh cached copy is used without a request
+    assert read_cached_schema(SCHEMA_URL, tmp_path, ttl=60) == {"version": 1}
+    assert server.requests == [None]
+
+    # stale copy is revalidated with its ETag
+    assert read_cached_schema(SCHEMA_URL, tmp_path, ttl=0) == {"version": 1}
+    assert server.requests == [None, '"v1"']
+
+    server.schema, server.etag = {"version": 2}, '"v2"'
+    assert read_cached_schema(SCHEMA_URL, tmp_path, ttl=0) == {"version": 2}
+
+    # stale copy is used when the schema cannot be fetched
+    server.online = False
+    assert read_cached_schema(SCHEMA_URL, tmp_path, ttl=0) == {"version": 2}
+    assert read_cached_schema(SCHEMA_URL, tmp_path / "empty", ttl=0) is None
+
+    # offline, only the cache is used
+    n_requests = len(server.requests)
+    assert read_cached_schema(SCHEMA_URL, tmp_path, ttl=0, offline=True) == {
+        "version": 2
+    }
+    assert read_cached_schema(SCHEMA_URL, tmp_path / "empty", offline=True) is None
+    assert len(server.requests) == n_requests
+
+
+def test_load_schema(tmp_path, monkeypatch, server):
+    monkeypatch.setenv(schemas.CACHE_DIR_ENV, str(tmp_path / "cache"))
+    assert load_schema(RAS_SCHEMA_URL, "naming-schema.json", RAS_SCHEMA_ENV) == {
+        "version": 1
+    }
+
+    # explicit path takes precedence
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps({"version": "local"}))
+    monkeypatch.setenv(RAS_SCHEMA_ENV, str(path))
+    assert load_schema(RAS_SCHEMA_URL, "naming-schema.json", RAS_SCHEMA_ENV) == {
+        "version": "local"
+    }
+
+    # without a cached copy or network, the bundled copy is used
+    monkeypatch.delenv(RAS_SCHEMA_ENV)
+    monkeypatch.setenv(schemas.CACHE_DIR_ENV, str(tmp_path / "empty"))
+    server.online = False
+    assert load_schema(
+        RAS_SCHEMA_URL, "naming-schema.json", RAS_SCHEMA_ENV
+    ) == read_bundled_schema("naming-schema.json")
+
+
+def test_schema_cache_dir_range_cache(tmp_path, monkeypatch, server):
+    monkeypatch.setenv(schemas.CACHE_DIR_ENV, str(tmp_path))
+    assert read_cached_schema(SCHEMA_URL, ttl=60) == {"version": 1}
+    # cached schemas are neither evicted nor cleared with the range cache
+    cache = RemoteIOConfig(cache_max_bytes=100).range_cache()
+    cache.put("url", "v1", 0, 200, bytes(200))
+    cache.clear()
+    server.online = False
+    assert read_cached_schema(SCHEMA_URL, ttl=0) == {"version": 1}
+    assert any(schema_cache_dir().iterdir())
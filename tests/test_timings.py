@@ -0,0 +1,87 @@
+from pathlib import Path
+from rasqc.checksuite import CheckSuite
+from rasqc.timings import CheckTimer
+from rasqc.rasmodel import RasModel
+from rasqc.result import RasqcResult, ResultStatus
+from rasqc.base_checker import RasqcChecker
+from rich.console import Console
+import pstats
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
+
+
+class MockAllocatingChecker(RasqcChecker):
+    name = "Mock Allocating Checker"
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        data = [bytes(1024) for _ in range(1024)]
+        return RasqcResult(
+            name=self.name,
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.OK,
+            message=str(len(data)),
+        )
+
+
+class MockGeomChecker(RasqcChecker):
+    name = "Mock Geometry Checker"
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        ras_model.geom_files["g11"].hdf.get_geom_attrs()
+        return RasqcResult(
+            name=self.name,
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.OK,
+        )
+
+
+def test_CheckTimer():
+    suite = CheckSuite()
+    suite.add_check(MockAllocatingChecker())
+    suite.add_check(MockGeomChecker())
+    timer = CheckTimer()
+    suite.run_checks(BALDEAGLE_PRJ, jobs=2, timer=timer)
+    assert set(timer.timings) == {"MockAllocatingChecker", "MockGeomChecker"}
+    timing = timer.timings["MockAllocatingChecker"]
+    assert timing.wall_seconds >= timing.cpu_seconds > 0
+    assert timing.peak_memory_bytes >= 1024 * 1024
+    assert timing.profile_path is None
+    console = Console(record=True, width=120)
+    timer.print_summary(console)
+    assert "MockAllocatingChecker" in console.export_text()
+
+
+def test_CheckTimer_trace_memory():
+    suite = CheckSuite()
+    suite.add_check(MockAllocatingChecker())
+    assert CheckTimer().serial
+    timer = CheckTimer(trace_memory=False)
+    assert not timer.serial
+    suite.run_checks(BALDEAGLE_PRJ, jobs=2, timer=timer)
+    timing = timer.timings["MockAllocatingChecker"]
+    assert timing.peak_memory_bytes is None
+    assert timing.wall_seconds > 0
+    console = Console(record=True, width=120)
+    timer.print_summary(console)
+    assert "MockAllocatingChecker" in console.export_text()
+
+
+def test_CheckTimer_remote_io():
+    suite = CheckSuite()
+    suite.add_check(MockGeomChecker())
+    timer = CheckTimer()
+    suite.run_checks(BALDEAGLE_PRJ.resolve().as_uri(), timer=timer)
+    timing = timer.timings["MockGeomChecker"]
+    assert timing.requests > 0
+    assert timing.bytes_fetched > 0
+
+
+def test_CheckTimer_profile(tmp_path):
+    suite = CheckSuite()
+    suite.add_check(MockAllocatingChecker())
+    timer = CheckTimer(tmp_path)
+    suite.run_checks(BALDEAGLE_PRJ, jobs=4, timer=timer)
+    profile_path = timer.timings["MockAllocatingChecker"].profile_path
+    assert Path(profile_path) == tmp_path / "MockAllocatingChecker.pstats"
+    assert pstats.Stats(profile_path).total_calls > 0
@@ -0,0 +1,51 @@
+from pathlib import Path
+from rasqc.checksuite import CheckSuite
+from rasqc.rasmodel import RasModel
+from rasqc.result import RasqcResult, ResultStatus
+from rasqc.base_checker import RasqcChecker
+from rasqc.tracing import get_tracer, span, start_tracing, stop_tracing
+import json
+
+TEST_DATA = Path("./tests/data")
+BALDEAGLE_PRJ = TEST_DATA / "ras/BaldEagleDamBrk.prj"
+
+
+class MockGeomChecker(RasqcChecker):
+    name = "Mock Geometry Checker"
+
+    def run(self, ras_model: RasModel) -> RasqcResult:
+        ras_model.geom_files["g11"].hdf.get_geom_attrs()
+        return RasqcResult(
+            name=self.name,
+            filename=ras_model.prj_file.path.name,
+            result=ResultStatus.OK,
+        )
+
+
+def test_span_disabled():
+    assert get_tracer() is None
+    with span("nothing", "test"):
+        pass
+    assert get_tracer() is None
+
+
+def test_Tracer(tmp_path):
+    suite = CheckSuite()
+    suite.add_check(MockGeomChecker())
+    tracer = start_tracing()
+    try:
+        suite.run_checks(BALDEAGLE_PRJ, jobs=2)
+    finally:
+        assert stop_tracing() is tracer
+    tracer.save(tmp_path / "trace.json")
+    with open(tmp_path / "trace.json") as f:
+        events = json.load(f)["traceEvents"]
+    spans = {(e["cat"], e["name"]) for e in events if e["ph"] == "X"}
+    assert ("model", "RasModel.open") in spans
+    assert ("model", "RasModel.__init__") in spans
+    assert ("check", "MockGeomChecker") in spans
+    assert any(cat == "hdf" and name.endswith(".g11.hdf") for cat, name in spans)
+    assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+    for e in events:
+        if e["ph"] == "X":
+            assert e["dur"] >= 0
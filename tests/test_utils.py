@@ -0,0 +1,29 @@
+from rasqc.result import RasqcResult, ResultStatus
+from rasqc.utils import group_results, summarize_results
+
+RESULTS = [
+    RasqcResult(name="Passed", filename="a.g01", result=ResultStatus.OK),
+    RasqcResult(
+        name="Failed", filename="a.g01", result=ResultStatus.ERROR, element="x"
+    ),
+    RasqcResult(
+        name="Skipped",
+        filename="a.prj",
+        result=ResultStatus.SKIPPED,
+        message="Skipped because prerequisite check(s) failed: 'Failed'",
+    ),
+]
+
+
+def test_summarize_results():
+    assert summarize_results(RESULTS) == {
+        "passed": {"Passed": {"a.g01": ["N/A"]}},
+        "failed": {"Failed": {"a.g01": ["x"]}},
+        "skipped": {"Skipped": {"a.prj": ["N/A"]}},
+    }
+
+
+def test_group_results():
+    grouped = group_results(RESULTS)
+    assert list(grouped["check"]) == ["Passed", "Failed"]
+    assert grouped["skipped"] == {"Skipped": [RESULTS[2]]}
@@ -0,0 +1,55 @@
+from pathlib import Path
+from rasqc.batch import ModelReport
+from rasqc.work_queue import WorkQueue, run_worker
+import multiprocessing
+import time
+
+TEST_DATA = Path("./tests/data")
+MODELS = [
+    str(TEST_DATA / "ras/BaldEagleDamBrk.prj"),
+    str(TEST_DATA / "ras/Muncie.prj"),
+]
+
+
+def test_WorkQueue_leases(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite")
+    assert queue.enqueue(["a.prj", "b.prj"], "ble", max_attempts=2) == 2
+    assert queue.enqueue(["a.prj"], "ble") == 0
+
+    job = queue.lease("w1", lease_seconds=0.05)
+    assert (job.model, job.attempts) == ("a.prj", 1)
+    assert queue.lease("w2").model == "b.prj"
+    time.sleep(0.1)
+    # the expired lease is handed to another worker
+    retry = queue.lease("w2")
+    assert (retry.model, retry.attempts) == ("a.prj", 2)
+    assert not queue.renew(job, "w1")
+    queue.complete(job, "w1", ModelReport("a.prj"))  # lost lease; discarded
+    assert queue.counts()["leased"] == 2
+
+    queue.complete(retry, "w2", ModelReport("a.prj", error="boom"))
+    assert queue.counts() == {"pending": 0, "leased": 1, "done": 0, "failed": 1}
+    (report,) = queue.reports()
+    assert report.error == "boom"
+
+
+def test_run_worker_processes(tmp_path):
+    queue_path = tmp_path / "queue.sqlite"
+    WorkQueue(queue_path).enqueue(MODELS, "ble")
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(
+            target=run_worker, args=(queue_path,), kwargs={"poll_seconds": 0.1}
+        )
+        for _ in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=120)
+        assert worker.exitcode == 0
+    queue = WorkQueue(queue_path)
+    assert queue.counts()["done"] == 2
+    reports = list(queue.reports())
+    assert [r.model for r in reports] == MODELS
+    assert all(r.results and not r.failed for r in reports)